@@ -2,15 +2,17 @@ from __future__ import annotations
 
 from typing import Annotated, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.principal_cache import Principal, principal_cache
 from app.core.security import decode_access_token
-from app.crud.user import get_user_by_email
-from app.db.session import get_db
+from app.crud.aio.user import get_user_by_email
+from app.db.replica import consistency_keys, set_consistency_keys
+from app.db.session import AsyncReadSessionLocal, AsyncSessionLocal, get_async_db
 from app.schemas.user import TokenPayload
 
 
@@ -18,10 +20,14 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
 
-def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[Session, Depends(get_db)],
-):
+async def user_from_token(db: AsyncSession, token: str) -> Principal:
+    """
+    Resolve a bearer token to an active user's Principal, or raise 401.
+
+    Served from the principal cache when possible, in which case `db` is not
+    touched. Shared by the HTTP dependencies and the live-interview
+    WebSocket, which authenticates once per connection.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -36,16 +42,30 @@ def get_current_user(
     if token_data.sub is None:
         raise credentials_exception
 
-    user = get_user_by_email(db, email=token_data.sub)
+    principal = principal_cache.get(token_data.sub)
+    if principal is not None:
+        return principal
+
+    user = await get_user_by_email(db, email=token_data.sub)
     if user is None or not user.is_active:
         raise credentials_exception
 
-    return user
+    return principal_cache.put(Principal.from_user(user))
+
 
+async def get_current_user(
+    request: Request,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    request.state.user = await user_from_token(db, token)
+    return request.state.user
 
-def get_current_user_optional(
+
+async def get_current_user_optional(
+    request: Request,
     token: Annotated[Optional[str], Depends(oauth2_scheme_optional)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """
     Like get_current_user, but returns None when the Authorization header is missing.
@@ -55,24 +75,46 @@ def get_current_user_optional(
     if not token:
         return None
 
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    request.state.user = await user_from_token(db, token)
+    return request.state.user
 
-    try:
-        payload = decode_access_token(token)
-        token_data = TokenPayload(**payload)
-    except (JWTError, ValueError):
-        raise credentials_exception
 
-    if token_data.sub is None:
-        raise credentials_exception
+def _request_consistency_keys(request: Request) -> list[str]:
+    user = getattr(request.state, "user", None)
+    interview_id = request.path_params.get("interview_id")
+    return consistency_keys(
+        user_id=user.id if user is not None else None,
+        interview_id=int(interview_id) if interview_id is not None else None,
+    )
 
-    user = get_user_by_email(db, email=token_data.sub)
-    if user is None or not user.is_active:
-        raise credentials_exception
 
-    return user
+async def get_read_db(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """
+    Async session for read-only handlers (analytics, history, reports).
 
+    Without a read replica this is the request's session, shared with the
+    auth dependencies. With one, reads come from the replica except while the
+    request's user or `interview_id` has a recent write on the primary: the
+    keys are resolved at the first query, after the auth dependencies ran, so
+    a user always sees their own writes.
+    """
+    if AsyncReadSessionLocal is AsyncSessionLocal:
+        yield db
+        return
+    async with AsyncReadSessionLocal() as read_db:
+        set_consistency_keys(read_db, lambda: _request_consistency_keys(request))
+        yield read_db
+
+
+async def get_current_active_superuser(
+    current_user: Annotated[Principal, Depends(get_current_user)],
+) -> Principal:
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough privileges",
+        )
+    return current_user
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import get_current_active_superuser
+from app.core.config import settings
+from app.core.interview_import import InterviewImporter
+from app.core.principal_cache import Principal
+from app.core.report_export import EXPORT_MEDIA_TYPES, export_reports, parquet_available
+from app.schemas.interview_import import InterviewImportResult
+
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+SuperuserDep = Annotated[Principal, Depends(get_current_active_superuser)]
+
+
+@router.get("/reports/export")
+def export_cohort_reports(
+    _: SuperuserDep,
+    format: Literal["csv", "jsonl", "parquet"] = "csv",
+    status_filter: Annotated[Optional[str], Query(alias="status")] = None,
+    target_role: Optional[str] = None,
+    user_id: Optional[int] = None,
+    started_from: Optional[datetime] = None,
+    started_to: Optional[datetime] = None,
+) -> StreamingResponse:
+    """
+    Stream reports for every session matching the filters.
+
+    Persisted reports are reused; missing ones are generated on a bounded
+    worker pool. Memory use does not depend on the cohort size.
+    """
+    if format == "parquet" and not parquet_available():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Parquet export is not available on this server.",
+        )
+
+    body = export_reports(
+        fmt=format,
+        status=status_filter,
+        target_role=target_role,
+        user_id=user_id,
+        started_from=started_from,
+        started_to=started_to,
+    )
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="interview-reports.{format}"'},
+    )
+
+
+def _line_too_long(importer: InterviewImporter, max_line: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"An import line is longer than {max_line} bytes; "
+        f"{importer.result.sessions} sessions were imported before it",
+    )
+
+
+@router.post("/interviews/import", response_model=InterviewImportResult)
+async def import_interviews(
+    request: Request,
+    _: SuperuserDep,
+    batch_size: Annotated[Optional[int], Query(ge=1, le=10_000)] = None,
+) -> InterviewImportResult:
+    """
+    Import historical interviews from a JSONL body, one session with its full
+    transcript per line.
+
+    The body is consumed as a stream and written in batches of `batch_size`
+    sessions per transaction, so memory holds one batch at a time. Invalid
+    lines are skipped and listed in the result. A line longer than
+    INTERVIEW_IMPORT_MAX_LINE_BYTES stops the import with 413; batches
+    written before it stay imported.
+    """
+    importer = InterviewImporter(batch_size=batch_size)
+    max_line = settings.INTERVIEW_IMPORT_MAX_LINE_BYTES
+    buffered = b""
+    async for chunk in request.stream():
+        buffered += chunk
+        *lines, buffered = buffered.split(b"\n")
+        for line in lines:
+            if len(line) > max_line:
+                raise _line_too_long(importer, max_line)
+            if importer.add_line(line):
+                await run_in_threadpool(importer.flush)
+        if len(buffered) > max_line:
+            raise _line_too_long(importer, max_line)
+    importer.add_line(buffered)
+    await run_in_threadpool(importer.flush)
+    return importer.result
@@ -3,56 +3,75 @@ from __future__ import annotations
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_read_db
 from app.core.analytics import (
     build_interview_history,
     build_performance_trends,
     build_skill_progress,
 )
-from app.crud.interview import list_sessions_for_user
-from app.db.session import get_db
-from app.models.user import User
+from app.core.principal_cache import Principal
+from app.core.report_store import reports_for_sessions
+from app.core.skill_trends import build_skill_trends
+from app.crud.aio.interview import list_sessions_for_user
 from app.schemas.analytics import (
     InterviewHistoryResponse,
     PerformanceTrendsResponse,
     SkillProgressResponse,
+    SkillTrendsResponse,
 )
 
 
 router = APIRouter(prefix="/api/analytics", tags=["analytics"])
 
-DbSessionDep = Annotated[Session, Depends(get_db)]
-CurrentUserDep = Annotated[User, Depends(get_current_user)]
+ReadDbSessionDep = Annotated[AsyncSession, Depends(get_read_db)]
+CurrentUserDep = Annotated[Principal, Depends(get_current_user)]
 
 
 @router.get("/interviews/history", response_model=InterviewHistoryResponse)
-def get_interview_history(
-    db: DbSessionDep,
+async def get_interview_history(
+    db: ReadDbSessionDep,
     current_user: CurrentUserDep,
 ) -> InterviewHistoryResponse:
-    sessions = list_sessions_for_user(db, user_id=current_user.id)
-    items = build_interview_history(sessions, db=db)
+    sessions = await list_sessions_for_user(db, user_id=current_user.id)
+    items = build_interview_history(sessions)
     return InterviewHistoryResponse(items=items)
 
 
 @router.get("/skills/progress", response_model=SkillProgressResponse)
-def get_skill_progress(
-    db: DbSessionDep,
+async def get_skill_progress(
+    db: ReadDbSessionDep,
     current_user: CurrentUserDep,
 ) -> SkillProgressResponse:
-    sessions = list_sessions_for_user(db, user_id=current_user.id)
-    items = build_skill_progress(sessions, db=db)
+    sessions = await list_sessions_for_user(db, user_id=current_user.id)
+    reports = await reports_for_sessions(db, sessions)
+    items = build_skill_progress(sessions, reports=reports)
     return SkillProgressResponse(items=items)
 
 
 @router.get("/performance/trends", response_model=PerformanceTrendsResponse)
-def get_performance_trends(
-    db: DbSessionDep,
+async def get_performance_trends(
+    db: ReadDbSessionDep,
     current_user: CurrentUserDep,
 ) -> PerformanceTrendsResponse:
-    sessions = list_sessions_for_user(db, user_id=current_user.id)
-    points = build_performance_trends(sessions, db=db)
+    sessions = await list_sessions_for_user(db, user_id=current_user.id)
+    reports = await reports_for_sessions(db, sessions)
+    points = build_performance_trends(sessions, reports=reports)
     return PerformanceTrendsResponse(points=points)
 
+
+
+@router.get("/skills/trends", response_model=SkillTrendsResponse)
+async def get_skill_trends(
+    db: ReadDbSessionDep,
+    current_user: CurrentUserDep,
+) -> SkillTrendsResponse:
+    """
+    Rolling mean, EWMA, slope, volatility and cohort percentile per skill.
+
+    Computed from stored skill scores, i.e. from persisted reports only.
+    """
+    user_id = current_user.id
+    items = await db.run_sync(lambda sync_db: build_skill_trends(sync_db, user_id=user_id))
+    return SkillTrendsResponse(items=items)
@@ -3,37 +3,54 @@ from __future__ import annotations
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
+from app.core.password_hashing import PasswordHashingBusy
+from app.core.principal_cache import Principal
 from app.core.security import create_access_token
-from app.crud.user import authenticate_user, create_user, get_user_by_email
-from app.db.session import get_db
+from app.crud.aio.user import authenticate_user, create_user, get_user_by_email
+from app.db.session import get_async_db
+from app.models.user import User
 from app.schemas.user import Token, UserCreate, UserLogin, UserRead
 
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 
-DbSessionDep = Annotated[Session, Depends(get_db)]
+DbSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
+
+
+def _busy(exc: PasswordHashingBusy) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-ins right now, please retry shortly",
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
 
 @router.post("/signup", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def signup(user_in: UserCreate, db: DbSessionDep):
-    existing = get_user_by_email(db, email=user_in.email)
+async def signup(user_in: UserCreate, db: DbSessionDep):
+    existing = await get_user_by_email(db, email=user_in.email)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email is already registered",
         )
 
-    user = create_user(db, user_in=user_in)
+    try:
+        user = await create_user(db, user_in=user_in)
+    except PasswordHashingBusy as exc:
+        raise _busy(exc) from None
     return user
 
 
 @router.post("/login", response_model=Token)
-def login(user_in: UserLogin, db: DbSessionDep):
-    user = authenticate_user(db, email=user_in.email, password=user_in.password)
+async def login(user_in: UserLogin, db: DbSessionDep):
+    try:
+        user = await authenticate_user(db, email=user_in.email, password=user_in.password)
+    except PasswordHashingBusy as exc:
+        raise _busy(exc) from None
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -46,6 +63,10 @@ def login(user_in: UserLogin, db: DbSessionDep):
 
 
 @router.get("/me", response_model=UserRead)
-def read_me(current_user: Annotated[UserRead, Depends(get_current_user)]):
-    return current_user
+async def read_me(current_user: Annotated[Principal, Depends(get_current_user)], db: DbSessionDep):
+    # The dependency yields a (possibly cached) snapshot; the profile needs the full row.
+    user = await db.get(User, current_user.id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return user
 
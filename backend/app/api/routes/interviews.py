@@ -1,13 +1,23 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from typing import Annotated
 
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_read_db
 from app.core.interview_plan import generate_interview_plan
+from app.core.principal_cache import Principal
+from app.crud.aio.interview import search_turns
 from app.schemas.interview_plan import InterviewPlanRequest, InterviewPlanResponse
+from app.schemas.interview_search import TurnSearchHit, TurnSearchResponse
 
 
 router = APIRouter(prefix="/api/interviews", tags=["interviews"])
 
+ReadDbSessionDep = Annotated[AsyncSession, Depends(get_read_db)]
+CurrentUserDep = Annotated[Principal, Depends(get_current_user)]
+
 
 @router.post("/plan/generate", response_model=InterviewPlanResponse)
 def generate_plan(payload: InterviewPlanRequest) -> InterviewPlanResponse:
@@ -22,3 +32,33 @@ def generate_plan(payload: InterviewPlanRequest) -> InterviewPlanResponse:
         difficulty=payload.difficulty,
     )
 
+
+@router.get("/search", response_model=TurnSearchResponse)
+async def search_interviews(
+    db: ReadDbSessionDep,
+    current_user: CurrentUserDep,
+    q: Annotated[str, Query(min_length=2, max_length=200)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 20,
+    offset: Annotated[int, Query(ge=0, le=1000)] = 0,
+) -> TurnSearchResponse:
+    """
+    Questions and answers from the current user's interviews containing every
+    word of `q` (stemmed, so "idempotency" finds "idempotent"), best first.
+
+    Archived transcripts are included. Without the FTS5 index (non-SQLite
+    databases) results are substring matches over live turns, newest first.
+    """
+    rows = await search_turns(db, user_id=current_user.id, query=q, limit=limit + 1, offset=offset)
+    items = [
+        TurnSearchHit(
+            interview_id=row.session_id,
+            turn_index=row.turn_index,
+            role=row.role,
+            snippet=row.snippet,
+            score=row.score,
+            target_role=row.target_role,
+            started_at=row.started_at,
+        )
+        for row in rows[:limit]
+    ]
+    return TurnSearchResponse(query=q, items=items, next_offset=offset + limit if len(rows) > limit else None)
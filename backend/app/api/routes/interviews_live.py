@@ -2,62 +2,71 @@ from __future__ import annotations
 
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user_optional
-from app.core.live_interview import next_question_gemini, next_question_mock
-from app.crud.interview import (
-    add_turn,
+from app.api.deps import get_current_user_optional, user_from_token
+from app.core.live_interview import NextQuestion, next_question_gemini, next_question_mock
+from app.core.principal_cache import Principal
+from app.core.session_cache import (
+    ActiveSessionState,
+    PendingExchange,
+    WriteBehindUnavailable,
+    active_sessions,
+    new_session_state,
+    release_turns,
+    reserve_turns,
+    write_behind,
+)
+from app.core.turn_scoring import pending_scoring, submit_scoring
+from app.crud.aio.interview import (
     create_session,
     end_session,
     get_session,
-    list_turns,
-    set_question_index,
+    get_session_evaluations,
+    list_turns_after,
 )
-from app.db.session import get_db
-from app.models.user import User
+from app.db.session import AsyncSessionLocal, get_async_db, release_connection
 from app.schemas.live_interview import (
     LiveInterviewEndResponse,
+    LiveInterviewEvaluationsResponse,
+    LiveInterviewSocketMessage,
     LiveInterviewStartRequest,
     LiveInterviewStartResponse,
     LiveInterviewSubmitRequest,
     LiveInterviewSubmitResponse,
+    LiveInterviewTurn,
+    TurnEvaluationOut,
 )
 
 
 router = APIRouter(prefix="/api/interviews/live", tags=["interviews-live"])
 
-DbSessionDep = Annotated[Session, Depends(get_db)]
-OptionalUserDep = Annotated[Optional[User], Depends(get_current_user_optional)]
+DbSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
+OptionalUserDep = Annotated[Optional[Principal], Depends(get_current_user_optional)]
 
 
-@router.post("/start", response_model=LiveInterviewStartResponse, status_code=status.HTTP_201_CREATED)
-def start_live_interview(
-    payload: LiveInterviewStartRequest,
-    db: DbSessionDep,
-    user: OptionalUserDep,
-) -> LiveInterviewStartResponse:
-    session = create_session(
-        db,
-        user_id=user.id if user else None,
+def _first_question(payload: LiveInterviewStartRequest) -> NextQuestion:
+    # First question (no last answer yet)
+    return next_question_gemini(
         resume_text=payload.resume_text,
         target_role=payload.target_role,
         difficulty=payload.difficulty,
         personality_mode=payload.personality_mode,
-    )
-
-    # First question (no last answer yet)
-    nq = next_question_gemini(
-        resume_text=session.resume_text,
-        target_role=session.target_role,
-        difficulty=payload.difficulty,
-        personality_mode=payload.personality_mode,
         transcript=[],
         question_index=0,
         max_questions=payload.max_questions,
     ) or next_question_mock(
-        target_role=session.target_role,
+        target_role=payload.target_role,
         difficulty=payload.difficulty,
         personality_mode=payload.personality_mode,
         question_index=0,
@@ -65,84 +74,170 @@ def start_live_interview(
         max_questions=payload.max_questions,
     )
 
-    add_turn(db, session_id=session.id, role="assistant", content=nq.question, turn_index=0)
-    set_question_index(db, session, question_index=0)
+
+@router.post("/start", response_model=LiveInterviewStartResponse, status_code=status.HTTP_201_CREATED)
+async def start_live_interview(
+    payload: LiveInterviewStartRequest,
+    db: DbSessionDep,
+    user: OptionalUserDep,
+) -> LiveInterviewStartResponse:
+    # Question generation may block on a model call; the DB work stays on the loop.
+    # Do not hold the auth lookup's connection across it.
+    await release_connection(db)
+    nq = await run_in_threadpool(_first_question, payload)
+
+    session = await create_session(
+        db,
+        user_id=user.id if user else None,
+        resume_text=payload.resume_text,
+        target_role=payload.target_role,
+        difficulty=payload.difficulty,
+        personality_mode=payload.personality_mode,
+        first_question=nq.question,
+    )
+    await active_sessions.put_async(
+        new_session_state(session, resume_text=payload.resume_text, first_question=nq.question)
+    )
 
     return LiveInterviewStartResponse(id=session.id, first_question=nq.question, question_index=0)
 
 
-@router.post("/{id}/submit", response_model=LiveInterviewSubmitResponse)
-def submit_answer(
-    id: int,
-    payload: LiveInterviewSubmitRequest,
-    db: DbSessionDep,
-    user: OptionalUserDep,
-) -> LiveInterviewSubmitResponse:
-    session = get_session(db, session_id=id)
-    if not session:
+def _unavailable(exc: WriteBehindUnavailable) -> HTTPException:
+    # Nothing acknowledged is lost; the client retries the request.
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(exc),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def _active_state(db: AsyncSession, session_id: int, user: Optional[Principal]) -> ActiveSessionState:
+    # Served from the in-memory session state; the DB is only read on a cache miss.
+    try:
+        state = await active_sessions.get_or_load_async(db, session_id=session_id)
+    except WriteBehindUnavailable as exc:
+        raise _unavailable(exc) from None
+    if not state:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview session not found")
 
-    if session.status != "active":
+    if state.status != "active":
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Interview session has ended")
 
     # If session is bound to a user, enforce ownership
-    if session.user_id is not None and (not user or user.id != session.user_id):
+    if state.user_id is not None and (not user or user.id != state.user_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed")
 
-    turns = list_turns(db, session_id=session.id)
-    next_turn_index = len(turns)
-    add_turn(db, session_id=session.id, role="user", content=payload.answer, turn_index=next_turn_index)
+    return state
 
-    transcript = [{"role": t.role, "content": t.content} for t in turns] + [
-        {"role": "user", "content": payload.answer}
-    ]
 
-    # Generate next question
-    # Increment question index on non-follow-up. We'll detect follow-up from model/mock.
-    candidate_next_index = session.question_index + 1
-
-    nq = next_question_gemini(
-        resume_text=session.resume_text,
-        target_role=session.target_role,
-        difficulty=session.difficulty,  # stored as string but matches Difficulty literal
-        personality_mode=session.personality_mode,
-        transcript=transcript,
-        question_index=session.question_index,
-        max_questions=25,
-    )
+def _advance(state: ActiveSessionState, answer: str) -> LiveInterviewSubmitResponse:
+    """
+    Record an answer, produce the next question and queue both for persistence.
+
+    The answer is scored on the scoring pool while the next question is
+    generated, so evaluation adds nothing to the response time.
+    """
+    # One submit at a time per session, so turns cannot interleave.
+    with state.lock:
+        if state.status != "active":
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Interview session has ended")
+        try:
+            write_behind.admit()
+            # The answer and the next question; the database's counter hands
+            # out the indexes scoring, the buffered rows and replay all use.
+            answer_index = reserve_turns(state, 2)
+        except WriteBehindUnavailable as exc:
+            raise _unavailable(exc) from None
 
-    if nq is None:
-        nq = next_question_mock(
-            target_role=session.target_role,
-            difficulty=session.difficulty,  # type: ignore[arg-type]
-            personality_mode=session.personality_mode,  # type: ignore[arg-type]
-            question_index=session.question_index,
-            last_answer=payload.answer,
-            max_questions=25,
+        transcript = state.transcript() + [{"role": "user", "content": answer}]
+
+        scoring = submit_scoring(
+            session_id=state.id,
+            turn_index=answer_index,
+            question=state.last_question(),
+            answer=answer,
+            target_role=state.target_role,
         )
 
-    # Update question index: follow-ups do not increment; new questions do.
-    new_index = session.question_index if nq.is_follow_up else candidate_next_index
-    set_question_index(db, session, question_index=new_index)
+        # Generate next question
+        # Increment question index on non-follow-up. We'll detect follow-up from model/mock.
+        candidate_next_index = state.question_index + 1
+
+        try:
+            nq = next_question_gemini(
+                resume_text=state.resume_text,
+                target_role=state.target_role,
+                difficulty=state.difficulty,  # stored as string but matches Difficulty literal
+                personality_mode=state.personality_mode,
+                transcript=transcript,
+                question_index=state.question_index,
+                max_questions=25,
+                summary=state.summary,
+            )
+
+            if nq is None:
+                nq = next_question_mock(
+                    target_role=state.target_role,
+                    difficulty=state.difficulty,  # type: ignore[arg-type]
+                    personality_mode=state.personality_mode,  # type: ignore[arg-type]
+                    question_index=state.question_index,
+                    last_answer=answer,
+                    max_questions=25,
+                )
+        except Exception:
+            # The answer is not recorded; give its indexes back.
+            scoring.cancel()
+            release_turns(state, answer_index, 2)
+            raise
 
-    turns2 = list_turns(db, session_id=session.id)
-    add_turn(db, session_id=session.id, role="assistant", content=nq.question, turn_index=len(turns2))
+        # Update question index: follow-ups do not increment; new questions do.
+        new_index = state.question_index if nq.is_follow_up else candidate_next_index
+        state.append("user", answer, answer_index)
+        state.append("assistant", nq.question, answer_index + 1)
+        state.question_index = new_index
+
+        # Persisted by the write-behind queue (flushed on /end and on eviction).
+        write_behind.enqueue(
+            PendingExchange(
+                session_id=state.id,
+                turn_index=answer_index,
+                answer=answer,
+                question=nq.question,
+                question_index=new_index,
+                summary=state.summary,
+            )
+        )
 
     return LiveInterviewSubmitResponse(
-        id=session.id,
+        id=state.id,
         next_question=nq.question,
         question_index=new_index,
         is_follow_up=nq.is_follow_up,
     )
 
 
-@router.post("/{id}/end", response_model=LiveInterviewEndResponse)
-def end_live_interview(
-    id: int,
-    db: DbSessionDep,
-    user: OptionalUserDep,
-) -> LiveInterviewEndResponse:
-    session = get_session(db, session_id=id)
+def _close_state(state: ActiveSessionState) -> None:
+    # Wait for an in-flight submit, then refuse new ones.
+    with state.lock:
+        state.status = "ended"
+
+
+async def _end(db: AsyncSession, session_id: int, user: Optional[Principal]) -> LiveInterviewEndResponse:
+    state = active_sessions.get(session_id)
+    if state is not None:
+        if state.user_id is not None and (not user or user.id != state.user_id):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed")
+        # The lock can be held across a model call, so wait for it off the loop.
+        await run_in_threadpool(_close_state, state)
+
+    # Make every buffered turn durable before the session is closed; if that
+    # fails the state stays cached and /end can be retried.
+    try:
+        await active_sessions.evict_async(session_id)
+    except WriteBehindUnavailable as exc:
+        raise _unavailable(exc) from None
+
+    session = await get_session(db, session_id=session_id)
     if not session:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview session not found")
 
@@ -150,13 +245,173 @@ def end_live_interview(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed")
 
     if session.status != "ended":
-        session = end_session(db, session)
+        session = await end_session(db, session)
 
-    turns = list_turns(db, session_id=session.id)
     return LiveInterviewEndResponse(
         id=session.id,
         status=session.status,
-        total_turns=len(turns),
+        total_turns=session.turn_count,
         ended_at=session.ended_at.isoformat() if session.ended_at else None,
     )
 
+
+@router.post("/{id}/submit", response_model=LiveInterviewSubmitResponse)
+async def submit_answer(
+    id: int,
+    payload: LiveInterviewSubmitRequest,
+    db: DbSessionDep,
+    user: OptionalUserDep,
+) -> LiveInterviewSubmitResponse:
+    state = await _active_state(db, id, user)
+    await release_connection(db)
+    return await run_in_threadpool(_advance, state, payload.answer)
+
+
+@router.post("/{id}/end", response_model=LiveInterviewEndResponse)
+async def end_live_interview(
+    id: int,
+    db: DbSessionDep,
+    user: OptionalUserDep,
+) -> LiveInterviewEndResponse:
+    return await _end(db, id, user)
+
+
+@router.get("/{id}/evaluations", response_model=LiveInterviewEvaluationsResponse)
+async def list_evaluations(
+    id: int,
+    db: DbSessionDep,
+    user: OptionalUserDep,
+) -> LiveInterviewEvaluationsResponse:
+    """
+    Stored per-answer scores for a session, in turn order.
+
+    Answers still being scored are not waited for; `pending` says how many
+    there are.
+    """
+    found = await get_session_evaluations(db, session_id=id)
+    if found is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview session not found")
+
+    owner_id, evaluations = found
+    if owner_id is not None and (not user or user.id != owner_id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed")
+
+    return LiveInterviewEvaluationsResponse(
+        id=id,
+        evaluations=[TurnEvaluationOut.model_validate(e) for e in evaluations],
+        pending=pending_scoring(id),
+    )
+
+
+# -- WebSocket transport ------------------------------------------------------
+
+async def _replay(db: AsyncSession, state: ActiveSessionState, after_index: int) -> list[LiveInterviewTurn]:
+    """
+    Turns after `after_index`, from the prompt window when it covers them.
+    """
+    window = list(state.recent_turns)
+    if window and after_index + 1 >= window[0]["turn_index"]:
+        return [
+            LiveInterviewTurn(turn_index=t["turn_index"], role=t["role"], content=t["content"])
+            for t in window
+            if t["turn_index"] > after_index
+        ]
+    try:
+        await write_behind.flush_async(state.id)
+    except WriteBehindUnavailable as exc:
+        raise _unavailable(exc) from None
+    return [
+        LiveInterviewTurn(turn_index=t.turn_index, role=t.role, content=t.content)
+        for t in await list_turns_after(db, session_id=state.id, after_index=after_index)
+    ]
+
+
+@router.websocket("/{id}/ws")
+async def live_interview_socket(
+    websocket: WebSocket,
+    id: int,
+    token: Optional[str] = None,
+    last_turn_index: Optional[int] = None,
+) -> None:
+    """
+    Live interview over one persistent connection.
+
+    Authenticates once, from the `token` query parameter or a bearer
+    Authorization header. Client frames: {"type": "answer", "answer": "..."},
+    {"type": "end"} and {"type": "ping"}. Server frames: "session" on connect,
+    "replay" with the turns after `last_turn_index` when resuming, "question"
+    after each answer, "ended", "pong" and "error".
+    """
+    if token is None:
+        auth = websocket.headers.get("authorization", "")
+        if auth.lower().startswith("bearer "):
+            token = auth[7:].strip()
+
+    try:
+        async with AsyncSessionLocal() as db:
+            user = await user_from_token(db, token) if token else None
+            state = await _active_state(db, id, user)
+    except HTTPException as exc:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(exc.detail))
+        return
+
+    await websocket.accept()
+    await websocket.send_json(
+        {
+            "type": "session",
+            "id": state.id,
+            "status": state.status,
+            "question_index": state.question_index,
+            "turn_count": state.turn_count,
+            "current_question": state.last_question(),
+        }
+    )
+    if last_turn_index is not None:
+        try:
+            async with AsyncSessionLocal() as db:
+                turns = await _replay(db, state, last_turn_index)
+        except HTTPException as exc:
+            await websocket.send_json({"type": "error", "status": exc.status_code, "detail": exc.detail})
+        else:
+            await websocket.send_json({"type": "replay", "turns": [t.model_dump() for t in turns]})
+
+    try:
+        while True:
+            try:
+                message = LiveInterviewSocketMessage.model_validate(await websocket.receive_json())
+            except (ValidationError, ValueError) as exc:
+                await websocket.send_json({"type": "error", "detail": str(exc)})
+                continue
+
+            if message.type == "ping":
+                await websocket.send_json({"type": "pong"})
+                continue
+
+            try:
+                if message.type == "end":
+                    async with AsyncSessionLocal() as db:
+                        ended = await _end(db, id, user)
+                    await websocket.send_json({"type": "ended", **ended.model_dump()})
+                    await websocket.close()
+                    return
+
+                if not message.answer:
+                    await websocket.send_json({"type": "error", "detail": "answer is required"})
+                    continue
+
+                # Re-resolve each time: the cached state may have been evicted
+                # and reloaded since the connection opened.
+                state = active_sessions.get(id)
+                if state is None:
+                    async with AsyncSessionLocal() as db:
+                        state = await _active_state(db, id, user)
+                response = await run_in_threadpool(_advance, state, message.answer)
+            except HTTPException as exc:
+                await websocket.send_json({"type": "error", "status": exc.status_code, "detail": exc.detail})
+                continue
+
+            await websocket.send_json({"type": "question", **response.model_dump()})
+    except WebSocketDisconnect:
+        # Turns already submitted stay queued; the client can reconnect with
+        # ?last_turn_index= to resume.
+        return
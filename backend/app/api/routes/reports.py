@@ -3,31 +3,45 @@ from __future__ import annotations
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user_optional
-from app.core.report import generate_report
+from app.api.deps import get_current_user_optional, get_read_db
+from app.core.principal_cache import Principal
+from app.core.report_store import get_or_create_report_async
+from app.core.session_cache import WriteBehindUnavailable, write_behind
 from app.core.roadmap import generate_roadmap
-from app.crud.interview import get_session, list_turns
-from app.db.session import get_db
-from app.models.user import User
+from app.crud.aio.interview import get_session
 from app.schemas.report import InterviewReport
 from app.schemas.roadmap import CareerRoadmap
 
 
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
-DbSessionDep = Annotated[Session, Depends(get_db)]
-OptionalUserDep = Annotated[Optional[User], Depends(get_current_user_optional)]
+ReadDbSessionDep = Annotated[AsyncSession, Depends(get_read_db)]
+OptionalUserDep = Annotated[Optional[Principal], Depends(get_current_user_optional)]
+
+
+async def _flush_turns(interview_id: int) -> None:
+    # Reports read the transcript from the database.
+    try:
+        await write_behind.flush_async(interview_id)
+    except WriteBehindUnavailable as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": str(exc.retry_after)},
+        ) from None
 
 
 @router.get("/{interview_id}", response_model=InterviewReport)
-def get_interview_report(
+async def get_interview_report(
     interview_id: int,
-    db: DbSessionDep,
+    db: ReadDbSessionDep,
     user: OptionalUserDep,
 ) -> InterviewReport:
-    session = get_session(db, session_id=interview_id)
+    await _flush_turns(interview_id)
+    session = await get_session(db, session_id=interview_id)
     if not session:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview session not found")
 
@@ -35,44 +49,26 @@ def get_interview_report(
     if session.user_id is not None and (not user or user.id != session.user_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed")
 
-    turns = list_turns(db, session_id=session.id)
-    transcript = [{"role": t.role, "content": t.content} for t in turns]
-
-    return generate_report(
-        interview_id=session.id,
-        target_role=session.target_role,
-        difficulty=session.difficulty,
-        personality_mode=session.personality_mode,
-        transcript=transcript,
-    )
+    return await get_or_create_report_async(db, session)
 
 
 @router.get("/{interview_id}/roadmap", response_model=CareerRoadmap)
-def get_career_roadmap(
+async def get_career_roadmap(
     interview_id: int,
-    db: DbSessionDep,
+    db: ReadDbSessionDep,
     user: OptionalUserDep,
 ) -> CareerRoadmap:
     """
     Generate a personalized career roadmap using the interview report.
     """
-    session = get_session(db, session_id=interview_id)
+    await _flush_turns(interview_id)
+    session = await get_session(db, session_id=interview_id)
     if not session:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview session not found")
 
     if session.user_id is not None and (not user or user.id != session.user_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed")
 
-    turns = list_turns(db, session_id=session.id)
-    transcript = [{"role": t.role, "content": t.content} for t in turns]
-
-    report = generate_report(
-        interview_id=session.id,
-        target_role=session.target_role,
-        difficulty=session.difficulty,
-        personality_mode=session.personality_mode,
-        transcript=transcript,
-    )
-
-    return generate_roadmap(report)
+    report = await get_or_create_report_async(db, session)
+    return await run_in_threadpool(generate_roadmap, report)
 
@@ -6,21 +6,21 @@ from typing import Annotated
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
 from app.core.config import settings
-from app.crud.resume import create_resume
-from app.db.session import get_db
+from app.core.principal_cache import Principal
+from app.crud.aio.resume import create_resume
+from app.db.session import get_async_db
 from app.schemas.resume import ResumeRead
-from app.schemas.user import UserRead
 
 
 router = APIRouter(prefix="/api/resumes", tags=["resumes"])
 
 
-DbSessionDep = Annotated[Session, Depends(get_db)]
-CurrentUserDep = Annotated[UserRead, Depends(get_current_user)]
+DbSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
+CurrentUserDep = Annotated[Principal, Depends(get_current_user)]
 
 
 ALLOWED_CONTENT_TYPES = {
@@ -32,9 +32,9 @@ ALLOWED_CONTENT_TYPES = {
 
 @router.post("/upload", response_model=ResumeRead, status_code=status.HTTP_201_CREATED)
 async def upload_resume(
+    db: DbSessionDep,
+    current_user: CurrentUserDep,
     file: UploadFile = File(...),
-    db: DbSessionDep = Depends(),
-    current_user: CurrentUserDep = Depends(),
 ) -> ResumeRead:
     # Validate content type
     if file.content_type not in ALLOWED_CONTENT_TYPES:
@@ -77,7 +77,7 @@ async def upload_resume(
     finally:
         await file.close()
 
-    resume = create_resume(
+    resume = await create_resume(
         db,
         user_id=current_user.id,
         original_filename=original_name,
@@ -0,0 +1,163 @@
+"""
+Operational commands for the backend.
+
+Usage (from the backend directory):
+
+    python -m app.cli migrate
+    python -m app.cli export-reports --format jsonl --status ended -o cohort.jsonl
+    python -m app.cli import-interviews transcripts.jsonl
+    python -m app.cli archive-transcripts --older-than-days 90
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import datetime
+from typing import Optional, Sequence
+
+
+def _export_reports(args: argparse.Namespace) -> int:
+    from app.core.report_export import export_reports, parquet_available
+    from app.db.base import init_db
+
+    if args.format == "parquet" and not parquet_available():
+        print("Parquet export requires the 'pyarrow' package.", file=sys.stderr)
+        return 2
+
+    init_db()
+    chunks = export_reports(
+        fmt=args.format,
+        status=args.status,
+        target_role=args.target_role,
+        user_id=args.user_id,
+        started_from=args.started_from,
+        started_to=args.started_to,
+    )
+
+    if args.output == "-":
+        out = sys.stdout.buffer
+        for chunk in chunks:
+            out.write(chunk)
+        out.flush()
+    else:
+        with open(args.output, "wb") as out:
+            for chunk in chunks:
+                out.write(chunk)
+    return 0
+
+
+def _import_interviews(args: argparse.Namespace) -> int:
+    from app.core.interview_import import import_interviews
+    from app.db.base import init_db
+
+    init_db()
+    if args.input == "-":
+        result = import_interviews(sys.stdin.buffer, batch_size=args.batch_size)
+    else:
+        with open(args.input, "rb") as fh:
+            result = import_interviews(fh, batch_size=args.batch_size)
+
+    for error in result.errors:
+        print(f"line {error.line}: {error.detail}", file=sys.stderr)
+    print(f"Imported {result.sessions} sessions, {result.turns} turns; {result.failed_lines} lines failed.")
+    return 1 if result.failed_lines else 0
+
+
+def _archive_transcripts(args: argparse.Namespace) -> int:
+    from datetime import timedelta
+
+    from app.core.config import settings
+    from app.core.transcript_archive import archive_ended_transcripts
+    from app.core.transcript_codec import zstd_available
+    from app.db.base import init_db
+    from app.db.session import SessionLocal
+
+    codec = args.codec or settings.TRANSCRIPT_ARCHIVE_CODEC
+    if codec == "zstd" and not zstd_available():
+        print("The zstd codec requires the 'zstandard' package.", file=sys.stderr)
+        return 2
+
+    init_db()
+    days = settings.TRANSCRIPT_ARCHIVE_AFTER_DAYS if args.older_than_days is None else args.older_than_days
+    db = SessionLocal()
+    try:
+        archived = archive_ended_transcripts(
+            db,
+            older_than=timedelta(days=days),
+            batch_size=args.batch_size or settings.TRANSCRIPT_ARCHIVE_BATCH_SIZE,
+            codec=codec,
+        )
+    finally:
+        db.close()
+    print(f"Archived the transcripts of {archived} interviews ended more than {days:g} days ago.")
+    return 0
+
+
+def _migrate(args: argparse.Namespace) -> int:
+    from app.db.migrations import discover, migrate, pending_migrations
+    from app.db.session import engine
+
+    if args.list:
+        pending = {m.version for m in pending_migrations(engine)}
+        for m in discover():
+            print(f"{m.version:04d} {m.name:<40} {'pending' if m.version in pending else 'applied'}")
+        return 0
+
+    if args.check:
+        pending = pending_migrations(engine)
+        for m in pending:
+            print(f"pending: {m.version:04d} {m.name}")
+        return 1 if pending else 0
+
+    applied = migrate(engine, target=args.target)
+    for m in applied:
+        print(f"applied: {m.version:04d} {m.name}")
+    if not applied:
+        print("Schema is up to date.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate = commands.add_parser("migrate", help="Apply pending schema migrations.")
+    migrate.add_argument("--target", type=int, help="Stop after this version.")
+    migrate.add_argument("--check", action="store_true", help="Exit 1 if migrations are pending; apply nothing.")
+    migrate.add_argument("--list", action="store_true", help="List migrations and whether they are applied.")
+    migrate.set_defaults(handler=_migrate)
+
+    export = commands.add_parser("export-reports", help="Stream interview reports for a cohort.")
+    export.add_argument("--format", choices=["csv", "jsonl", "parquet"], default="csv")
+    export.add_argument("--status", help="Only sessions with this status (e.g. 'ended').")
+    export.add_argument("--target-role", help="Case-insensitive substring of the target role.")
+    export.add_argument("--user-id", type=int)
+    export.add_argument("--started-from", type=datetime.fromisoformat, help="ISO date/time, inclusive.")
+    export.add_argument("--started-to", type=datetime.fromisoformat, help="ISO date/time, exclusive.")
+    export.add_argument("-o", "--output", default="-", help="Output file ('-' for stdout).")
+    export.set_defaults(handler=_export_reports)
+
+    importer = commands.add_parser("import-interviews", help="Import sessions with transcripts from JSONL.")
+    importer.add_argument("input", help="JSONL file ('-' for stdin).")
+    importer.add_argument("--batch-size", type=int, help="Sessions written per transaction.")
+    importer.set_defaults(handler=_import_interviews)
+
+    archive = commands.add_parser(
+        "archive-transcripts", help="Move turns of long-ended interviews into the compressed archive."
+    )
+    archive.add_argument("--older-than-days", type=float, help="Only interviews ended longer ago than this.")
+    archive.add_argument("--batch-size", type=int, help="Sessions archived per transaction.")
+    archive.add_argument("--codec", choices=["zlib", "zstd"])
+    archive.set_defaults(handler=_archive_transcripts)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
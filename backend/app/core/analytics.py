@@ -2,11 +2,10 @@ from __future__ import annotations
 
 from collections import defaultdict
 from statistics import mean
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Mapping, Tuple
 
-from app.core.report import generate_report
-from app.crud.interview import list_turns
 from app.models.interview import InterviewSession
+from app.schemas.report import InterviewReport
 from app.schemas.analytics import (
     InterviewHistoryItem,
     PerformanceTrendPoint,
@@ -14,31 +13,24 @@ from app.schemas.analytics import (
 )
 
 
-def _session_report_pair(
-    session: InterviewSession,
-    *,
-    db,
-):
-    turns = list_turns(db, session_id=session.id)
-    transcript = [{"role": t.role, "content": t.content} for t in turns]
-    report = generate_report(
-        interview_id=session.id,
-        target_role=session.target_role,
-        difficulty=session.difficulty,
-        personality_mode=session.personality_mode,
-        transcript=transcript,
-    )
-    return session, turns, report
+def _session_report_pairs(
+    sessions: Iterable[InterviewSession],
+    reports: Mapping[int, InterviewReport],
+) -> List[Tuple[InterviewSession, InterviewReport]]:
+    """
+    (session, report) pairs in session order.
+
+    Sessions without a report (e.g. one that missed the fan-out deadline in
+    `reports_for_sessions`) are omitted.
+    """
+    return [(s, reports[s.id]) for s in sessions if s.id in reports]
 
 
 def build_interview_history(
     sessions: Iterable[InterviewSession],
-    *,
-    db,
 ) -> List[InterviewHistoryItem]:
     items: List[InterviewHistoryItem] = []
     for session in sessions:
-        turns = list_turns(db, session_id=session.id)
         items.append(
             InterviewHistoryItem(
                 id=session.id,
@@ -48,7 +40,7 @@ def build_interview_history(
                 status=session.status,
                 started_at=session.started_at,
                 ended_at=session.ended_at,
-                total_turns=len(turns),
+                total_turns=session.turn_count,
             )
         )
     return items
@@ -57,13 +49,12 @@ def build_interview_history(
 def build_skill_progress(
     sessions: Iterable[InterviewSession],
     *,
-    db,
+    reports: Mapping[int, InterviewReport],
 ) -> List[SkillProgressItem]:
     # Collect scores per skill across sessions
     skill_scores: dict[str, List[Tuple[int, float]]] = defaultdict(list)
 
-    for session in sessions:
-        _, _, report = _session_report_pair(session, db=db)
+    for session, report in _session_report_pairs(sessions, reports):
         for skill in report.skill_breakdown:
             skill_scores[skill.name].append((session.id, skill.score))
 
@@ -98,12 +89,11 @@ def build_skill_progress(
 def build_performance_trends(
     sessions: Iterable[InterviewSession],
     *,
-    db,
+    reports: Mapping[int, InterviewReport],
 ) -> List[PerformanceTrendPoint]:
     points: List[PerformanceTrendPoint] = []
 
-    for session in sessions:
-        _, _, report = _session_report_pair(session, db=db)
+    for session, report in _session_report_pairs(sessions, reports):
         if not report.skill_breakdown:
             continue
         avg_score = mean(s.score for s in report.skill_breakdown)
@@ -4,6 +4,15 @@ import json
 from typing import Any
 
 from app.core.config import settings
+from app.core.text_features import (
+    CONFIDENCE_MARKERS,
+    FILLERS,
+    HEDGES,
+    IMPACT_MARKERS,
+    QUESTION_PROMPTS,
+    REASONING_MARKERS,
+    extract_features,
+)
 from app.schemas.answer_evaluation import AnswerEvaluationMetrics, AnswerEvaluationResponse
 
 
@@ -31,30 +40,31 @@ def _extract_json(text: str) -> str:
 
 
 def _heuristic_evaluate(question: str, answer: str) -> AnswerEvaluationResponse:
-    a = (answer or "").strip()
-    q = (question or "").strip().lower()
+    a = extract_features(answer)
+    q = extract_features(question)
 
-    length = len(a)
-    sentences = max(1, a.count(".") + a.count("!") + a.count("?"))
+    length = a.chars
+    sentences = max(1, a.sentences)
 
     # Simple heuristics
     relevance = 80.0
-    if len(q) > 0 and any(w in q for w in ["why", "how", "design", "explain"]):
-        if "because" not in a.lower() and "so that" not in a.lower():
+    if q.has_any(QUESTION_PROMPTS):
+        if not a.has_any(REASONING_MARKERS):
             relevance -= 15.0
 
     depth = min(100.0, (length / 400.0) * 100.0)
-    if "impact" in a.lower() or "result" in a.lower():
+    if a.has_any(IMPACT_MARKERS):
         depth = min(100.0, depth + 10.0)
 
     clarity = 70.0 + min(20.0, sentences * 2.0)
-    if any(x in a for x in ["uh", "idk", "don't know"]):
+    # Fillers have always been matched case-sensitively ("Uh," does not count).
+    if a.has_any(FILLERS, match_case=True):
         clarity -= 10.0
 
     confidence = 70.0
-    if any(x in a.lower() for x in ["i think", "maybe", "not sure"]):
+    if a.has_any(HEDGES):
         confidence -= 15.0
-    if any(x in a.lower() for x in ["definitely", "confident", "certain"]):
+    if a.has_any(CONFIDENCE_MARKERS):
         confidence += 5.0
 
     # Clamp 0–100
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Dict
 
 from app.core.config import settings
+from app.core.text_features import SECTION_HEADINGS, extract_features
 
 
 try:  # Optional dependency for Gemini
@@ -30,7 +31,7 @@ def _mock_ats_score(resume_text: str, job_role: str) -> AtsScoreResult:
     """
     Deterministic fallback ATS scoring when Gemini is not configured.
     """
-    text_lower = resume_text.lower()
+    features = extract_features(resume_text)
     role_lower = job_role.lower()
 
     # Very simple keyword heuristic: count occurrences of role words in resume
@@ -38,14 +39,12 @@ def _mock_ats_score(resume_text: str, job_role: str) -> AtsScoreResult:
     if not role_keywords:
         keyword_score = 50.0
     else:
-        hits = sum(1 for kw in role_keywords if kw in text_lower)
+        hits = features.count_present(role_keywords)
         keyword_score = min(100.0, (hits / len(role_keywords)) * 100.0)
 
     # Simple formatting heuristic: presence of common resume sections + bullet points
-    sections = ["experience", "education", "skills", "projects", "summary"]
-    section_hits = sum(1 for s in sections if s in text_lower)
-    bullets = text_lower.count("•") + text_lower.count("- ")
-    formatting_score = min(100.0, section_hits * 15.0 + min(bullets, 10) * 3.0)
+    section_hits = features.count_present(SECTION_HEADINGS)
+    formatting_score = min(100.0, section_hits * 15.0 + min(features.bullets, 10) * 3.0)
 
     final_score = round((keyword_score * 0.6) + (formatting_score * 0.4), 2)
 
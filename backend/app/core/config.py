@@ -22,11 +22,32 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./app.db"
+    ASYNC_DATABASE_URL: str | None = None  # derived from DATABASE_URL when unset
+    DB_POOL_SIZE: int = 5  # connections kept open per engine
+    DB_MAX_OVERFLOW: int = 10  # extra connections allowed under load
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0  # wait for a free connection before failing
+    DB_POOL_PRE_PING: bool = False  # test connections on checkout (drops dead server connections)
+    DB_POOL_RECYCLE_SECONDS: int = -1  # reconnect connections older than this; -1 never
+
+    # Read replica for analytics, history and report reads; unset reads from DATABASE_URL
+    READ_DATABASE_URL: str | None = None
+    ASYNC_READ_DATABASE_URL: str | None = None  # derived from READ_DATABASE_URL when unset
+    READ_YOUR_WRITES_SECONDS: float = 10.0  # a user's reads stay on the primary this long after they write
+
+    # SQLite profile, applied to every new connection of a file database
+    SQLITE_WAL: bool = True  # journal_mode=WAL + synchronous=NORMAL: readers do not block on writers
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # wait this long for a lock instead of failing
+    SQLITE_MMAP_SIZE_BYTES: int = 256 * 1024 * 1024  # memory-mapped I/O; 0 disables
 
     # Security / Auth
     SECRET_KEY: str = "CHANGE_ME_SUPER_SECRET_KEY"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
     ALGORITHM: str = "HS256"
+    PASSWORD_HASH_WORKERS: int = 2  # threads dedicated to bcrypt; keep below the CPU count
+    PASSWORD_HASH_QUEUE_SIZE: int = 32  # calls allowed to wait for a worker; more get 503
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = 2.0  # calls queued longer are refused with 503
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0  # authenticated-user snapshots per process; 0 disables
+    PRINCIPAL_CACHE_SIZE: int = 10_000
 
     # File uploads / resumes
     RESUME_UPLOAD_DIR: str = "uploads/resumes"
@@ -36,6 +57,47 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: str | None = None
     GEMINI_MODEL: str = "models/gemini-1.5-pro"
 
+    # Live interviews: in-memory session state and buffered turn writes
+    ACTIVE_SESSION_CACHE_SIZE: int = 1024  # sessions kept hot per process
+    WRITE_BEHIND_FLUSH_INTERVAL_SECONDS: float = 0.5
+    WRITE_BEHIND_MAX_PENDING: int = 10_000  # buffered exchanges per process; further answers get 503
+    WRITE_BEHIND_RETRY_BACKOFF_SECONDS: float = 1.0  # first retry delay after a failed write, doubling
+    WRITE_BEHIND_RETRY_BACKOFF_MAX_SECONDS: float = 60.0
+    LIVE_TRANSCRIPT_WINDOW: int = 12  # turns sent verbatim in the question prompt
+    LIVE_SUMMARY_MAX_CHARS: int = 2000  # rolling summary of older turns
+    QUESTION_BANK_PATH: str | None = None  # defaults to app/data/question_bank.json
+    TURN_SCORING_WORKERS: int = 4  # threads scoring answers alongside question generation
+    REPORT_SCORING_WAIT_SECONDS: float = 10.0  # reports wait this long for in-flight scoring
+    SHUTDOWN_SCORING_WAIT_SECONDS: float = 20.0  # shutdown stops waiting for scoring after this
+
+    # Idle-session reaper: ends live interviews nobody has touched for a while
+    LIVE_SESSION_IDLE_TTL_SECONDS: int = 30 * 60
+    SESSION_REAPER_INTERVAL_SECONDS: float = 60.0  # 0 disables the reaper
+    SESSION_REAPER_BATCH_SIZE: int = 500  # sessions ended per UPDATE
+    SESSION_REAPER_GENERATE_REPORTS: bool = False  # build reports for reaped sessions
+
+    # Transcript archive: turns of long-ended interviews packed into one compressed row each
+    TRANSCRIPT_ARCHIVE_AFTER_DAYS: int = 30
+    TRANSCRIPT_ARCHIVE_INTERVAL_SECONDS: float = 3600.0  # 0 disables the background archiver
+    TRANSCRIPT_ARCHIVE_BATCH_SIZE: int = 100  # sessions archived per transaction
+    TRANSCRIPT_ARCHIVE_CODEC: str = "zlib"  # zlib|zstd (zstd needs the 'zstandard' package)
+
+    # Observability
+    METRICS_ENABLED: bool = True  # expose GET /metrics
+
+    # Bulk report export
+    REPORT_EXPORT_BATCH_SIZE: int = 100  # sessions fetched/encoded per batch
+    REPORT_EXPORT_WORKERS: int = 4  # threads generating missing reports
+
+    # Bulk interview import
+    INTERVIEW_IMPORT_BATCH_SIZE: int = 1000  # sessions written per transaction
+    INTERVIEW_IMPORT_MAX_LINE_BYTES: int = 8 * 1024 * 1024  # longer lines reject the upload with 413
+
+    # Analytics: concurrent generation of reports that are not persisted yet
+    REPORT_FANOUT_CONCURRENCY: int = 4  # process-wide cap on in-flight generations
+    REPORT_FANOUT_TIMEOUT_SECONDS: float = 20.0  # return partial results after this
+    REPORT_REQUEST_CONCURRENCY: int = 4  # separate cap for GET /api/reports/{id} generations
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
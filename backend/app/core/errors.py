@@ -22,6 +22,7 @@ async def http_exception_handler(
         content={
             "detail": exc.detail,
         },
+        headers=getattr(exc, "headers", None),
     )
 
 
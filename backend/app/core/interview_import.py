@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from typing import Callable, Iterable, Optional, Union
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.interview import bulk_insert_sessions, bulk_insert_turns
+from app.crud.resume import get_or_create_resume_texts, resume_text_hash
+from app.db.session import SessionLocal
+from app.schemas.interview_import import (
+    InterviewImportError,
+    InterviewImportRecord,
+    InterviewImportResult,
+)
+
+
+logger = logging.getLogger("app.interview_import")
+
+# Failures listed in the result; later ones are only counted.
+MAX_REPORTED_ERRORS = 100
+
+
+def _session_row(record: InterviewImportRecord, resume_text_id: int) -> dict:
+    started_at = record.started_at or datetime.utcnow()
+    last_turn_at = max((t.created_at for t in record.turns if t.created_at), default=started_at)
+    asked = sum(1 for t in record.turns if t.role == "assistant")
+    ended_at = record.ended_at
+    if record.status == "ended" and ended_at is None:
+        ended_at = last_turn_at
+    return {
+        "user_id": record.user_id,
+        "resume_text_id": resume_text_id,
+        "target_role": record.target_role,
+        "difficulty": record.difficulty,
+        "personality_mode": record.personality_mode,
+        "status": record.status,
+        "question_index": max(0, asked - 1),
+        "turn_count": len(record.turns),
+        "started_at": started_at,
+        "ended_at": ended_at,
+        "last_activity_at": max(last_turn_at, ended_at or last_turn_at),
+    }
+
+
+def write_import_batch(db: Session, records: list[InterviewImportRecord]) -> int:
+    """
+    Write `records` and their transcripts in one transaction and return the
+    number of turns written.
+
+    One multi-row insert for new resume texts, one for the sessions (ids
+    returned in order) and one executemany for all their turns.
+    """
+    resume_ids = get_or_create_resume_texts(db, (r.resume_text for r in records))
+    session_ids = bulk_insert_sessions(
+        db, [_session_row(r, resume_ids[resume_text_hash(r.resume_text)]) for r in records]
+    )
+    turns = []
+    for session_id, record in zip(session_ids, records):
+        started_at = record.started_at
+        for index, turn in enumerate(record.turns):
+            turns.append(
+                {
+                    "session_id": session_id,
+                    "role": turn.role,
+                    "content": turn.content,
+                    "turn_index": index,
+                    "created_at": turn.created_at or started_at or datetime.utcnow(),
+                }
+            )
+    bulk_insert_turns(db, turns)
+    db.commit()
+    return len(turns)
+
+
+class InterviewImporter:
+    """
+    Streams JSONL interview records into the database in batches.
+
+    Feed lines with `add_line`; when it returns True a batch is full and
+    `flush` should be called (directly, or in a worker thread from async
+    code). Memory holds one batch at a time. Lines that fail to parse or
+    validate are skipped and reported; a batch that fails to write is rolled
+    back and its lines are reported, and the import continues.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: Optional[int] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self.batch_size = max(1, batch_size or settings.INTERVIEW_IMPORT_BATCH_SIZE)
+        self.result = InterviewImportResult()
+        self._session_factory = session_factory
+        self._batch: list[InterviewImportRecord] = []
+        self._batch_lines: list[int] = []
+        self._line = 0
+
+    def _fail(self, line: int, detail: str) -> None:
+        self.result.failed_lines += 1
+        if len(self.result.errors) < MAX_REPORTED_ERRORS:
+            self.result.errors.append(InterviewImportError(line=line, detail=detail))
+
+    def add_line(self, line: Union[str, bytes]) -> bool:
+        self._line += 1
+        if not line.strip():
+            return False
+        try:
+            record = InterviewImportRecord.model_validate(json.loads(line))
+        except ValidationError as exc:
+            error = exc.errors()[0]
+            self._fail(self._line, f"{'.'.join(map(str, error['loc']))}: {error['msg']}")
+            return False
+        except ValueError as exc:
+            self._fail(self._line, f"invalid JSON: {exc}")
+            return False
+        self._batch.append(record)
+        self._batch_lines.append(self._line)
+        return len(self._batch) >= self.batch_size
+
+    def flush(self) -> None:
+        if not self._batch:
+            return
+        batch, lines = self._batch, self._batch_lines
+        self._batch, self._batch_lines = [], []
+
+        db = self._session_factory()
+        try:
+            turns = write_import_batch(db, batch)
+        except Exception as exc:
+            db.rollback()
+            logger.exception("Import batch (lines %d-%d) failed", lines[0], lines[-1])
+            for line in lines:
+                self._fail(line, f"batch write failed: {type(exc).__name__}")
+            return
+        finally:
+            db.close()
+        self.result.sessions += len(batch)
+        self.result.turns += turns
+
+
+def import_interviews(
+    lines: Iterable[Union[str, bytes]],
+    *,
+    batch_size: Optional[int] = None,
+) -> InterviewImportResult:
+    """
+    Import JSONL interview records from `lines` (e.g. an open file).
+    """
+    importer = InterviewImporter(batch_size=batch_size)
+    for line in lines:
+        if importer.add_line(line):
+            importer.flush()
+    importer.flush()
+    return importer.result
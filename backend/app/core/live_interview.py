@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
-from typing import Any, Optional
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 from app.core.config import settings
+from app.core.text_features import UNCERTAINTY_MARKERS, extract_features
 from app.schemas.live_interview import Difficulty, PersonalityMode
 
 
@@ -36,58 +41,73 @@ def _personality_instructions(mode: PersonalityMode) -> str:
     return "Be supportive and collaborative. Give short guidance in the question if needed."
 
 
-def _question_bank(target_role: str, difficulty: Difficulty) -> list[str]:
-    role = target_role.lower()
-
-    if "backend" in role or "api" in role:
-        base = [
-            "Walk me through an API you built end-to-end. What were the main trade-offs?",
-            "How do you design pagination and filtering for a high-traffic endpoint?",
-            "Explain how you would implement authentication and authorization for a new service.",
-            "What are common database indexing pitfalls you've seen, and how do you diagnose them?",
-            "How do you handle idempotency for write endpoints (e.g., payments, retries)?",
-            "Describe a production incident you handled. What was the root cause and what did you change afterward?",
-        ]
-    elif "frontend" in role:
-        base = [
-            "Describe a complex UI you built. How did you manage state and performance?",
-            "How do you structure a component library for scale and consistency?",
-            "Explain strategies for optimizing bundle size and runtime performance.",
-            "How do you test UI logic effectively (unit vs integration vs e2e)?",
-            "Tell me about an accessibility issue you fixed and the approach you used.",
-        ]
-    elif "data" in role or "ml" in role:
-        base = [
-            "Walk through a project where you improved a model or pipeline. What changed and why?",
-            "How do you detect data drift and decide when to retrain?",
-            "Explain precision/recall trade-offs for an imbalanced classification problem.",
-            "How do you ensure reproducibility in experiments and deployments?",
-            "Describe how you'd design feature stores and offline/online parity.",
-        ]
-    else:
-        base = [
-            "Tell me about a project you're proud of. What was your specific impact?",
-            "How do you approach ambiguous requirements and align stakeholders?",
-            "Describe a difficult bug you fixed. How did you narrow it down?",
-            "How do you prioritize tasks under tight deadlines?",
-            "What does 'quality' mean to you in software delivery?",
-        ]
-
-    if difficulty == "hard":
-        base.append("Design a scalable system for this role. Include data model, APIs, caching, and failure modes.")
-    elif difficulty == "easy":
-        base.insert(0, "Give me a quick summary of your background and why you're interested in this role.")
-
-    return base
+@dataclass(frozen=True, eq=False)
+class QuestionBank:
+    """
+    Questions per (role family, difficulty), loaded once from a data file.
+
+    Families are tried in file order; the first whose pattern occurs in the
+    lowercased role wins, and roles matching none use `default_family`.
+    """
+
+    families: tuple[str, ...]
+    default_family: str
+    questions: Mapping[tuple[str, str], tuple[str, ...]]
+    matcher: Optional[re.Pattern[str]]
+
+    def family_for(self, target_role: str) -> str:
+        return _role_family(self, target_role)
+
+    def questions_for(self, target_role: str, difficulty: str) -> tuple[str, ...]:
+        return self.questions[(self.family_for(target_role), difficulty)]
+
+
+def load_question_bank(path: str | Path) -> QuestionBank:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    families = tuple(f["name"] for f in data["families"])
+
+    # One lookahead per family, tried in file order from the start of the
+    # role, so the first listed family wins wherever its pattern occurs.
+    groups = [
+        f"(?=.*?(?P<f{i}>{'|'.join(re.escape(p.lower()) for p in fam['patterns'])}))"
+        for i, fam in enumerate(data["families"])
+        if fam["patterns"]
+    ]
+    matcher = re.compile("|".join(groups), re.DOTALL) if groups else None
+
+    questions: dict[tuple[str, str], tuple[str, ...]] = {}
+    for fam in data["families"]:
+        for difficulty, extra in data["difficulty"].items():
+            questions[(fam["name"], difficulty)] = (
+                *extra.get("prepend", ()),
+                *fam["questions"],
+                *extra.get("append", ()),
+            )
+
+    return QuestionBank(
+        families=families,
+        default_family=data["default_family"],
+        questions=MappingProxyType(questions),
+        matcher=matcher,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _role_family(bank: QuestionBank, target_role: str) -> str:
+    m = bank.matcher.match(target_role.lower()) if bank.matcher is not None else None
+    return bank.families[int(m.lastgroup[1:])] if m else bank.default_family
+
+
+_DEFAULT_QUESTION_BANK_PATH = Path(__file__).resolve().parent.parent / "data" / "question_bank.json"
+
+question_bank = load_question_bank(settings.QUESTION_BANK_PATH or _DEFAULT_QUESTION_BANK_PATH)
 
 
 def _needs_follow_up(answer: str) -> bool:
-    a = (answer or "").strip().lower()
-    if len(a) < 60:
-        return True
-    if any(x in a for x in ["i don't know", "not sure", "no idea", "can't remember"]):
+    features = extract_features(answer)
+    if features.chars < 60:
         return True
-    return False
+    return features.has_any(UNCERTAINTY_MARKERS)
 
 
 def next_question_mock(
@@ -99,7 +119,7 @@ def next_question_mock(
     last_answer: Optional[str],
     max_questions: int,
 ) -> NextQuestion:
-    bank = _question_bank(target_role=target_role, difficulty=difficulty)
+    bank = question_bank.questions_for(target_role, difficulty)
     # Loop bank if max_questions > bank size
     idx = min(question_index, max_questions - 1)
     q = bank[idx % len(bank)]
@@ -124,6 +144,7 @@ def next_question_gemini(
     transcript: list[dict[str, str]],
     question_index: int,
     max_questions: int,
+    summary: Optional[str] = None,
 ) -> Optional[NextQuestion]:
     model = _gemini_model()
     if model is None:
@@ -132,6 +153,7 @@ def next_question_gemini(
     # Truncate resume to avoid huge prompts
     resume_snippet = resume_text[:8000]
     personality = _personality_instructions(personality_mode)
+    earlier = f"\nEarlier in the interview (condensed):\n{summary}\n" if summary else ""
 
     prompt = f"""
 You are conducting a live interview.
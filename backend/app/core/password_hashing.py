@@ -0,0 +1,119 @@
+"""
+Password hashing on a dedicated, bounded thread pool.
+
+bcrypt takes tens of milliseconds of CPU per call. Run on the default
+executor, a burst of logins (a cohort signing in at once, or credential
+stuffing) fills every thread and queues the work live interviews need
+there, such as write-behind flushes. Hashing instead runs on its own
+`PASSWORD_HASH_WORKERS` threads with at most `PASSWORD_HASH_QUEUE_SIZE`
+calls waiting; beyond that, or when a call has waited longer than
+`PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS`, it fails fast with
+`PasswordHashingBusy` and the route answers 503 with Retry-After.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.security import get_password_hash, verify_password
+
+
+T = TypeVar("T")
+
+hash_calls = registry.counter("password_hash_calls_total", "Password hashes and verifications run.")
+hash_rejected = registry.counter(
+    "password_hash_rejected_total", "Password hash calls refused because the hashing pool was saturated."
+)
+hash_wait_seconds = registry.counter(
+    "password_hash_queue_wait_seconds_total", "Time hash calls spent queued before a worker picked them up."
+)
+hash_admitted = registry.gauge("password_hash_in_flight", "Password hash calls running or queued.")
+
+
+class PasswordHashingBusy(RuntimeError):
+    """
+    Raised when the hashing pool cannot take a call in time.
+    """
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Password hashing is saturated")
+        self.retry_after = retry_after
+
+
+class PasswordHashPool:
+    """
+    `workers` threads plus a queue of at most `queue_size` waiting calls.
+
+    A call is refused up front when the queue is full, and skipped (refused)
+    when a worker reaches it after `queue_timeout` seconds, since its client
+    has likely given up by then.
+    """
+
+    def __init__(self, workers: int, queue_size: int, queue_timeout: float) -> None:
+        self.workers = max(1, workers)
+        self.capacity = self.workers + max(0, queue_size)
+        self.queue_timeout = queue_timeout
+        self._admitted = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+
+    def _retry_after(self) -> int:
+        return max(1, round(self.queue_timeout))
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self._admitted >= self.capacity:
+                hash_rejected.inc()
+                raise PasswordHashingBusy(self._retry_after())
+            self._admitted += 1
+            hash_admitted.set(self._admitted)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._admitted -= 1
+            hash_admitted.set(self._admitted)
+
+    def _call(self, fn: Callable[..., T], args: tuple, queued_at: float) -> T:
+        waited = time.monotonic() - queued_at
+        hash_wait_seconds.inc(waited)
+        if waited > self.queue_timeout:
+            hash_rejected.inc()
+            raise PasswordHashingBusy(self._retry_after())
+        hash_calls.inc()
+        return fn(*args)
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """
+        `fn(*args)` on the pool. The slot is freed when the call finishes (or
+        is cancelled before starting), not when the awaiting request goes
+        away, so abandoned calls still count against the queue.
+        """
+        self._admit()
+        try:
+            future = self._pool.submit(self._call, fn, args, time.monotonic())
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+
+password_hash_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+)
+
+
+async def hash_password(password: str) -> str:
+    return await password_hash_pool.run(get_password_hash, password)
+
+
+async def check_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
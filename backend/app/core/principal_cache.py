@@ -0,0 +1,160 @@
+"""
+Per-process cache of authenticated principals.
+
+Every authenticated request resolves its token's subject (the user's email)
+to a user. `principal_cache` keeps a small snapshot of active users for
+`PRINCIPAL_CACHE_TTL_SECONDS`, so most requests skip the user query. The
+dependencies in `app.api.deps` return the snapshot instead of the ORM user;
+handlers that need the full row (GET /api/auth/me) load it.
+
+Entries are dropped when a committed ORM change touches a user, in any
+session of this process (`track_user_changes`). Other worker processes see
+the change when their entry expires, so the TTL bounds how long a
+deactivated user can keep using a token there.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.models.user import User
+
+
+cache_hits = registry.counter("principal_cache_hits_total", "Authenticated requests served from the principal cache.")
+cache_misses = registry.counter(
+    "principal_cache_misses_total", "Authenticated requests that looked the user up in the database."
+)
+cache_invalidations = registry.counter(
+    "principal_cache_invalidations_total", "Principal cache entries dropped because the user changed."
+)
+
+# Session.info entry holding the subjects changed in the current transaction;
+# None in the set means "some users, unknown which".
+_CHANGED = "changed_principals"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    What request handlers need to know about the authenticated user.
+    """
+
+    id: int
+    email: str
+    is_active: bool
+    is_superuser: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, email=user.email, is_active=user.is_active, is_superuser=user.is_superuser)
+
+
+class PrincipalCache:
+    """
+    Token subject -> Principal, for `ttl` seconds, at most `max_size` entries
+    (least recently used evicted first). A `ttl` of 0 disables caching.
+    """
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max(1, max_size)
+        self._entries: "OrderedDict[str, tuple[float, Principal]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, subject: str) -> Optional[Principal]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(subject)
+                cache_hits.inc()
+                return entry[1]
+            if entry is not None:
+                del self._entries[subject]
+        cache_misses.inc()
+        return None
+
+    def put(self, principal: Principal) -> Principal:
+        if self.ttl <= 0:
+            return principal
+        with self._lock:
+            self._entries[principal.email] = (time.monotonic() + self.ttl, principal)
+            self._entries.move_to_end(principal.email)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, subject: str) -> None:
+        with self._lock:
+            if self._entries.pop(subject, None) is not None:
+                cache_invalidations.inc()
+
+    def clear(self) -> None:
+        with self._lock:
+            cache_invalidations.inc(len(self._entries))
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=settings.PRINCIPAL_CACHE_SIZE,
+)
+registry.gauge("principal_cache_entries", "Principals currently cached.").set_function(
+    lambda: len(principal_cache)
+)
+registry.gauge("principal_cache_hit_ratio", "Share of principal lookups served from the cache.").set_function(
+    lambda: cache_hits.value / max(1.0, cache_hits.value + cache_misses.value)
+)
+
+
+def track_user_changes(cache: PrincipalCache) -> None:
+    """
+    Invalidate cached principals when a commit updates or deletes a user:
+    ORM changes by the user's old and new email, bulk UPDATE/DELETE
+    statements on `users` by clearing the cache.
+    """
+
+    @event.listens_for(Session, "after_flush")
+    def _after_flush(db: Session, flush_context) -> None:
+        changed = set()
+        for obj in (*db.dirty, *db.deleted):
+            if isinstance(obj, User):
+                history = inspect(obj).attrs.email.history
+                changed.update(e for e in (obj.email, *history.deleted) if e is not None)
+        if changed:
+            db.info.setdefault(_CHANGED, set()).update(changed)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _on_execute(state: ORMExecuteState) -> None:
+        if (state.is_update or state.is_delete) and getattr(state.statement.table, "name", None) == "users":
+            state.session.info.setdefault(_CHANGED, set()).add(None)
+
+    @event.listens_for(Session, "after_commit")
+    def _after_commit(db: Session) -> None:
+        changed = db.info.pop(_CHANGED, None)
+        if not changed:
+            return
+        if None in changed:
+            cache.clear()
+            return
+        for subject in changed:
+            cache.invalidate(subject)
+
+    @event.listens_for(Session, "after_rollback")
+    def _after_rollback(db: Session) -> None:
+        db.info.pop(_CHANGED, None)
+
+
+track_user_changes(principal_cache)
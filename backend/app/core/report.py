@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import json
-from typing import Any, List
+from statistics import mean
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.crud.interview import list_turn_evaluations, list_turns
+from app.models.interview import InterviewSession
 from app.schemas.report import InterviewReport, SkillScore
 
 
@@ -30,6 +35,65 @@ def _extract_json(text: str) -> str:
     return text[start : end + 1]
 
 
+# Report skill name -> per-answer evaluation metric it is aggregated from.
+EVALUATION_SKILLS: tuple[tuple[str, str], ...] = (
+    ("Problem solving", "relevance"),
+    ("Technical depth", "depth"),
+    ("Communication", "clarity"),
+    ("Confidence", "confidence"),
+)
+
+
+def _skill_comment(score: float, answers: int) -> str:
+    if score >= 80:
+        return f"Consistently strong across {answers} scored answers."
+    if score >= 65:
+        return f"Solid across {answers} scored answers; can go deeper on specifics."
+    return f"Below target across {answers} scored answers; focus practice here."
+
+
+def aggregate_skill_breakdown(evaluations: Sequence[Any]) -> List[SkillScore]:
+    """
+    Build the skill breakdown from stored per-answer evaluations.
+
+    `evaluations` are objects exposing relevance/depth/clarity/confidence
+    (e.g. TurnEvaluation rows). Cost is linear in the number of answers and
+    involves no model call.
+    """
+    if not evaluations:
+        return []
+
+    skills: List[SkillScore] = []
+    for name, metric in EVALUATION_SKILLS:
+        score = round(mean(float(getattr(e, metric)) for e in evaluations), 2)
+        skills.append(
+            SkillScore(
+                name=name,
+                score=max(0.0, min(100.0, score)),
+                comment=_skill_comment(score, len(evaluations)),
+            )
+        )
+    return skills
+
+
+def _evaluation_summary(
+    evaluations: Sequence[Any],
+    skills: List[SkillScore],
+) -> dict[str, Any]:
+    """
+    Compact, fixed-size digest of an interview used for the narrative prompt.
+    """
+    weakest = sorted(evaluations, key=lambda e: float(e.overall_score))[:3]
+    return {
+        "answers_scored": len(evaluations),
+        "average_overall_score": round(mean(float(e.overall_score) for e in evaluations), 2),
+        "skills": {s.name: s.score for s in skills},
+        "weakest_answer_feedback": [
+            (e.feedback or "")[:200] for e in weakest if e.feedback
+        ],
+    }
+
+
 def _mock_report(
     *,
     interview_id: int,
@@ -84,7 +148,25 @@ def generate_report(
     difficulty: str,
     personality_mode: str,
     transcript: list[dict[str, str]],
+    evaluations: Optional[Sequence[Any]] = None,
 ) -> InterviewReport:
+    """
+    Generate the end-of-interview report.
+
+    When per-answer `evaluations` are available the skill breakdown is
+    aggregated from them and the model only writes the narrative fields from a
+    compact summary, so cost no longer grows with the transcript. Otherwise the
+    full transcript is sent to the model as before.
+    """
+    if evaluations:
+        return _report_from_evaluations(
+            interview_id=interview_id,
+            target_role=target_role,
+            difficulty=difficulty,
+            personality_mode=personality_mode,
+            evaluations=evaluations,
+        )
+
     model = _gemini_model()
     if model is None:
         return _mock_report(
@@ -170,3 +252,93 @@ Guidelines:
             transcript=transcript,
         )
 
+
+
+def _report_from_evaluations(
+    *,
+    interview_id: int,
+    target_role: str,
+    difficulty: str,
+    personality_mode: str,
+    evaluations: Sequence[Any],
+) -> InterviewReport:
+    skills = aggregate_skill_breakdown(evaluations)
+    fallback = _mock_report(
+        interview_id=interview_id,
+        target_role=target_role,
+        difficulty=difficulty,
+        personality_mode=personality_mode,
+        transcript=[],
+    )
+    fallback.skill_breakdown = skills
+
+    model = _gemini_model()
+    if model is None:
+        return fallback
+
+    summary = _evaluation_summary(evaluations, skills)
+    prompt = f"""
+You are writing the narrative part of an interview report for a candidate.
+The scores are already computed; do not re-score.
+
+Target role: {target_role}
+Difficulty: {difficulty}
+Interviewer personality mode: {personality_mode}
+
+Score summary:
+{json.dumps(summary, ensure_ascii=False)}
+
+Return STRICT JSON only (no markdown, no commentary) with this exact structure:
+{{
+  "strengths": ["string"],
+  "weaknesses": ["string"],
+  "improvement_tips": ["string"],
+  "summary": "string"
+}}
+
+Guidelines:
+- Strengths/weaknesses/improvement_tips should be candidate-facing and actionable.
+- Ground them in the skill scores and the feedback on the weakest answers.
+"""
+
+    try:
+        resp = model.generate_content(prompt)
+        raw = (resp.text or "").strip()
+        data: Any = json.loads(_extract_json(raw))
+
+        return InterviewReport(
+            interview_id=interview_id,
+            target_role=target_role,
+            difficulty=difficulty,
+            personality_mode=personality_mode,
+            skill_breakdown=skills,
+            strengths=[str(x) for x in data.get("strengths", []) or []],
+            weaknesses=[str(x) for x in data.get("weaknesses", []) or []],
+            improvement_tips=[str(x) for x in data.get("improvement_tips", []) or []],
+            summary=str(data.get("summary") or "") or None,
+        )
+    except Exception:
+        return fallback
+
+
+def report_for_session(db: Session, session: InterviewSession) -> InterviewReport:
+    """
+    Build the report for a stored interview session.
+
+    Prefers stored per-answer evaluations; the transcript is only loaded for
+    sessions that have none (e.g. started before per-turn scoring existed).
+    """
+    evaluations = list_turn_evaluations(db, session_id=session.id)
+    transcript: list[dict[str, str]] = []
+    if not evaluations:
+        turns = list_turns(db, session_id=session.id)
+        transcript = [{"role": t.role, "content": t.content} for t in turns]
+
+    return generate_report(
+        interview_id=session.id,
+        target_role=session.target_role,
+        difficulty=session.difficulty,
+        personality_mode=session.personality_mode,
+        transcript=transcript,
+        evaluations=evaluations,
+    )
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import datetime
+from statistics import mean
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+from app.core.config import settings
+from app.core.report_store import iter_session_reports
+from app.crud.interview import iter_session_batches
+from app.db.session import ReadSessionLocal
+from app.models.interview import InterviewSession
+from app.schemas.report import InterviewReport
+
+
+try:  # Optional dependency for Parquet export
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except Exception:  # pragma: no cover - optional
+    pa = None  # type: ignore[assignment]
+    pq = None  # type: ignore[assignment]
+
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+EXPORT_COLUMNS = (
+    "interview_id",
+    "user_id",
+    "target_role",
+    "difficulty",
+    "personality_mode",
+    "status",
+    "started_at",
+    "ended_at",
+    "average_skill_score",
+    "skill_breakdown",
+    "strengths",
+    "weaknesses",
+    "improvement_tips",
+    "summary",
+)
+
+
+def parquet_available() -> bool:
+    return pq is not None
+
+
+def report_row(session: InterviewSession, report: Optional[InterviewReport]) -> dict[str, Any]:
+    """
+    Flatten one session and its report into an export row.
+
+    List fields are JSON-encoded strings so every format shares one flat schema.
+    """
+    skills = report.skill_breakdown if report else []
+    return {
+        "interview_id": session.id,
+        "user_id": session.user_id,
+        "target_role": session.target_role,
+        "difficulty": session.difficulty,
+        "personality_mode": session.personality_mode,
+        "status": session.status,
+        "started_at": session.started_at.isoformat() if session.started_at else None,
+        "ended_at": session.ended_at.isoformat() if session.ended_at else None,
+        "average_skill_score": round(mean(s.score for s in skills), 2) if skills else None,
+        "skill_breakdown": json.dumps([s.model_dump() for s in skills], ensure_ascii=False),
+        "strengths": json.dumps(report.strengths if report else [], ensure_ascii=False),
+        "weaknesses": json.dumps(report.weaknesses if report else [], ensure_ascii=False),
+        "improvement_tips": json.dumps(report.improvement_tips if report else [], ensure_ascii=False),
+        "summary": report.summary if report else None,
+    }
+
+
+def _chunks(rows: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    chunk: list[dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _stream_csv(rows: Iterable[dict[str, Any]], chunk_size: int) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    for chunk in _chunks(rows, chunk_size):
+        writer.writerows(chunk)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+    tail = buffer.getvalue()
+    if tail:
+        yield tail.encode("utf-8")
+
+
+def _stream_jsonl(rows: Iterable[dict[str, Any]], chunk_size: int) -> Iterator[bytes]:
+    for chunk in _chunks(rows, chunk_size):
+        yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in chunk).encode("utf-8")
+
+
+class _ByteSink(io.RawIOBase):
+    """
+    Write-only file object whose contents are drained after each row group.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data) -> int:  # type: ignore[override]
+        chunk = bytes(data)
+        self._parts.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _stream_parquet(rows: Iterable[dict[str, Any]], chunk_size: int) -> Iterator[bytes]:
+    if pq is None:
+        raise RuntimeError("Parquet export requires the 'pyarrow' package")
+
+    schema = pa.schema(
+        [
+            ("interview_id", pa.int64()),
+            ("user_id", pa.int64()),
+            ("target_role", pa.string()),
+            ("difficulty", pa.string()),
+            ("personality_mode", pa.string()),
+            ("status", pa.string()),
+            ("started_at", pa.string()),
+            ("ended_at", pa.string()),
+            ("average_skill_score", pa.float64()),
+            ("skill_breakdown", pa.string()),
+            ("strengths", pa.string()),
+            ("weaknesses", pa.string()),
+            ("improvement_tips", pa.string()),
+            ("summary", pa.string()),
+        ]
+    )
+    sink = _ByteSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for chunk in _chunks(rows, chunk_size):
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def stream_report_export(
+    pairs: Iterable[Tuple[InterviewSession, Optional[InterviewReport]]],
+    *,
+    fmt: str,
+    chunk_size: int = 100,
+) -> Iterator[bytes]:
+    """
+    Encode (session, report) pairs as a stream of CSV, JSONL or Parquet bytes.
+
+    Rows are buffered `chunk_size` at a time (one Parquet row group per chunk),
+    so memory does not depend on how many sessions are exported.
+    """
+    rows = (report_row(session, report) for session, report in pairs)
+    if fmt == "csv":
+        return _stream_csv(rows, chunk_size)
+    if fmt == "jsonl":
+        return _stream_jsonl(rows, chunk_size)
+    if fmt == "parquet":
+        return _stream_parquet(rows, chunk_size)
+    raise ValueError(f"Unsupported export format: {fmt}")
+
+
+def export_reports(
+    *,
+    fmt: str,
+    status: Optional[str] = None,
+    target_role: Optional[str] = None,
+    user_id: Optional[int] = None,
+    started_from: Optional[datetime] = None,
+    started_to: Optional[datetime] = None,
+) -> Iterator[bytes]:
+    """
+    Stream reports for all sessions matching the filters.
+
+    Owns its database session so it can outlive the request that started it
+    (StreamingResponse) or run from the CLI. Reads from the read replica when
+    one is configured; missing reports are generated against the primary.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if fmt == "parquet" and not parquet_available():
+        raise RuntimeError("Parquet export requires the 'pyarrow' package")
+
+    db = ReadSessionLocal()
+    try:
+        batches = iter_session_batches(
+            db,
+            batch_size=settings.REPORT_EXPORT_BATCH_SIZE,
+            status=status,
+            target_role=target_role,
+            user_id=user_id,
+            started_from=started_from,
+            started_to=started_to,
+        )
+        pairs = iter_session_reports(batches, db=db, max_workers=settings.REPORT_EXPORT_WORKERS)
+        yield from stream_report_export(pairs, fmt=fmt, chunk_size=settings.REPORT_EXPORT_BATCH_SIZE)
+    finally:
+        db.close()
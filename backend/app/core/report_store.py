@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.report import report_for_session
+from app.core.turn_scoring import wait_for_scoring
+from app.crud.aio import report as aio_report
+from app.crud.interview import get_session
+from app.crud.report import get_report, get_reports_for_sessions, save_report
+from app.db.session import SessionLocal
+from app.models.interview import InterviewSession
+from app.schemas.report import InterviewReport
+
+
+def get_or_create_report(db: Session, session: InterviewSession) -> InterviewReport:
+    """
+    Return the persisted report for a session, generating it if needed.
+
+    Only ended sessions are persisted; an active interview's report keeps
+    changing as answers come in.
+    """
+    report = get_report(db, session_id=session.id)
+    if report is not None:
+        return report
+
+    # The report aggregates per-answer evaluations; give in-flight ones a
+    # bounded time to land, then report on the evaluations already stored.
+    # Such a report is not persisted, so a later call picks up the rest.
+    scored = wait_for_scoring(session.id, timeout=settings.REPORT_SCORING_WAIT_SECONDS)
+    report = report_for_session(db, session)
+    if session.status == "ended" and scored:
+        save_report(db, report, user_id=session.user_id, recorded_at=session.started_at)
+    return report
+
+
+def _generate_in_worker(session_id: int) -> Optional[InterviewReport]:
+    # Worker threads must not share the caller's Session.
+    db = SessionLocal()
+    try:
+        session = get_session(db, session_id=session_id)
+        if session is None:
+            return None
+        return get_or_create_report(db, session)
+    finally:
+        db.close()
+
+
+# Process-wide cap on concurrent report generations (each is a model call)
+# for analytics fan-out and background work.
+_fanout_pool = ThreadPoolExecutor(
+    max_workers=max(1, settings.REPORT_FANOUT_CONCURRENCY),
+    thread_name_prefix="report-fanout",
+)
+# GET /api/reports/{id} generates on its own pool so a backlog of analytics
+# fan-out cannot starve the report a user is waiting on.
+_report_pool = ThreadPoolExecutor(
+    max_workers=max(1, settings.REPORT_REQUEST_CONCURRENCY),
+    thread_name_prefix="report-request",
+)
+
+
+def enqueue_reports(session_ids: Iterable[int]) -> None:
+    """
+    Generate and persist reports for `session_ids` in the background.
+    """
+    for session_id in session_ids:
+        _fanout_pool.submit(_generate_in_worker, session_id)
+
+
+async def get_or_create_report_async(db: AsyncSession, session: InterviewSession) -> Optional[InterviewReport]:
+    """
+    `get_or_create_report` for async handlers.
+
+    The stored report is read on the async engine; generation (a model call
+    plus sync writes) runs on the report-request pool.
+    """
+    report = await aio_report.get_report(db, session_id=session.id)
+    if report is not None:
+        return report
+    return await asyncio.wrap_future(_report_pool.submit(_generate_in_worker, session.id))
+
+
+async def reports_for_sessions(
+    db: AsyncSession,
+    sessions: Sequence[InterviewSession],
+    *,
+    timeout: Optional[float] = None,
+) -> dict[int, InterviewReport]:
+    """
+    Reports for `sessions`, keyed by session id.
+
+    Persisted reports are read in one query; the rest are generated
+    concurrently on the shared fan-out pool. Reports not ready within
+    `timeout` seconds are left out of the result, so callers get partial
+    results instead of waiting for the slowest model call. Generations still
+    queued then are cancelled, so repeated timeouts do not pile up work on
+    the pool; ones already running finish (and persist, for ended sessions).
+    """
+    reports = await aio_report.get_reports_for_sessions(db, [s.id for s in sessions])
+    futures = {
+        s.id: asyncio.wrap_future(_fanout_pool.submit(_generate_in_worker, s.id))
+        for s in sessions
+        if s.id not in reports
+    }
+    if not futures:
+        return reports
+
+    if timeout is None:
+        timeout = settings.REPORT_FANOUT_TIMEOUT_SECONDS
+    done, pending = await asyncio.wait(futures.values(), timeout=timeout)
+    for future in pending:
+        # Cancels the pool's future too when it has not started.
+        future.cancel()
+    for session_id, future in futures.items():
+        if future in done and future.exception() is None:
+            report = future.result()
+            if report is not None:
+                reports[session_id] = report
+    return reports
+
+
+def iter_session_reports(
+    batches: Iterable[list[InterviewSession]],
+    *,
+    db: Session,
+    max_workers: int,
+) -> Iterator[Tuple[InterviewSession, Optional[InterviewReport]]]:
+    """
+    Yield (session, report) pairs in input order.
+
+    Persisted reports are read with one query per batch; missing ones are
+    generated on a pool of at most `max_workers` threads. Only one batch is
+    held in memory at a time.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        for batch in batches:
+            stored = get_reports_for_sessions(db, [s.id for s in batch])
+            # Don't keep the read open while the batch is consumed.
+            db.rollback()
+            pending = {
+                s.id: pool.submit(_generate_in_worker, s.id)
+                for s in batch
+                if s.id not in stored
+            }
+            for session in batch:
+                if session.id in stored:
+                    yield session, stored[session.id]
+                else:
+                    yield session, pending[session.id].result()
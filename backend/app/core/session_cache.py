@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.crud.aio import interview as aio_interview, resume as aio_resume
+from app.crud.interview import TurnCounterConflict, claim_turn_indexes, release_turn_indexes, stage_exchanges
+from app.db.session import SessionLocal
+from app.models.interview import InterviewSession
+
+
+logger = logging.getLogger("app.session_cache")
+
+# Characters kept from each turn that scrolls out of the prompt window.
+_SUMMARY_LINE_CHARS = 160
+
+failed_writes = registry.counter(
+    "write_behind_failed_writes_total", "Session writes by the write-behind queue that failed and were requeued."
+)
+rejected_submits = registry.counter(
+    "write_behind_rejected_submits_total", "Answers refused with 503 because the write-behind queue was full."
+)
+
+
+class WriteBehindUnavailable(RuntimeError):
+    """
+    Raised when buffered turns cannot be accepted (the queue is full) or a
+    session's buffered turns could not be written when they had to be. The
+    turns already acknowledged stay queued either way.
+    """
+
+    def __init__(self, message: str, retry_after: int) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class ActiveSessionState:
+    """
+    Everything the live interview needs to produce the next question, kept in
+    memory while the interview runs.
+
+    `recent_turns` holds the prompt window, each turn with its turn index;
+    older turns are folded into `summary`, which is saved with each exchange
+    (`interview_sessions.live_summary`). `turn_count` mirrors the session's
+    counter in the database, which hands out every turn index
+    (`reserve_turns`). Mutate only while holding `lock`.
+    """
+
+    id: int
+    user_id: Optional[int]
+    target_role: str
+    difficulty: str
+    personality_mode: str
+    resume_text: str
+    status: str
+    question_index: int
+    turn_count: int
+    recent_turns: deque = field(default_factory=deque)
+    summary: str = ""
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    last_active: float = field(default_factory=time.monotonic)
+
+    def transcript(self) -> list[dict[str, str]]:
+        return [{"role": t["role"], "content": t["content"]} for t in self.recent_turns]
+
+    def last_question(self) -> str:
+        return next((t["content"] for t in reversed(self.recent_turns) if t["role"] == "assistant"), "")
+
+    def append(self, role: str, content: str, turn_index: int) -> None:
+        """
+        Record a turn under an index reserved for it.
+        """
+        self._push(role, content, turn_index)
+        self.turn_count = max(self.turn_count, turn_index + 1)
+        self.last_active = time.monotonic()
+
+    def _push(self, role: str, content: str, turn_index: int) -> None:
+        # Add to the prompt window, folding the turn that scrolls out of it
+        # into the summary.
+        if self.recent_turns.maxlen is not None and len(self.recent_turns) == self.recent_turns.maxlen:
+            oldest = self.recent_turns[0]
+            label = "Q" if oldest["role"] == "assistant" else "A"
+            line = f"{label}: {oldest['content'][:_SUMMARY_LINE_CHARS]}"
+            self.summary = f"{self.summary}\n{line}"[-settings.LIVE_SUMMARY_MAX_CHARS :].lstrip()
+        self.recent_turns.append({"role": role, "content": content, "turn_index": turn_index})
+
+
+@dataclass(frozen=True)
+class PendingExchange:
+    session_id: int
+    turn_index: int  # the answer's; the question takes the next one
+    answer: str
+    question: str
+    question_index: int
+    summary: str  # the session's rolling summary once this exchange is in
+    submitted_at: datetime = field(default_factory=datetime.utcnow)
+
+
+class WriteBehindQueue:
+    """
+    Buffers submitted exchanges and writes them in batches.
+
+    A background thread flushes every `interval` seconds. Callers that need a
+    session's turns in the database (ending the interview, evicting its state,
+    building a report) call `flush(session_id)` first, which writes that
+    session's pending exchanges synchronously.
+
+    Each session is committed on its own, so one that fails to write does not
+    hold back the others. Acknowledged exchanges are never dropped: a failed
+    session goes back to the head of the queue and the background flush
+    retries it with exponential backoff (`retry_backoff` doubling up to
+    `max_backoff` seconds), while an explicit `flush(session_id)` always
+    tries and raises WriteBehindUnavailable when it fails. Memory is bounded
+    by `max_pending`: once that many exchanges are buffered, `admit` refuses
+    new answers until the queue drains.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_pending: int = settings.WRITE_BEHIND_MAX_PENDING,
+        retry_backoff: float = settings.WRITE_BEHIND_RETRY_BACKOFF_SECONDS,
+        max_backoff: float = settings.WRITE_BEHIND_RETRY_BACKOFF_MAX_SECONDS,
+    ) -> None:
+        self._session_factory = session_factory
+        self._max_pending = max(1, max_pending)
+        self._retry_backoff = retry_backoff
+        self._max_backoff = max_backoff
+        # Session id -> (failed attempts, monotonic time of the next retry).
+        self._retries: dict[int, tuple[int, float]] = {}
+        self._pending: "OrderedDict[int, list[PendingExchange]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def admit(self) -> None:
+        """
+        Refuse a new answer while the queue is full; call before doing any
+        work for it. Answers already admitted are always enqueued.
+        """
+        if self.pending_count() >= self._max_pending:
+            rejected_submits.inc()
+            raise WriteBehindUnavailable(
+                "Too many answers waiting to be saved", retry_after=max(1, round(self._retry_backoff))
+            )
+
+    def enqueue(self, exchange: PendingExchange) -> None:
+        with self._lock:
+            self._pending.setdefault(exchange.session_id, []).append(exchange)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self._pending.values())
+
+    def has_pending(self, session_id: int) -> bool:
+        with self._lock:
+            return session_id in self._pending
+
+    def flush(self, session_id: Optional[int] = None, *, due_only: bool = False) -> None:
+        """
+        Write pending exchanges: one session's, or all when `session_id` is None.
+
+        `due_only` skips sessions still backing off after a failed write (the
+        background flush). Failed sessions stay queued; the first error is
+        raised, as WriteBehindUnavailable, after every session was attempted.
+        """
+        # Serialise writers so a session's exchanges are committed in order.
+        with self._write_lock:
+            with self._lock:
+                if session_id is None:
+                    now = time.monotonic()
+                    batch = OrderedDict(
+                        (sid, exchanges)
+                        for sid, exchanges in self._pending.items()
+                        if not due_only or self._retries.get(sid, (0, 0.0))[1] <= now
+                    )
+                    for sid in batch:
+                        del self._pending[sid]
+                else:
+                    items = self._pending.pop(session_id, None)
+                    batch = OrderedDict({session_id: items}) if items else OrderedDict()
+            if not batch:
+                return
+
+            db = self._session_factory()
+            failed: "OrderedDict[int, list[PendingExchange]]" = OrderedDict()
+            error: Optional[Exception] = None
+            try:
+                for sid, exchanges in batch.items():
+                    try:
+                        found = stage_exchanges(
+                            db,
+                            sid,
+                            [(ex.turn_index, ex.answer, ex.question, ex.submitted_at) for ex in exchanges],
+                            question_index=exchanges[-1].question_index,
+                            summary=exchanges[-1].summary,
+                        )
+                        db.commit()
+                    except Exception as exc:
+                        db.rollback()
+                        failed[sid] = exchanges
+                        error = error or exc
+                        continue
+                    self._retries.pop(sid, None)
+                    if not found:
+                        # The session row was deleted; there is nowhere to write them.
+                        logger.warning("Discarding %d exchanges for deleted session %s", len(exchanges), sid)
+            finally:
+                db.close()
+            if failed:
+                self._back_off(failed)
+                self._requeue(failed)
+            if error is not None:
+                raise WriteBehindUnavailable(
+                    "Could not save buffered answers", retry_after=max(1, round(self._retry_backoff))
+                ) from error
+
+    async def flush_async(self, session_id: int) -> None:
+        """
+        `flush(session_id)` for async callers; only takes a worker thread when
+        the session has something to write.
+        """
+        if self.has_pending(session_id):
+            await asyncio.to_thread(self.flush, session_id)
+
+    def _back_off(self, failed: "OrderedDict[int, list[PendingExchange]]") -> None:
+        now = time.monotonic()
+        for sid, exchanges in failed.items():
+            attempts = self._retries.get(sid, (0, 0.0))[0] + 1
+            delay = min(self._max_backoff, self._retry_backoff * 2 ** (attempts - 1))
+            self._retries[sid] = (attempts, now + delay)
+            failed_writes.inc()
+            logger.warning(
+                "Could not write %d exchanges for session %s (attempt %d); retrying in %.1f s",
+                len(exchanges),
+                sid,
+                attempts,
+                delay,
+            )
+
+    def _requeue(self, batch: "OrderedDict[int, list[PendingExchange]]") -> None:
+        with self._lock:
+            for sid, exchanges in reversed(batch.items()):
+                newer = self._pending.pop(sid, [])
+                self._pending[sid] = exchanges + newer
+                self._pending.move_to_end(sid, last=False)
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.flush(due_only=True)
+            except Exception:
+                logger.exception("Write-behind flush failed; will retry")
+
+    def start(self, interval: float) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="write-behind", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread and write everything still pending.
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+
+class ActiveSessionCache:
+    """
+    Bounded LRU of ActiveSessionState keyed by session id.
+
+    Evicting a state flushes its pending writes first, so nothing buffered is
+    lost when a session falls out of the cache.
+    """
+
+    def __init__(self, capacity: int, writes: WriteBehindQueue) -> None:
+        self._capacity = max(1, capacity)
+        self._writes = writes
+        self._states: "OrderedDict[int, ActiveSessionState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, session_id: int) -> Optional[ActiveSessionState]:
+        with self._lock:
+            state = self._states.get(session_id)
+            if state is not None:
+                self._states.move_to_end(session_id)
+            return state
+
+    def _insert(self, state: ActiveSessionState) -> tuple[ActiveSessionState, list[int]]:
+        evicted: list[int] = []
+        with self._lock:
+            existing = self._states.get(state.id)
+            if existing is not None:
+                self._states.move_to_end(state.id)
+                return existing, evicted
+            self._states[state.id] = state
+            while len(self._states) > self._capacity:
+                sid, _ = self._states.popitem(last=False)
+                evicted.append(sid)
+        return state, evicted
+
+    def peek(self, session_id: int) -> Optional[ActiveSessionState]:
+        """
+        Cached state without marking it recently used.
+        """
+        with self._lock:
+            return self._states.get(session_id)
+
+    def put(self, state: ActiveSessionState) -> ActiveSessionState:
+        """
+        Insert `state` unless another request already cached this session, and
+        return the cached one.
+
+        Sessions pushed out of the cache are flushed; if that fails their
+        exchanges stay queued (and block reloading them until written), so the
+        request that caused the eviction does not fail for it.
+        """
+        state, evicted = self._insert(state)
+        for sid in evicted:
+            try:
+                self._writes.flush(sid)
+            except WriteBehindUnavailable:
+                logger.warning("Evicted session %s still has unsaved exchanges; left queued", sid)
+        return state
+
+    async def put_async(self, state: ActiveSessionState) -> ActiveSessionState:
+        state, evicted = self._insert(state)
+        for sid in evicted:
+            try:
+                await self._writes.flush_async(sid)
+            except WriteBehindUnavailable:
+                logger.warning("Evicted session %s still has unsaved exchanges; left queued", sid)
+        return state
+
+    async def get_or_load_async(self, db: AsyncSession, session_id: int) -> Optional[ActiveSessionState]:
+        state = self.get(session_id)
+        if state is not None:
+            return state
+
+        await self._writes.flush_async(session_id)
+        session = await aio_interview.get_session(db, session_id=session_id)
+        if session is None:
+            return None
+        resume_text = await aio_resume.get_resume_text(db, session.resume_text_id) or ""
+        # Only the prompt window; older turns are in the saved summary.
+        turns = await aio_interview.list_recent_turns(
+            db, session_id=session_id, limit=settings.LIVE_TRANSCRIPT_WINDOW
+        )
+        return await self.put_async(_state_from_rows(session, resume_text, turns))
+
+    def evict(self, session_id: int) -> Optional[ActiveSessionState]:
+        """
+        Drop a session's state after flushing its pending writes. Raises
+        WriteBehindUnavailable, keeping the state cached, if the flush fails.
+        """
+        self._writes.flush(session_id)
+        with self._lock:
+            return self._states.pop(session_id, None)
+
+    async def evict_async(self, session_id: int) -> Optional[ActiveSessionState]:
+        await self._writes.flush_async(session_id)
+        with self._lock:
+            return self._states.pop(session_id, None)
+
+
+write_behind = WriteBehindQueue()
+registry.gauge("write_behind_pending_exchanges", "Answered exchanges buffered and not yet written.").set_function(
+    write_behind.pending_count
+)
+active_sessions = ActiveSessionCache(settings.ACTIVE_SESSION_CACHE_SIZE, write_behind)
+
+
+def _state_from_rows(session: InterviewSession, resume_text: str, turns) -> ActiveSessionState:
+    """
+    State rebuilt from the session row and its latest turns, oldest first:
+    the last LIVE_TRANSCRIPT_WINDOW turns form the prompt window and the
+    saved summary covers the ones before them.
+    """
+    state = ActiveSessionState(
+        id=session.id,
+        user_id=session.user_id,
+        target_role=session.target_role,
+        difficulty=session.difficulty,
+        personality_mode=session.personality_mode,
+        resume_text=resume_text,
+        status=session.status,
+        question_index=session.question_index,
+        turn_count=session.turn_count,
+        recent_turns=deque(maxlen=settings.LIVE_TRANSCRIPT_WINDOW),
+        summary=session.live_summary or "",
+    )
+    for turn in turns:
+        state._push(turn.role, turn.content, turn.turn_index)
+    return state
+
+
+def new_session_state(session: InterviewSession, *, resume_text: str, first_question: str) -> ActiveSessionState:
+    """
+    State for a session that was just created with `first_question` as turn 0.
+    """
+    state = ActiveSessionState(
+        id=session.id,
+        user_id=session.user_id,
+        target_role=session.target_role,
+        difficulty=session.difficulty,
+        personality_mode=session.personality_mode,
+        resume_text=resume_text,
+        status=session.status,
+        question_index=session.question_index,
+        turn_count=session.turn_count,
+        recent_turns=deque(maxlen=settings.LIVE_TRANSCRIPT_WINDOW),
+    )
+    state.append("assistant", first_question, 0)
+    return state
+
+
+def reserve_turns(state: ActiveSessionState, count: int) -> int:
+    """
+    Claim `count` turn indexes for a cached session from its counter in the
+    database, committed before the turns themselves are buffered, and return
+    the first. Caller holds `state.lock`.
+
+    Scoring, the buffered rows and WebSocket replay all use these indexes, so
+    they agree even when another process or a reload moved the counter.
+    Raises WriteBehindUnavailable when the database cannot be reached.
+    """
+    db = SessionLocal()
+    try:
+        first = claim_turn_indexes(db, state.id, count, expected=state.turn_count)
+        db.commit()
+    except (SQLAlchemyError, TurnCounterConflict) as exc:
+        db.rollback()
+        raise WriteBehindUnavailable(
+            "Could not record the answer", retry_after=max(1, round(settings.WRITE_BEHIND_RETRY_BACKOFF_SECONDS))
+        ) from exc
+    finally:
+        db.close()
+    state.turn_count = first + count
+    return first
+
+
+def release_turns(state: ActiveSessionState, first: int, count: int) -> None:
+    """
+    Give back indexes from `reserve_turns` whose turns were never recorded
+    (the next question could not be generated). Best effort: a gap in the
+    numbering is harmless. Caller holds `state.lock`.
+    """
+    db = SessionLocal()
+    try:
+        if release_turn_indexes(db, state.id, first, count):
+            db.commit()
+            state.turn_count = first
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("Could not release turn indexes %d-%d of session %s", first, first + count - 1, state.id)
+    finally:
+        db.close()
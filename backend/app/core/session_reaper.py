@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.report_store import enqueue_reports
+from app.core.session_cache import WriteBehindUnavailable, active_sessions, write_behind
+from app.crud.interview import count_sessions_by_status, end_idle_sessions, list_idle_sessions
+from app.db.session import SessionLocal
+
+
+logger = logging.getLogger("app.session_reaper")
+
+sessions_reaped = registry.counter(
+    "live_sessions_reaped_total", "Live interviews ended by the idle-session reaper."
+)
+sessions_active = registry.gauge(
+    "live_sessions_active", "Live interviews with status active, as of the last reaper run."
+)
+sessions_cached = registry.gauge("live_sessions_cached", "Live interview states held in memory.")
+sessions_cached.set_function(lambda: len(active_sessions))
+
+
+def _claim_idle(session_ids: Sequence[int], idle_ttl: float, locks: ExitStack) -> list[int]:
+    """
+    The sessions whose in-memory state (if any) saw no recent use and that
+    have no unsaved exchanges (their last activity in the database is stale).
+
+    Their state locks are taken on `locks` and stay held until it closes, so
+    no submit can slip in between this check and the UPDATE ending them.
+    """
+    idle = []
+    for session_id in session_ids:
+        if write_behind.has_pending(session_id):
+            continue
+        state = active_sessions.peek(session_id)
+        if state is not None:
+            # Waits for an in-flight submit, which refreshes last_active.
+            locks.enter_context(state.lock)
+            if time.monotonic() - state.last_active < idle_ttl:
+                continue
+        idle.append(session_id)
+    return idle
+
+
+def _release_state(session_id: int) -> None:
+    # Caller holds the state lock (see _claim_idle).
+    state = active_sessions.peek(session_id)
+    if state is not None:
+        state.status = "ended"
+    active_sessions.evict(session_id)
+
+
+def reap_idle_sessions(
+    db: Session,
+    *,
+    idle_ttl: timedelta,
+    batch_size: int,
+    generate_reports: bool = False,
+    now: Optional[datetime] = None,
+) -> list[int]:
+    """
+    End active sessions idle for longer than `idle_ttl` and return their ids.
+
+    Buffered turns are flushed first so they count as activity. Sessions are
+    ended `batch_size` at a time, one UPDATE per batch; sessions still in use
+    stay active and are paged past, to be picked up on a later run.
+    """
+    now = now or datetime.utcnow()
+    idle_since = now - idle_ttl
+    try:
+        write_behind.flush()
+    except WriteBehindUnavailable:
+        # Sessions that could not be written stay queued and are skipped below.
+        logger.warning("Some buffered exchanges could not be written before reaping")
+
+    reaped: list[int] = []
+    after = None
+    while True:
+        candidates = list_idle_sessions(db, idle_since=idle_since, limit=batch_size, after=after)
+        if not candidates:
+            break
+        with ExitStack() as locks:
+            idle = _claim_idle([sid for sid, _ in candidates], idle_ttl.total_seconds(), locks)
+            ended = end_idle_sessions(db, idle, idle_since=idle_since, ended_at=now)
+            for sid in ended:
+                _release_state(sid)
+        reaped.extend(ended)
+        if len(candidates) < batch_size:
+            break
+        last_id, last_activity_at = candidates[-1]
+        after = (last_activity_at, last_id)
+
+    if reaped:
+        sessions_reaped.inc(len(reaped))
+        logger.info("Ended %d idle live interviews", len(reaped))
+        if generate_reports:
+            enqueue_reports(reaped)
+    sessions_active.set(count_sessions_by_status(db).get("active", 0))
+    return reaped
+
+
+class SessionReaper:
+    """
+    Runs `reap_idle_sessions` on a background thread every `interval` seconds.
+    """
+
+    def __init__(self) -> None:
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> list[int]:
+        db = SessionLocal()
+        try:
+            return reap_idle_sessions(
+                db,
+                idle_ttl=timedelta(seconds=settings.LIVE_SESSION_IDLE_TTL_SECONDS),
+                batch_size=settings.SESSION_REAPER_BATCH_SIZE,
+                generate_reports=settings.SESSION_REAPER_GENERATE_REPORTS,
+            )
+        finally:
+            db.close()
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Idle-session reaper failed; will retry")
+
+    def start(self, interval: float) -> None:
+        if self._thread is not None or interval <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="session-reaper", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+
+session_reaper = SessionReaper()
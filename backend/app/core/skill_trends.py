@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.crud.report import list_cohort_skill_means, list_skill_score_rows
+from app.schemas.analytics import SkillTrendItem
+
+
+@dataclass(frozen=True)
+class SkillScoreMatrix:
+    """
+    Skill score history as contiguous arrays.
+
+    `scores` has one row per session (chronological) and one column per skill;
+    NaN marks a skill that was not scored in that session.
+    """
+
+    session_ids: np.ndarray  # (n_sessions,) int64
+    user_ids: np.ndarray  # (n_sessions,) int64, -1 for anonymous sessions
+    skills: tuple[str, ...]
+    scores: np.ndarray  # (n_sessions, n_skills) float64
+
+
+@dataclass(frozen=True)
+class SkillTrendStats:
+    """
+    Per-skill statistics, each array aligned with `skills`.
+    """
+
+    skills: tuple[str, ...]
+    sessions: np.ndarray  # number of sessions that scored the skill
+    average: np.ndarray
+    latest: np.ndarray
+    rolling_mean: np.ndarray  # mean of the last `window` scores
+    ewma: np.ndarray
+    slope: np.ndarray  # least-squares points per session
+    volatility: np.ndarray  # std of session-to-session changes
+
+
+def build_score_matrix(rows: Iterable[tuple[int, Optional[int], str, float]]) -> SkillScoreMatrix:
+    """
+    Pivot chronological (session_id, user_id, skill_name, score) rows.
+
+    Sessions keep first-seen order; skills are sorted by name.
+    """
+    data = list(rows)
+    if not data:
+        return SkillScoreMatrix(
+            session_ids=np.empty(0, dtype=np.int64),
+            user_ids=np.empty(0, dtype=np.int64),
+            skills=(),
+            scores=np.empty((0, 0), dtype=np.float64),
+        )
+
+    # Dict interning is much cheaper than np.unique on object arrays.
+    session_pos: dict[int, int] = {}
+    skill_pos: dict[str, int] = {}
+    n = len(data)
+    row_idx = np.fromiter((session_pos.setdefault(r[0], len(session_pos)) for r in data), dtype=np.int64, count=n)
+    skill_idx = np.fromiter((skill_pos.setdefault(r[2], len(skill_pos)) for r in data), dtype=np.int64, count=n)
+    user_col = np.fromiter((-1 if r[1] is None else r[1] for r in data), dtype=np.int64, count=n)
+    score_col = np.fromiter((r[3] for r in data), dtype=np.float64, count=n)
+
+    skill_names = sorted(skill_pos)
+    column_of = np.empty(len(skill_pos), dtype=np.int64)
+    for column, name in enumerate(skill_names):
+        column_of[skill_pos[name]] = column
+
+    scores = np.full((len(session_pos), len(skill_names)), np.nan, dtype=np.float64)
+    scores[row_idx, column_of[skill_idx]] = score_col
+
+    users = np.empty(len(session_pos), dtype=np.int64)
+    users[row_idx] = user_col
+
+    return SkillScoreMatrix(
+        session_ids=np.fromiter(session_pos, dtype=np.int64, count=len(session_pos)),
+        user_ids=users,
+        skills=tuple(skill_names),
+        scores=scores,
+    )
+
+
+def load_score_matrix(db: Session, *, user_id: Optional[int] = None) -> SkillScoreMatrix:
+    """
+    Load one user's skill history, or everyone's when `user_id` is None.
+    """
+    return build_score_matrix(list_skill_score_rows(db, user_id=user_id))
+
+
+def _forward_fill(scores: np.ndarray) -> np.ndarray:
+    mask = ~np.isnan(scores)
+    idx = np.where(mask, np.arange(scores.shape[0])[:, None], 0)
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    filled = scores[idx, np.arange(scores.shape[1])]
+    # Leading NaNs (before a skill's first score) stay NaN.
+    filled[np.cumsum(mask, axis=0) == 0] = np.nan
+    return filled
+
+
+def rolling_mean(scores: np.ndarray, window: int) -> np.ndarray:
+    """
+    NaN-aware trailing mean over the last `window` sessions, per column.
+    """
+    values = np.nan_to_num(scores, nan=0.0)
+    counts = (~np.isnan(scores)).astype(np.float64)
+    csum = np.cumsum(values, axis=0)
+    ccount = np.cumsum(counts, axis=0)
+    if window < scores.shape[0]:
+        csum[window:] = csum[window:] - csum[:-window].copy()
+        ccount[window:] = ccount[window:] - ccount[:-window].copy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(ccount > 0, csum / ccount, np.nan)
+
+
+def ewma(scores: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponentially weighted moving average down each column, skipping NaNs.
+
+    The recursion runs once per session; each step is vectorised across skills.
+    """
+    out = np.empty_like(scores)
+    prev = np.full(scores.shape[1], np.nan)
+    for t in range(scores.shape[0]):
+        x = scores[t]
+        blended = alpha * x + (1.0 - alpha) * prev
+        prev = np.where(np.isnan(prev), x, np.where(np.isnan(x), prev, blended))
+        out[t] = prev
+    return out
+
+
+def least_squares_slope(scores: np.ndarray) -> np.ndarray:
+    """
+    Per-column slope of score against session ordinal, ignoring NaNs.
+    """
+    mask = ~np.isnan(scores)
+    x = np.arange(scores.shape[0], dtype=np.float64)[:, None] * mask
+    y = np.nan_to_num(scores, nan=0.0)
+    n = mask.sum(axis=0).astype(np.float64)
+    sx = x.sum(axis=0)
+    sy = y.sum(axis=0)
+    sxx = (x * x).sum(axis=0)
+    sxy = (x * y).sum(axis=0)
+    denom = n * sxx - sx * sx
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where((n >= 2) & (denom != 0), (n * sxy - sx * sy) / denom, 0.0)
+
+
+def volatility(scores: np.ndarray) -> np.ndarray:
+    """
+    Standard deviation of session-to-session score changes, per column.
+    """
+    out = np.zeros(scores.shape[1])
+    if scores.shape[0] < 2:
+        return out
+    changes = np.diff(_forward_fill(scores), axis=0)
+    # A change only counts where the skill was scored in the later session.
+    changes[np.isnan(scores[1:])] = np.nan
+    valid = (~np.isnan(changes)).any(axis=0)
+    if valid.any():
+        out[valid] = np.nanstd(changes[:, valid], axis=0)
+    return out
+
+
+def skill_trend_stats(
+    matrix: SkillScoreMatrix,
+    *,
+    window: int = 3,
+    alpha: float = 0.5,
+) -> SkillTrendStats:
+    scores = matrix.scores
+    if scores.shape[0] == 0:
+        empty = np.empty(0)
+        return SkillTrendStats(
+            skills=matrix.skills,
+            sessions=np.empty(0, dtype=np.int64),
+            average=empty,
+            latest=empty,
+            rolling_mean=empty,
+            ewma=empty,
+            slope=empty,
+            volatility=empty,
+        )
+
+    mask = ~np.isnan(scores)
+    counts = mask.sum(axis=0)
+    last_idx = scores.shape[0] - 1 - np.argmax(mask[::-1], axis=0)
+    cols = np.arange(scores.shape[1])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        average = np.where(counts > 0, np.nansum(scores, axis=0) / counts, np.nan)
+
+    return SkillTrendStats(
+        skills=matrix.skills,
+        sessions=counts,
+        average=average,
+        latest=scores[last_idx, cols],
+        rolling_mean=rolling_mean(scores, window)[last_idx, cols],
+        ewma=ewma(scores, alpha)[-1],
+        slope=least_squares_slope(scores),
+        volatility=volatility(scores),
+    )
+
+
+def cohort_percentiles(
+    values: np.ndarray,
+    cohort: np.ndarray,
+) -> np.ndarray:
+    """
+    Percentile rank (0-100) of each value within its cohort column.
+
+    `cohort` is (n_members, n_skills) with NaN for members lacking a skill;
+    ties count half, as in scipy's `percentileofscore(kind="mean")`.
+    """
+    valid = ~np.isnan(cohort)
+    below = ((cohort < values) & valid).sum(axis=0)
+    equal = ((cohort == values) & valid).sum(axis=0)
+    n = valid.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(n > 0, 100.0 * (below + 0.5 * equal) / n, np.nan)
+
+
+def load_cohort_means(db: Session, skills: Sequence[str]) -> np.ndarray:
+    """
+    Per-user mean score for each of `skills`, as an (n_users, n_skills) array.
+    """
+    rows = list_cohort_skill_means(db)
+    column = {name: i for i, name in enumerate(skills)}
+    rows = [r for r in rows if r[1] in column]
+    if not rows:
+        return np.empty((0, len(skills)))
+
+    user_col = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+    skill_col = np.fromiter((column[r[1]] for r in rows), dtype=np.int64, count=len(rows))
+    mean_col = np.fromiter((r[2] for r in rows), dtype=np.float64, count=len(rows))
+
+    _, user_idx = np.unique(user_col, return_inverse=True)
+    cohort = np.full((user_idx.max() + 1, len(skills)), np.nan)
+    cohort[user_idx, skill_col] = mean_col
+    return cohort
+
+
+def build_skill_trends(db: Session, *, user_id: int) -> list[SkillTrendItem]:
+    """
+    Trend statistics for a user's skills, ranked against per-user cohort means.
+    """
+    matrix = load_score_matrix(db, user_id=user_id)
+    if not matrix.skills:
+        return []
+
+    stats = skill_trend_stats(matrix)
+    percentiles = cohort_percentiles(stats.average, load_cohort_means(db, matrix.skills))
+
+    return [
+        SkillTrendItem(
+            skill_name=name,
+            sessions=int(stats.sessions[i]),
+            average_score=round(float(stats.average[i]), 2),
+            latest_score=round(float(stats.latest[i]), 2),
+            rolling_mean=round(float(stats.rolling_mean[i]), 2),
+            ewma=round(float(stats.ewma[i]), 2),
+            slope=round(float(stats.slope[i]), 3),
+            volatility=round(float(stats.volatility[i]), 2),
+            cohort_percentile=None if np.isnan(percentiles[i]) else round(float(percentiles[i]), 1),
+        )
+        for i, name in enumerate(stats.skills)
+    ]
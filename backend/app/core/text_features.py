@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Iterable
+
+
+# Phrase groups the heuristic scorers look for (matched as substrings; lowercase,
+# and case-insensitively unless the scorer asks otherwise).
+QUESTION_PROMPTS = ("why", "how", "design", "explain")
+REASONING_MARKERS = ("because", "so that")
+IMPACT_MARKERS = ("impact", "result")
+FILLERS = ("uh", "idk", "don't know")
+HEDGES = ("i think", "maybe", "not sure")
+CONFIDENCE_MARKERS = ("definitely", "confident", "certain")
+UNCERTAINTY_MARKERS = ("i don't know", "not sure", "no idea", "can't remember")
+SECTION_HEADINGS = ("experience", "education", "skills", "projects", "summary")
+
+
+class TextFeatures:
+    """
+    Feature record for one piece of text, read by the heuristic scorers (ATS,
+    answer evaluation, follow-up detection).
+
+    The text is lowercased once (`original` keeps it as given, for
+    case-sensitive lookups); `chars` ignores surrounding whitespace. Counts
+    and phrase lookups are computed on first use and memoised, so a scorer
+    pays only for the features it reads, a phrase shared by several groups
+    ("not sure") is searched for once, and `has_any` still stops at the first
+    hit.
+    """
+
+    __slots__ = ("original", "text", "chars", "_found", "__dict__")
+
+    def __init__(self, text: str) -> None:
+        self.original = text or ""
+        self.text = self.original.lower()
+        self.chars = len(self.text.strip())
+        self._found: dict[tuple[str, bool], bool] = {}
+
+    @cached_property
+    def tokens(self) -> int:
+        """
+        Whitespace-separated tokens.
+        """
+        return len(self.text.split())
+
+    @cached_property
+    def sentences(self) -> int:
+        """
+        Sentence-ending punctuation marks.
+        """
+        return self.text.count(".") + self.text.count("!") + self.text.count("?")
+
+    @cached_property
+    def bullets(self) -> int:
+        """
+        "•" bullets and "- " list markers.
+        """
+        return self.text.count("•") + self.text.count("- ")
+
+    def contains(self, phrase: str, *, match_case: bool = False) -> bool:
+        key = (phrase, match_case)
+        found = self._found.get(key)
+        if found is None:
+            found = self._found[key] = phrase in (self.original if match_case else self.text)
+        return found
+
+    def has_any(self, phrases: Iterable[str], *, match_case: bool = False) -> bool:
+        return any(self.contains(p, match_case=match_case) for p in phrases)
+
+    def count_present(self, phrases: Iterable[str]) -> int:
+        """
+        Number of entries of `phrases` (keywords, section headings) that occur
+        at least once.
+        """
+        return sum(1 for p in phrases if self.contains(p))
+
+
+def extract_features(text: str) -> TextFeatures:
+    """
+    Feature record for `text`. Cheap to build: nothing is computed until a
+    scorer asks for it.
+    """
+    return TextFeatures(text)
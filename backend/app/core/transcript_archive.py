@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.crud.interview import archive_transcripts, list_archivable_session_ids
+from app.db.session import SessionLocal
+
+
+logger = logging.getLogger("app.transcript_archive")
+
+transcripts_archived = registry.counter(
+    "transcripts_archived_total", "Ended interviews whose turns were moved to the compressed archive."
+)
+archive_raw_bytes = registry.counter(
+    "transcript_archive_raw_bytes_total", "Transcript bytes archived, before compression."
+)
+archive_stored_bytes = registry.counter(
+    "transcript_archive_stored_bytes_total", "Transcript bytes archived, after compression."
+)
+
+
+def archive_ended_transcripts(
+    db: Session,
+    *,
+    older_than: timedelta,
+    batch_size: int,
+    codec: str,
+    now: Optional[datetime] = None,
+) -> int:
+    """
+    Move the turns of sessions ended more than `older_than` ago into the
+    compressed archive, `batch_size` sessions per transaction, and return how
+    many sessions were archived.
+
+    Reports and `crud.interview.list_turns` read archived transcripts
+    transparently, so this only changes where the turns live.
+    """
+    now = now or datetime.utcnow()
+    ended_before = now - older_than
+    archived = 0
+    while True:
+        session_ids = list_archivable_session_ids(db, ended_before=ended_before, limit=batch_size)
+        if not session_ids:
+            break
+        raw, stored = archive_transcripts(db, session_ids, codec=codec, archived_at=now)
+        archived += len(session_ids)
+        transcripts_archived.inc(len(session_ids))
+        archive_raw_bytes.inc(raw)
+        archive_stored_bytes.inc(stored)
+        if len(session_ids) < batch_size:
+            break
+
+    if archived:
+        logger.info("Archived the transcripts of %d ended interviews", archived)
+    return archived
+
+
+class TranscriptArchiver:
+    """
+    Runs `archive_ended_transcripts` on a background thread every `interval`
+    seconds.
+    """
+
+    def __init__(self) -> None:
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> int:
+        db = SessionLocal()
+        try:
+            return archive_ended_transcripts(
+                db,
+                older_than=timedelta(days=settings.TRANSCRIPT_ARCHIVE_AFTER_DAYS),
+                batch_size=settings.TRANSCRIPT_ARCHIVE_BATCH_SIZE,
+                codec=settings.TRANSCRIPT_ARCHIVE_CODEC,
+            )
+        finally:
+            db.close()
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Transcript archiving failed; will retry")
+
+    def start(self, interval: float) -> None:
+        if self._thread is not None or interval <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="transcript-archiver", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+
+transcript_archiver = TranscriptArchiver()
@@ -0,0 +1,71 @@
+"""
+Compact encoding for archived transcripts.
+
+A transcript is stored as one compressed JSON array of
+`[turn_index, role, content, created_at]` rows. zlib is always available;
+zstd needs the optional `zstandard` package and compresses better and
+faster.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from datetime import datetime
+from typing import Iterable, NamedTuple
+
+try:
+    import zstandard
+except Exception:  # pragma: no cover - optional
+    zstandard = None  # type: ignore[assignment]
+
+
+CODECS = ("zlib", "zstd")
+
+_ZLIB_LEVEL = 6
+_ZSTD_LEVEL = 9
+
+
+class PackedTurn(NamedTuple):
+    turn_index: int
+    role: str
+    content: str
+    created_at: datetime
+
+
+def zstd_available() -> bool:
+    return zstandard is not None
+
+
+def _check_codec(codec: str) -> None:
+    if codec not in CODECS:
+        raise ValueError(f"Unsupported transcript codec: {codec}")
+    if codec == "zstd" and zstandard is None:
+        raise RuntimeError("The zstd transcript codec requires the 'zstandard' package")
+
+
+def pack_turns(turns: Iterable[PackedTurn], codec: str = "zlib") -> tuple[bytes, int]:
+    """
+    Compress `turns` (in turn order); returns the blob and its raw size.
+    """
+    _check_codec(codec)
+    raw = json.dumps(
+        [[t.turn_index, t.role, t.content, t.created_at.isoformat()] for t in turns],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(raw), len(raw)
+    return zlib.compress(raw, _ZLIB_LEVEL), len(raw)
+
+
+def unpack_turns(data: bytes, codec: str) -> list[PackedTurn]:
+    _check_codec(codec)
+    if codec == "zstd":
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        raw = zlib.decompress(data)
+    return [
+        PackedTurn(turn_index, role, content, datetime.fromisoformat(created_at))
+        for turn_index, role, content, created_at in json.loads(raw)
+    ]
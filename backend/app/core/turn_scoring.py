@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+
+from app.core.answer_evaluation import evaluate_answer
+from app.core.config import settings
+from app.crud.interview import add_turn_evaluation
+from app.db.session import SessionLocal
+
+
+logger = logging.getLogger("app.turn_scoring")
+
+
+def score_turn(
+    *,
+    session_id: int,
+    turn_index: int,
+    question: str,
+    answer: str,
+    target_role: str | None = None,
+) -> None:
+    """
+    Evaluate one submitted answer and store the scores.
+
+    Runs on the scoring pool (see `submit_scoring`), so it opens its own
+    database session instead of borrowing the request's.
+    """
+    evaluation = evaluate_answer(question=question, answer=answer, target_role=target_role)
+
+    db = SessionLocal()
+    try:
+        add_turn_evaluation(
+            db,
+            session_id=session_id,
+            turn_index=turn_index,
+            evaluation=evaluation,
+        )
+    except IntegrityError:
+        # Already scored (e.g. a retried submit); keep the first evaluation.
+        db.rollback()
+    except Exception:
+        db.rollback()
+        logger.exception("Failed to store evaluation for session %s turn %s", session_id, turn_index)
+    finally:
+        db.close()
+
+
+# Answers are scored on their own pool so evaluation overlaps next-question
+# generation instead of queueing behind it or behind the response.
+_scoring_pool = ThreadPoolExecutor(
+    max_workers=max(1, settings.TURN_SCORING_WORKERS),
+    thread_name_prefix="turn-scoring",
+)
+_pending: dict[int, set[Future]] = {}
+_pending_lock = threading.Lock()
+
+
+def _forget(session_id: int, future: Future) -> None:
+    with _pending_lock:
+        futures = _pending.get(session_id)
+        if futures is not None:
+            futures.discard(future)
+            if not futures:
+                del _pending[session_id]
+
+
+def submit_scoring(
+    *,
+    session_id: int,
+    turn_index: int,
+    question: str,
+    answer: str,
+    target_role: str | None = None,
+) -> Future:
+    """
+    Start scoring an answer on the scoring pool and return its future.
+    """
+    future = _scoring_pool.submit(
+        score_turn,
+        session_id=session_id,
+        turn_index=turn_index,
+        question=question,
+        answer=answer,
+        target_role=target_role,
+    )
+    with _pending_lock:
+        _pending.setdefault(session_id, set()).add(future)
+    future.add_done_callback(lambda f: _forget(session_id, f))
+    return future
+
+
+def pending_scoring(session_id: int) -> int:
+    """
+    Answers of `session_id` still being scored in this process.
+    """
+    with _pending_lock:
+        return len(_pending.get(session_id, ()))
+
+
+def wait_for_scoring(session_id: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+    """
+    Block until in-flight scoring finishes: one session's, or all when
+    `session_id` is None, for at most `timeout` seconds. Returns False when
+    some scoring was still running at the timeout.
+    """
+    with _pending_lock:
+        if session_id is None:
+            futures = [f for fs in _pending.values() for f in fs]
+        else:
+            futures = list(_pending.get(session_id, ()))
+    if not futures:
+        return True
+    _, not_done = wait(futures, timeout=timeout)
+    return not not_done
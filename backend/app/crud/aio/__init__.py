@@ -0,0 +1,3 @@
+"""
+Async counterparts of the CRUD helpers, for request handlers using AsyncSession.
+"""
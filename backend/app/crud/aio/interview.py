@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.aio.resume import get_or_create_resume_text
+from app.crud.interview import has_turn_search_index, search_terms, turn_search_statement
+from app.models.interview import InterviewSession, InterviewTurn, TurnEvaluation
+
+
+async def create_session(
+    db: AsyncSession,
+    *,
+    user_id: Optional[int],
+    resume_text: str,
+    target_role: str,
+    difficulty: str,
+    personality_mode: str,
+    first_question: Optional[str] = None,
+) -> InterviewSession:
+    """
+    Create a session, optionally with its opening question as turn 0, in one
+    transaction. The resume text is stored once per distinct content.
+    """
+    session = InterviewSession(
+        user_id=user_id,
+        resume_text_id=await get_or_create_resume_text(db, resume_text),
+        target_role=target_role,
+        difficulty=difficulty,
+        personality_mode=personality_mode,
+        status="active",
+        question_index=0,
+        turn_count=0,
+    )
+    if first_question is not None:
+        session.turns.append(InterviewTurn(role="assistant", content=first_question, turn_index=0))
+        session.turn_count = 1
+    db.add(session)
+    await db.commit()
+    return session
+
+
+async def get_session(db: AsyncSession, session_id: int) -> Optional[InterviewSession]:
+    return await db.get(InterviewSession, session_id)
+
+
+async def end_session(db: AsyncSession, session: InterviewSession) -> InterviewSession:
+    session.status = "ended"
+    session.ended_at = datetime.utcnow()
+    await db.commit()
+    return session
+
+
+async def list_sessions_for_user(db: AsyncSession, user_id: int) -> list[InterviewSession]:
+    result = await db.execute(
+        select(InterviewSession)
+        .where(InterviewSession.user_id == user_id)
+        .order_by(InterviewSession.started_at.asc())
+    )
+    return list(result.scalars())
+
+
+async def list_recent_turns(db: AsyncSession, session_id: int, limit: int) -> list[InterviewTurn]:
+    """
+    The last `limit` turns of a session, oldest first.
+    """
+    result = await db.execute(
+        select(InterviewTurn)
+        .where(InterviewTurn.session_id == session_id)
+        .order_by(InterviewTurn.turn_index.desc())
+        .limit(limit)
+    )
+    rows = list(result.scalars())
+    rows.reverse()
+    return rows
+
+
+async def list_turns_after(db: AsyncSession, session_id: int, after_index: int) -> list[InterviewTurn]:
+    result = await db.execute(
+        select(InterviewTurn)
+        .where(InterviewTurn.session_id == session_id, InterviewTurn.turn_index > after_index)
+        .order_by(InterviewTurn.turn_index.asc())
+    )
+    return list(result.scalars())
+
+
+
+async def get_session_evaluations(
+    db: AsyncSession,
+    session_id: int,
+) -> Optional[tuple[Optional[int], Sequence[TurnEvaluation]]]:
+    """
+    The session's owner id and its stored answer evaluations (by turn index),
+    in one query. None if the session does not exist.
+    """
+    result = await db.execute(
+        select(InterviewSession.user_id, TurnEvaluation)
+        .outerjoin(TurnEvaluation, TurnEvaluation.session_id == InterviewSession.id)
+        .where(InterviewSession.id == session_id)
+        .order_by(TurnEvaluation.turn_index.asc())
+    )
+    rows = result.all()
+    if not rows:
+        return None
+    return rows[0][0], [evaluation for _, evaluation in rows if evaluation is not None]
+
+
+async def search_turns(db: AsyncSession, *, user_id: int, query: str, limit: int, offset: int = 0) -> list[Any]:
+    """
+    Async twin of crud.interview.search_turns.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+    conn = await db.connection()
+    fts = await conn.run_sync(has_turn_search_index)
+    stmt, params = turn_search_statement(terms, user_id=user_id, limit=limit, offset=offset, fts=fts)
+    result = await db.execute(stmt, params)
+    return list(result.all())
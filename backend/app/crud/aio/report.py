@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.report import SessionReport
+from app.schemas.report import InterviewReport
+
+
+async def get_report(db: AsyncSession, session_id: int) -> Optional[InterviewReport]:
+    payload = await db.scalar(select(SessionReport.payload).where(SessionReport.session_id == session_id))
+    if payload is None:
+        return None
+    return InterviewReport.model_validate_json(payload)
+
+
+async def get_reports_for_sessions(db: AsyncSession, session_ids: Iterable[int]) -> dict[int, InterviewReport]:
+    ids = list(session_ids)
+    if not ids:
+        return {}
+    result = await db.execute(
+        select(SessionReport.session_id, SessionReport.payload).where(SessionReport.session_id.in_(ids))
+    )
+    return {session_id: InterviewReport.model_validate_json(payload) for session_id, payload in result}
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.resume import resume_text_hash
+from app.models.resume import Resume, ResumeText
+
+
+async def get_or_create_resume_text(db: AsyncSession, content: str) -> int:
+    """
+    Id of the stored copy of `content`, inserting it on first use.
+
+    Must run before anything else is pending on `db`: a concurrent insert of
+    the same text is resolved by rolling back and reading the winner's row.
+    """
+    content_hash = resume_text_hash(content)
+    stmt = select(ResumeText.id).where(ResumeText.content_hash == content_hash)
+    existing = await db.scalar(stmt)
+    if existing is not None:
+        return existing
+
+    row = ResumeText(content_hash=content_hash, content=content)
+    db.add(row)
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        return await db.scalar(stmt)
+    return row.id
+
+
+async def get_resume_text(db: AsyncSession, resume_text_id: int) -> Optional[str]:
+    return await db.scalar(select(ResumeText.content).where(ResumeText.id == resume_text_id))
+
+
+async def create_resume(
+    db: AsyncSession,
+    *,
+    user_id: int,
+    original_filename: str,
+    stored_filename: str,
+    content_type: str,
+    size_bytes: int,
+    storage_path: str,
+) -> Resume:
+    resume = Resume(
+        user_id=user_id,
+        original_filename=original_filename,
+        stored_filename=stored_filename,
+        content_type=content_type,
+        size_bytes=size_bytes,
+        storage_path=storage_path,
+    )
+    db.add(resume)
+    await db.commit()
+    await db.refresh(resume)
+    return resume
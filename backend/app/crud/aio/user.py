@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.password_hashing import check_password, hash_password
+from app.db.session import release_connection
+from app.models.user import User
+from app.schemas.user import UserCreate
+
+
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+    result = await db.execute(select(User).where(User.email == email).limit(1))
+    return result.scalars().first()
+
+
+async def create_user(db: AsyncSession, user_in: UserCreate) -> User:
+    # bcrypt is CPU-bound; it runs on the bounded hashing pool and may raise
+    # PasswordHashingBusy. Callers usually looked the email up first; don't
+    # hold that connection while the hash waits its turn.
+    await release_connection(db)
+    hashed_password = await hash_password(user_in.password)
+    db_user = User(
+        email=user_in.email,
+        full_name=user_in.full_name,
+        hashed_password=hashed_password,
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
+
+
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
+    user = await get_user_by_email(db, email=email)
+    if not user:
+        return None
+    # The check may queue behind other logins; don't hold a connection meanwhile.
+    await release_connection(db)
+    if not await check_password(password, user.hashed_password):
+        return None
+    return user
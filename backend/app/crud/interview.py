@@ -1,11 +1,35 @@
 from __future__ import annotations
 
+import re
+from collections import defaultdict
 from datetime import datetime
-from typing import Optional
+from typing import Any, Iterator, Optional, Sequence
 
+from sqlalchemy import delete, func, insert, literal, select, text, tuple_, update
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.models.interview import InterviewSession, InterviewTurn
+from app.core.transcript_codec import PackedTurn, pack_turns, unpack_turns
+from app.crud.resume import get_or_create_resume_text
+from app.models.interview import InterviewSession, InterviewTurn, TranscriptArchive, TurnEvaluation
+from app.schemas.answer_evaluation import AnswerEvaluationResponse
+
+
+# Attempts at claiming turn indexes before giving up on a contended session.
+TURN_COUNTER_RETRIES = 5
+
+# FTS5 index over the turns of signed-in users' sessions (migration 0009).
+TURN_SEARCH_TABLE = "interview_turn_search"
+SEARCH_MAX_TERMS = 16
+SEARCH_HIGHLIGHT = ("[", "]")
+_SEARCH_TERM = re.compile(r"\w+")
+
+
+class TurnCounterConflict(RuntimeError):
+    """
+    Raised when a session's turn counter keeps moving under a writer.
+    """
 
 
 def create_session(
@@ -16,16 +40,25 @@ def create_session(
     target_role: str,
     difficulty: str,
     personality_mode: str,
+    first_question: Optional[str] = None,
 ) -> InterviewSession:
+    """
+    Create a session, optionally with its opening question as turn 0, in one
+    transaction. The resume text is stored once per distinct content.
+    """
     session = InterviewSession(
         user_id=user_id,
-        resume_text=resume_text,
+        resume_text_id=get_or_create_resume_text(db, resume_text),
         target_role=target_role,
         difficulty=difficulty,
         personality_mode=personality_mode,
         status="active",
         question_index=0,
+        turn_count=0,
     )
+    if first_question is not None:
+        session.turns.append(InterviewTurn(role="assistant", content=first_question, turn_index=0))
+        session.turn_count = 1
     db.add(session)
     db.commit()
     db.refresh(session)
@@ -38,17 +71,16 @@ def get_session(db: Session, session_id: int) -> Optional[InterviewSession]:
 
 def add_turn(
     db: Session,
+    session: InterviewSession,
     *,
-    session_id: int,
     role: str,
     content: str,
-    turn_index: int,
 ) -> InterviewTurn:
     turn = InterviewTurn(
-        session_id=session_id,
+        session_id=session.id,
         role=role,
         content=content,
-        turn_index=turn_index,
+        turn_index=reserve_turn_indexes(db, session, 1),
     )
     db.add(turn)
     db.commit()
@@ -57,20 +89,231 @@ def add_turn(
 
 
 def list_turns(db: Session, session_id: int) -> list[InterviewTurn]:
-    return (
+    """
+    All turns of a session in order, from the hot table or, for an archived
+    session, unpacked from its TranscriptArchive row (as detached objects).
+    """
+    turns = (
         db.query(InterviewTurn)
         .filter(InterviewTurn.session_id == session_id)
         .order_by(InterviewTurn.turn_index.asc())
         .all()
     )
+    if turns:
+        return turns
+    archive = db.get(TranscriptArchive, session_id)
+    if archive is None:
+        return turns
+    return [
+        InterviewTurn(
+            session_id=session_id,
+            turn_index=t.turn_index,
+            role=t.role,
+            content=t.content,
+            created_at=t.created_at,
+        )
+        for t in unpack_turns(archive.data, archive.codec)
+    ]
 
 
-def set_question_index(db: Session, session: InterviewSession, question_index: int) -> InterviewSession:
-    session.question_index = question_index
-    db.add(session)
+def list_recent_turns(db: Session, session_id: int, limit: int) -> list[InterviewTurn]:
+    """
+    The last `limit` turns of a session, oldest first.
+    """
+    rows = (
+        db.query(InterviewTurn)
+        .filter(InterviewTurn.session_id == session_id)
+        .order_by(InterviewTurn.turn_index.desc())
+        .limit(limit)
+        .all()
+    )
+    rows.reverse()
+    return rows
+
+
+def list_turns_after(db: Session, session_id: int, after_index: int) -> list[InterviewTurn]:
+    return (
+        db.query(InterviewTurn)
+        .filter(InterviewTurn.session_id == session_id, InterviewTurn.turn_index > after_index)
+        .order_by(InterviewTurn.turn_index.asc())
+        .all()
+    )
+
+
+def reserve_turn_indexes(
+    db: Session,
+    session: InterviewSession,
+    count: int,
+    *,
+    question_index: Optional[int] = None,
+    activity_at: Optional[datetime] = None,
+) -> int:
+    """
+    Claim `count` consecutive turn indexes for `session` and return the first.
+
+    See `claim_turn_indexes`; the session object's counters are updated to
+    match.
+    """
+    activity_at = activity_at or datetime.utcnow()
+    first = claim_turn_indexes(
+        db,
+        session.id,
+        count,
+        expected=session.turn_count,
+        question_index=question_index,
+        activity_at=activity_at,
+    )
+    set_committed_value(session, "turn_count", first + count)
+    set_committed_value(session, "last_activity_at", activity_at)
+    if question_index is not None:
+        set_committed_value(session, "question_index", question_index)
+    return first
+
+
+def claim_turn_indexes(
+    db: Session,
+    session_id: int,
+    count: int,
+    *,
+    expected: int,
+    question_index: Optional[int] = None,
+    activity_at: Optional[datetime] = None,
+) -> int:
+    """
+    Claim `count` consecutive turn indexes and return the first. Does not
+    commit.
+
+    The counter moves with a compare-and-swap UPDATE on `turn_count`, starting
+    from the caller's `expected` value. If another writer moved it first, the
+    current value is re-read and the swap retried. `question_index` and
+    `activity_at` (the new `last_activity_at`), when given, are written by the
+    same statement.
+    """
+    values = {
+        "turn_count": InterviewSession.turn_count + count,
+        "last_activity_at": activity_at or datetime.utcnow(),
+    }
+    if question_index is not None:
+        values["question_index"] = question_index
+
+    for _ in range(TURN_COUNTER_RETRIES):
+        result = db.execute(
+            update(InterviewSession)
+            .where(InterviewSession.id == session_id, InterviewSession.turn_count == expected)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 1:
+            return expected
+        expected = db.execute(
+            select(InterviewSession.turn_count).where(InterviewSession.id == session_id)
+        ).scalar_one()
+
+    raise TurnCounterConflict(f"Could not claim turn indexes for session {session_id}")
+
+
+def release_turn_indexes(db: Session, session_id: int, first: int, count: int) -> bool:
+    """
+    Give back indexes claimed by `claim_turn_indexes` whose turns will never
+    be written, if no later claim was made. Returns False (leaving a gap in
+    the numbering) otherwise. Does not commit.
+    """
+    result = db.execute(
+        update(InterviewSession)
+        .where(InterviewSession.id == session_id, InterviewSession.turn_count == first + count)
+        .values(turn_count=first)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def stage_exchanges(
+    db: Session,
+    session_id: int,
+    exchanges: Sequence[tuple[int, str, str, datetime]],
+    *,
+    question_index: int,
+    summary: Optional[str] = None,
+) -> bool:
+    """
+    Add (answer turn index, answer, next question, submitted at) exchanges to
+    `db` without committing, as one multi-row insert, and set the session's
+    question index (and live summary, when given). Returns False, writing
+    nothing, when the session no longer exists.
+
+    The answer and question take the answer's index and the one after it,
+    both already claimed from the session's counter (`claim_turn_indexes`);
+    the (session_id, turn_index) unique constraint rejects anything that
+    slips past it.
+    """
+    if not exchanges:
+        return True
+    values: dict[str, Any] = {"question_index": question_index}
+    if summary is not None:
+        values["live_summary"] = summary
+    result = db.execute(
+        update(InterviewSession)
+        .where(InterviewSession.id == session_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        return False
+    rows = []
+    for index, answer, question, created_at in exchanges:
+        for role, content, turn_index in (("user", answer, index), ("assistant", question, index + 1)):
+            rows.append(
+                {
+                    "session_id": session_id,
+                    "role": role,
+                    "content": content,
+                    "turn_index": turn_index,
+                    "created_at": created_at,
+                }
+            )
+    db.execute(insert(InterviewTurn), rows)
+    return True
+
+
+def append_exchange(
+    db: Session,
+    session: InterviewSession,
+    *,
+    answer: str,
+    question: str,
+    question_index: int,
+) -> int:
+    """
+    Write a user answer and the next question, and set the session's
+    question index, in one transaction. Returns the answer's turn index.
+
+    For writers outside the active-session cache; the live routes claim
+    indexes up front and stage exchanges through the write-behind queue.
+    """
+    first = reserve_turn_indexes(db, session, 2)
+    stage_exchanges(db, session.id, [(first, answer, question, datetime.utcnow())], question_index=question_index)
     db.commit()
-    db.refresh(session)
-    return session
+    set_committed_value(session, "question_index", question_index)
+    return first
+
+
+def bulk_insert_sessions(db: Session, rows: Sequence[dict]) -> list[int]:
+    """
+    Insert session rows in one batched statement and return their ids in
+    row order. Does not commit.
+    """
+    if not rows:
+        return []
+    stmt = insert(InterviewSession).returning(InterviewSession.id, sort_by_parameter_order=True)
+    return list(db.scalars(stmt, list(rows)))
+
+
+def bulk_insert_turns(db: Session, rows: Sequence[dict]) -> None:
+    """
+    Insert turn rows with one executemany. Does not commit.
+    """
+    if rows:
+        db.execute(insert(InterviewTurn), list(rows))
 
 
 def end_session(db: Session, session: InterviewSession) -> InterviewSession:
@@ -82,6 +325,141 @@ def end_session(db: Session, session: InterviewSession) -> InterviewSession:
     return session
 
 
+def list_idle_sessions(
+    db: Session,
+    *,
+    idle_since: datetime,
+    limit: int,
+    after: Optional[tuple[datetime, int]] = None,
+) -> list[tuple[int, datetime]]:
+    """
+    (id, last_activity_at) of active sessions with no activity since
+    `idle_since`, oldest first. `after` is the (last_activity_at, id) of the
+    previous page's last row, for keyset paging past sessions left active.
+    """
+    stmt = (
+        select(InterviewSession.id, InterviewSession.last_activity_at)
+        .where(InterviewSession.status == "active", InterviewSession.last_activity_at < idle_since)
+        .order_by(InterviewSession.last_activity_at.asc(), InterviewSession.id.asc())
+        .limit(limit)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(InterviewSession.last_activity_at, InterviewSession.id) > tuple_(*after))
+    return [tuple(row) for row in db.execute(stmt)]
+
+
+def end_idle_sessions(
+    db: Session,
+    session_ids: Sequence[int],
+    *,
+    idle_since: datetime,
+    ended_at: datetime,
+) -> list[int]:
+    """
+    End the given sessions in one UPDATE, skipping any that became active
+    again since they were listed, and return the ids actually ended.
+    """
+    if not session_ids:
+        return []
+    db.execute(
+        update(InterviewSession)
+        .where(
+            InterviewSession.id.in_(session_ids),
+            InterviewSession.status == "active",
+            InterviewSession.last_activity_at < idle_since,
+        )
+        .values(status="ended", ended_at=ended_at)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    ended = db.scalars(
+        select(InterviewSession.id).where(
+            InterviewSession.id.in_(session_ids),
+            InterviewSession.ended_at == ended_at,
+        )
+    )
+    return list(ended)
+
+
+def list_archivable_session_ids(db: Session, *, ended_before: datetime, limit: int) -> list[int]:
+    """
+    Ids of sessions ended before `ended_before` whose turns are still in the
+    hot table, oldest first.
+    """
+    stmt = (
+        select(InterviewSession.id)
+        .where(InterviewSession.transcript_archived_at.is_(None), InterviewSession.ended_at < ended_before)
+        .order_by(InterviewSession.ended_at.asc())
+        .limit(limit)
+    )
+    return list(db.scalars(stmt))
+
+
+def archive_transcripts(
+    db: Session,
+    session_ids: Sequence[int],
+    *,
+    codec: str,
+    archived_at: datetime,
+) -> tuple[int, int]:
+    """
+    Pack each session's turns into a TranscriptArchive row, delete the hot
+    rows and mark the sessions archived, in one transaction: one read of the
+    turns, one multi-row insert, one DELETE and one UPDATE.
+
+    Returns the transcripts' total size before and after compression.
+    """
+    if not session_ids:
+        return 0, 0
+    rows = db.execute(
+        select(
+            InterviewTurn.session_id,
+            InterviewTurn.turn_index,
+            InterviewTurn.role,
+            InterviewTurn.content,
+            InterviewTurn.created_at,
+        )
+        .where(InterviewTurn.session_id.in_(session_ids))
+        .order_by(InterviewTurn.session_id, InterviewTurn.turn_index)
+    )
+    turns: dict[int, list[PackedTurn]] = defaultdict(list)
+    for session_id, *turn in rows:
+        turns[session_id].append(PackedTurn(*turn))
+
+    archives = []
+    for session_id in session_ids:
+        data, raw_size = pack_turns(turns[session_id], codec)
+        archives.append(
+            {
+                "session_id": session_id,
+                "codec": codec,
+                "turn_count": len(turns[session_id]),
+                "raw_size": raw_size,
+                "data": data,
+                "archived_at": archived_at,
+            }
+        )
+    db.execute(insert(TranscriptArchive), archives)
+    db.execute(
+        delete(InterviewTurn)
+        .where(InterviewTurn.session_id.in_(session_ids))
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        update(InterviewSession)
+        .where(InterviewSession.id.in_(session_ids))
+        .values(transcript_archived_at=archived_at)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return sum(a["raw_size"] for a in archives), sum(len(a["data"]) for a in archives)
+
+
+def count_sessions_by_status(db: Session) -> dict[str, int]:
+    stmt = select(InterviewSession.status, func.count()).group_by(InterviewSession.status)
+    return {status: count for status, count in db.execute(stmt)}
+
+
 def list_sessions_for_user(db: Session, user_id: int) -> list[InterviewSession]:
     return (
         db.query(InterviewSession)
@@ -90,3 +468,178 @@ def list_sessions_for_user(db: Session, user_id: int) -> list[InterviewSession]:
         .all()
     )
 
+
+def iter_session_batches(
+    db: Session,
+    *,
+    batch_size: int,
+    status: Optional[str] = None,
+    target_role: Optional[str] = None,
+    user_id: Optional[int] = None,
+    started_from: Optional[datetime] = None,
+    started_to: Optional[datetime] = None,
+) -> Iterator[list[InterviewSession]]:
+    """
+    Yield filtered sessions in id order, one keyset-paginated batch at a time.
+
+    Each batch is read in its own short transaction, which ends (and returns
+    the connection to the pool) before the batch is yielded, so a slow
+    consumer holds no read transaction open. Yielded sessions are detached,
+    with their columns loaded; memory holds one batch at a time.
+    """
+    last_id = 0
+    while True:
+        query = db.query(InterviewSession).filter(InterviewSession.id > last_id)
+        if status is not None:
+            query = query.filter(InterviewSession.status == status)
+        if target_role is not None:
+            query = query.filter(InterviewSession.target_role.ilike(f"%{target_role}%"))
+        if user_id is not None:
+            query = query.filter(InterviewSession.user_id == user_id)
+        if started_from is not None:
+            query = query.filter(InterviewSession.started_at >= started_from)
+        if started_to is not None:
+            query = query.filter(InterviewSession.started_at < started_to)
+
+        batch = query.order_by(InterviewSession.id.asc()).limit(batch_size).all()
+        db.expunge_all()
+        db.rollback()
+        if not batch:
+            return
+        last_id = batch[-1].id
+        yield batch
+
+
+def add_turn_evaluation(
+    db: Session,
+    *,
+    session_id: int,
+    turn_index: int,
+    evaluation: AnswerEvaluationResponse,
+) -> TurnEvaluation:
+    row = TurnEvaluation(
+        session_id=session_id,
+        turn_index=turn_index,
+        relevance=evaluation.relevance,
+        depth=evaluation.depth,
+        clarity=evaluation.clarity,
+        confidence=evaluation.confidence,
+        overall_score=evaluation.overall_score,
+        feedback=evaluation.feedback,
+    )
+    db.add(row)
+    db.commit()
+    # Not refreshed: the scoring pool discards the row, and reading it later
+    # reloads the expired attributes anyway.
+    return row
+
+
+def list_turn_evaluations(db: Session, session_id: int) -> list[TurnEvaluation]:
+    return (
+        db.query(TurnEvaluation)
+        .filter(TurnEvaluation.session_id == session_id)
+        .order_by(TurnEvaluation.turn_index.asc())
+        .all()
+    )
+
+
+# -- Transcript search ---------------------------------------------------------
+
+
+def search_terms(query: str) -> list[str]:
+    """
+    The words of a free-text query, lowercased, at most SEARCH_MAX_TERMS.
+    """
+    return [t.lower() for t in _SEARCH_TERM.findall(query)][:SEARCH_MAX_TERMS]
+
+
+def turn_search_match(terms: Sequence[str], *, user_id: int) -> str:
+    """
+    FTS5 MATCH expression: every term in a turn's content, within one
+    user's turns. Terms are quoted, so query syntax in the input is inert.
+    """
+    quoted = " ".join('"' + t.replace('"', '""') + '"' for t in terms)
+    return f"owner:u{int(user_id)} AND content:({quoted})"
+
+
+_FTS_SEARCH = text(
+    "SELECT f.session_id, f.turn_index, f.role,"
+    f" snippet({TURN_SEARCH_TABLE}, 0, :open, :close, '…', 16) AS snippet,"
+    f" bm25({TURN_SEARCH_TABLE}, 1.0, 0.0) AS score, s.target_role, s.started_at"
+    f" FROM {TURN_SEARCH_TABLE} f JOIN interview_sessions s ON s.id = f.session_id"
+    f" WHERE {TURN_SEARCH_TABLE} MATCH :match"
+    " ORDER BY score LIMIT :limit OFFSET :offset"
+)
+
+
+def turn_search_statement(
+    terms: Sequence[str],
+    *,
+    user_id: int,
+    limit: int,
+    offset: int,
+    fts: bool,
+) -> tuple[Any, dict[str, Any]]:
+    """
+    Statement and parameters for `search_turns`. Rows are (session_id,
+    turn_index, role, snippet, score, target_role, started_at), best first.
+
+    With `fts` False (no FTS5 index): every term as a case-insensitive
+    substring of a hot turn, newest interviews first, no ranking; archived
+    transcripts are not searched.
+    """
+    if fts:
+        return _FTS_SEARCH, {
+            "match": turn_search_match(terms, user_id=user_id),
+            "open": SEARCH_HIGHLIGHT[0],
+            "close": SEARCH_HIGHLIGHT[1],
+            "limit": limit,
+            "offset": offset,
+        }
+    stmt = (
+        select(
+            InterviewTurn.session_id,
+            InterviewTurn.turn_index,
+            InterviewTurn.role,
+            func.substr(InterviewTurn.content, 1, 200).label("snippet"),
+            literal(0.0).label("score"),
+            InterviewSession.target_role,
+            InterviewSession.started_at,
+        )
+        .join(InterviewSession, InterviewSession.id == InterviewTurn.session_id)
+        .where(InterviewSession.user_id == user_id, *(InterviewTurn.content.icontains(t) for t in terms))
+        .order_by(InterviewSession.started_at.desc(), InterviewTurn.turn_index.asc())
+        .limit(limit)
+        .offset(offset)
+    )
+    return stmt, {}
+
+
+_turn_search_index: dict[Engine, bool] = {}
+
+
+def has_turn_search_index(conn: Connection) -> bool:
+    """
+    Whether the database behind `conn` has the FTS5 index; looked up once
+    per engine (migrations run before workers start).
+    """
+    found = _turn_search_index.get(conn.engine)
+    if found is None:
+        found = conn.dialect.name == "sqlite" and conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": TURN_SEARCH_TABLE}
+        ).first() is not None
+        _turn_search_index[conn.engine] = found
+    return found
+
+
+def search_turns(db: Session, *, user_id: int, query: str, limit: int, offset: int = 0) -> list[Any]:
+    """
+    A user's turns (questions and answers, hot or archived) matching every
+    word of `query`, best match first, with a highlighted snippet.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+    fts = has_turn_search_index(db.connection())
+    stmt, params = turn_search_statement(terms, user_id=user_id, limit=limit, offset=offset, fts=fts)
+    return list(db.execute(stmt, params))
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.report import SessionReport, SkillScoreRecord
+from app.schemas.report import InterviewReport
+
+
+def get_report(db: Session, session_id: int) -> Optional[InterviewReport]:
+    row = db.query(SessionReport).filter(SessionReport.session_id == session_id).first()
+    if row is None:
+        return None
+    return InterviewReport.model_validate_json(row.payload)
+
+
+def get_reports_for_sessions(db: Session, session_ids: Iterable[int]) -> dict[int, InterviewReport]:
+    ids = list(session_ids)
+    if not ids:
+        return {}
+    rows = db.query(SessionReport).filter(SessionReport.session_id.in_(ids)).all()
+    return {row.session_id: InterviewReport.model_validate_json(row.payload) for row in rows}
+
+
+def save_report(
+    db: Session,
+    report: InterviewReport,
+    *,
+    user_id: Optional[int],
+    recorded_at: datetime,
+) -> None:
+    """
+    Persist a report and its skill scores; if another request stored one
+    first, keep that one.
+    """
+    db.add(SessionReport(session_id=report.interview_id, payload=report.model_dump_json()))
+    db.add_all(
+        SkillScoreRecord(
+            session_id=report.interview_id,
+            user_id=user_id,
+            skill_name=skill.name,
+            score=skill.score,
+            recorded_at=recorded_at,
+        )
+        for skill in report.skill_breakdown
+    )
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+
+
+def list_skill_score_rows(
+    db: Session,
+    *,
+    user_id: Optional[int] = None,
+) -> list[tuple[int, Optional[int], str, float]]:
+    """
+    (session_id, user_id, skill_name, score) tuples in chronological order.
+
+    Returns plain rows rather than ORM objects; callers pivot them into arrays.
+    """
+    stmt = select(
+        SkillScoreRecord.session_id,
+        SkillScoreRecord.user_id,
+        SkillScoreRecord.skill_name,
+        SkillScoreRecord.score,
+    ).order_by(SkillScoreRecord.recorded_at.asc(), SkillScoreRecord.session_id.asc())
+    if user_id is not None:
+        stmt = stmt.where(SkillScoreRecord.user_id == user_id)
+    return [tuple(row) for row in db.execute(stmt)]
+
+
+def list_cohort_skill_means(db: Session) -> list[tuple[int, str, float]]:
+    """
+    (user_id, skill_name, mean score) for every user with stored scores.
+    """
+    stmt = (
+        select(
+            SkillScoreRecord.user_id,
+            SkillScoreRecord.skill_name,
+            func.avg(SkillScoreRecord.score),
+        )
+        .where(SkillScoreRecord.user_id.is_not(None))
+        .group_by(SkillScoreRecord.user_id, SkillScoreRecord.skill_name)
+    )
+    return [(row[0], row[1], float(row[2])) for row in db.execute(stmt)]
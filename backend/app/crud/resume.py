@@ -1,8 +1,61 @@
 from __future__ import annotations
 
+import hashlib
+from typing import Iterable, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.models.resume import Resume
+from app.models.resume import Resume, ResumeText
+
+
+def resume_text_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def get_or_create_resume_text(db: Session, content: str) -> int:
+    """
+    Id of the stored copy of `content`, inserting it on first use.
+
+    Must run before anything else is pending on `db`: a concurrent insert of
+    the same text is resolved by rolling back and reading the winner's row.
+    """
+    content_hash = resume_text_hash(content)
+    stmt = select(ResumeText.id).where(ResumeText.content_hash == content_hash)
+    existing = db.scalar(stmt)
+    if existing is not None:
+        return existing
+
+    row = ResumeText(content_hash=content_hash, content=content)
+    db.add(row)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        return db.scalar(stmt)
+    return row.id
+
+
+def get_or_create_resume_texts(db: Session, contents: Iterable[str]) -> dict[str, int]:
+    """
+    Ids of the stored copies of `contents`, keyed by content hash, inserting
+    the missing ones with one multi-row insert. Does not commit.
+    """
+    by_hash = {resume_text_hash(c): c for c in contents}
+    if not by_hash:
+        return {}
+    lookup = select(ResumeText.content_hash, ResumeText.id).where(ResumeText.content_hash.in_(by_hash))
+    ids = dict(db.execute(lookup).all())
+    missing = [{"content_hash": h, "content": c} for h, c in by_hash.items() if h not in ids]
+    if missing:
+        db.execute(insert(ResumeText), missing)
+        ids = dict(db.execute(lookup).all())
+    return ids
+
+
+def get_resume_text(db: Session, resume_text_id: int) -> Optional[str]:
+    return db.scalar(select(ResumeText.content).where(ResumeText.id == resume_text_id))
 
 
 def create_resume(
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import declarative_base
 
+from app.db.migrations import migrate
 from app.db.session import engine
 
 
@@ -8,13 +9,11 @@ Base = declarative_base()
 
 def init_db() -> None:
     """
-    Initialize database schema.
+    Bring the database schema up to date by applying pending migrations.
 
-    Import models inside this function so Base is defined before models
-    reference it, avoiding circular imports.
+    A no-op (one version lookup) when the schema is already current. New
+    tables and columns need a migration in `app/db/migrations`; models are not
+    created from metadata.
     """
-    # Local imports to register models with Base metadata
-    from app import models  # noqa: F401
-
-    Base.metadata.create_all(bind=engine)
+    migrate(engine)
 
@@ -0,0 +1,150 @@
+"""
+Versioned schema migrations.
+
+Each `vNNNN_<name>.py` module in this package defines `upgrade(conn)` and is
+applied once, in version order, inside its own transaction; the applied
+versions are recorded in the `schema_version` table. Migrations are written
+against the schema as it was when they were added (never against the current
+models) and guard each step, so a database created by the old `create_all`
+bootstrap is brought up to date without recreating anything, and a migration
+interrupted part-way (SQLite commits some DDL implicitly) can be re-run.
+
+Run `python -m app.cli migrate` once per deploy before starting workers;
+workers only check that the schema is current.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import pkgutil
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select
+from sqlalchemy.engine import Connection, Engine
+
+
+logger = logging.getLogger("app.migrations")
+
+_version_metadata = MetaData()
+schema_version = Table(
+    "schema_version",
+    _version_metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class SchemaOutOfDate(RuntimeError):
+    """
+    Raised when the database is behind the migrations shipped with the code.
+    """
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+def discover() -> list[Migration]:
+    """
+    The migrations in this package, in version order.
+    """
+    migrations = []
+    for info in pkgutil.iter_modules(__path__):
+        prefix, _, name = info.name.partition("_")
+        if not (prefix.startswith("v") and prefix[1:].isdigit()):
+            continue
+        module = importlib.import_module(f"{__name__}.{info.name}")
+        migrations.append(Migration(version=int(prefix[1:]), name=name, upgrade=module.upgrade))
+    migrations.sort(key=lambda m: m.version)
+
+    expected = list(range(1, len(migrations) + 1))
+    if [m.version for m in migrations] != expected:
+        raise RuntimeError(f"Migration versions must be 1..{len(migrations)} without gaps or duplicates")
+    return migrations
+
+
+def current_version(conn: Connection) -> int:
+    """
+    Highest applied version; 0 for a database that was never migrated.
+    """
+    if not inspect(conn).has_table(schema_version.name):
+        return 0
+    return conn.execute(select(func.max(schema_version.c.version))).scalar() or 0
+
+
+def pending_migrations(db_engine: Engine) -> list[Migration]:
+    migrations = discover()
+    with db_engine.connect() as conn:
+        applied = current_version(conn)
+    return [m for m in migrations if m.version > applied]
+
+
+def migrate(db_engine: Optional[Engine] = None, *, target: Optional[int] = None) -> list[Migration]:
+    """
+    Apply pending migrations up to `target` (default: all) and return them.
+
+    Costs one version lookup when the schema is already current. Each
+    migration commits together with its `schema_version` row, so an
+    interrupted run resumes where it stopped.
+    """
+    if db_engine is None:
+        from app.db.session import engine as db_engine
+
+    todo = [m for m in pending_migrations(db_engine) if target is None or m.version <= target]
+    if not todo:
+        return []
+
+    _version_metadata.create_all(db_engine, checkfirst=True)
+    for migration in todo:
+        with db_engine.begin() as conn:
+            logger.info("Applying migration %04d %s", migration.version, migration.name)
+            migration.upgrade(conn)
+            conn.execute(
+                schema_version.insert().values(
+                    version=migration.version,
+                    name=migration.name,
+                    applied_at=datetime.utcnow(),
+                )
+            )
+    return todo
+
+
+def ensure_current(db_engine: Optional[Engine] = None) -> None:
+    """
+    Raise SchemaOutOfDate unless every migration has been applied.
+    """
+    if db_engine is None:
+        from app.db.session import engine as db_engine
+
+    todo = pending_migrations(db_engine)
+    if todo:
+        names = ", ".join(f"{m.version:04d}_{m.name}" for m in todo)
+        raise SchemaOutOfDate(f"Database schema is behind ({names}); run `python -m app.cli migrate`")
+
+
+# -- Helpers for migration scripts --------------------------------------------
+
+
+def has_table(conn: Connection, table: str) -> bool:
+    return inspect(conn).has_table(table)
+
+
+def has_column(conn: Connection, table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(conn).get_columns(table))
+
+
+def has_index(conn: Connection, table: str, name: str) -> bool:
+    """
+    True if `table` has an index or unique constraint called `name`.
+    """
+    inspector = inspect(conn)
+    names = {i["name"] for i in inspector.get_indexes(table)}
+    names |= {u["name"] for u in inspector.get_unique_constraints(table)}
+    return name in names
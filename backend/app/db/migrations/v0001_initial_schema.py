@@ -0,0 +1,69 @@
+"""
+Users, uploaded resumes, interview sessions and their turns, as first shipped.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, MetaData, String, Table, Text
+from sqlalchemy.engine import Connection
+
+
+metadata = MetaData()
+
+Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("email", String(255), unique=True, index=True, nullable=False),
+    Column("full_name", String(255), nullable=True),
+    Column("hashed_password", String(255), nullable=False),
+    Column("is_active", Boolean, default=True, nullable=False),
+    Column("is_superuser", Boolean, default=False, nullable=False),
+    Column("created_at", DateTime, default=datetime.utcnow, nullable=False),
+    Column("updated_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+
+Table(
+    "resumes",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.id"), nullable=False, index=True),
+    Column("original_filename", String(512), nullable=False),
+    Column("stored_filename", String(512), nullable=False),
+    Column("content_type", String(128), nullable=False),
+    Column("size_bytes", Integer, nullable=False),
+    Column("storage_path", String(1024), nullable=False),
+    Column("created_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+
+Table(
+    "interview_sessions",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.id"), nullable=True, index=True),
+    Column("target_role", String(255), nullable=False),
+    Column("difficulty", String(32), nullable=False),
+    Column("personality_mode", String(32), nullable=False),
+    Column("resume_text", Text, nullable=False),
+    Column("status", String(32), default="active", nullable=False),
+    Column("question_index", Integer, default=0, nullable=False),
+    Column("started_at", DateTime, default=datetime.utcnow, nullable=False),
+    Column("ended_at", DateTime, nullable=True),
+)
+
+Table(
+    "interview_turns",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("session_id", Integer, ForeignKey("interview_sessions.id"), nullable=False, index=True),
+    Column("role", String(16), nullable=False),
+    Column("content", Text, nullable=False),
+    Column("turn_index", Integer, nullable=False),
+    Column("created_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+
+
+def upgrade(conn: Connection) -> None:
+    metadata.create_all(conn, checkfirst=True)
@@ -0,0 +1,35 @@
+"""
+Per-answer scores, written as the interview runs.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, MetaData, Table, Text, UniqueConstraint
+from sqlalchemy.engine import Connection
+
+
+metadata = MetaData()
+
+Table("interview_sessions", metadata, Column("id", Integer, primary_key=True))
+
+Table(
+    "turn_evaluations",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("session_id", Integer, ForeignKey("interview_sessions.id"), nullable=False, index=True),
+    Column("turn_index", Integer, nullable=False),
+    Column("relevance", Float, nullable=False),
+    Column("depth", Float, nullable=False),
+    Column("clarity", Float, nullable=False),
+    Column("confidence", Float, nullable=False),
+    Column("overall_score", Float, nullable=False),
+    Column("feedback", Text, nullable=True),
+    Column("created_at", DateTime, default=datetime.utcnow, nullable=False),
+    UniqueConstraint("session_id", "turn_index", name="uq_turn_evaluations_session_turn"),
+)
+
+
+def upgrade(conn: Connection) -> None:
+    metadata.tables["turn_evaluations"].create(conn, checkfirst=True)
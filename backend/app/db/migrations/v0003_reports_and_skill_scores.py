@@ -0,0 +1,42 @@
+"""
+Persisted reports and the long-format skill score store.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, MetaData, String, Table, Text
+from sqlalchemy.engine import Connection
+
+
+metadata = MetaData()
+
+Table("users", metadata, Column("id", Integer, primary_key=True))
+Table("interview_sessions", metadata, Column("id", Integer, primary_key=True))
+
+Table(
+    "interview_reports",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("session_id", Integer, ForeignKey("interview_sessions.id"), nullable=False, unique=True, index=True),
+    Column("payload", Text, nullable=False),
+    Column("created_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+
+Table(
+    "skill_scores",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("session_id", Integer, ForeignKey("interview_sessions.id"), nullable=False, index=True),
+    Column("user_id", Integer, ForeignKey("users.id"), nullable=True),
+    Column("skill_name", String(128), nullable=False),
+    Column("score", Float, nullable=False),
+    Column("recorded_at", DateTime, nullable=False),
+    Index("ix_skill_scores_user_recorded", "user_id", "recorded_at"),
+)
+
+
+def upgrade(conn: Connection) -> None:
+    for name in ("interview_reports", "skill_scores"):
+        metadata.tables[name].create(conn, checkfirst=True)
@@ -0,0 +1,23 @@
+"""
+`interview_sessions.turn_count`: the next turn index, kept on the session row.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.db.migrations import has_column
+
+
+def upgrade(conn: Connection) -> None:
+    if has_column(conn, "interview_sessions", "turn_count"):
+        return
+    conn.execute(text("ALTER TABLE interview_sessions ADD COLUMN turn_count INTEGER NOT NULL DEFAULT 0"))
+    conn.execute(
+        text(
+            "UPDATE interview_sessions SET turn_count = ("
+            " SELECT COALESCE(MAX(t.turn_index) + 1, 0) FROM interview_turns t"
+            " WHERE t.session_id = interview_sessions.id)"
+        )
+    )
@@ -0,0 +1,19 @@
+"""
+One turn per (session_id, turn_index).
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.db.migrations import has_index
+
+
+def upgrade(conn: Connection) -> None:
+    # A unique index rather than a constraint: SQLite cannot add constraints
+    # to an existing table. Fails if duplicate turns already exist.
+    if not has_index(conn, "interview_turns", "uq_interview_turns_session_turn"):
+        conn.execute(
+            text("CREATE UNIQUE INDEX uq_interview_turns_session_turn ON interview_turns (session_id, turn_index)")
+        )
@@ -0,0 +1,29 @@
+"""
+`interview_sessions.last_activity_at`, read by the idle-session reaper.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.db.migrations import has_column, has_index
+
+
+def upgrade(conn: Connection) -> None:
+    if not has_column(conn, "interview_sessions", "last_activity_at"):
+        conn.execute(text("ALTER TABLE interview_sessions ADD COLUMN last_activity_at TIMESTAMP"))
+        # Latest turn, or the start time for sessions without turns.
+        conn.execute(
+            text(
+                "UPDATE interview_sessions SET last_activity_at = COALESCE("
+                " (SELECT MAX(t.created_at) FROM interview_turns t WHERE t.session_id = interview_sessions.id),"
+                " started_at)"
+            )
+        )
+        if conn.dialect.name != "sqlite":
+            conn.execute(text("ALTER TABLE interview_sessions ALTER COLUMN last_activity_at SET NOT NULL"))
+    if not has_index(conn, "interview_sessions", "ix_interview_sessions_last_activity_at"):
+        conn.execute(
+            text("CREATE INDEX ix_interview_sessions_last_activity_at ON interview_sessions (last_activity_at)")
+        )
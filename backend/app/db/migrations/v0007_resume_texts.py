@@ -0,0 +1,65 @@
+"""
+Resume text stored once per distinct content in `resume_texts`; sessions
+reference it through `resume_text_id` instead of carrying a copy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, Text, select, text
+from sqlalchemy.engine import Connection
+
+from app.db.migrations import has_column, has_index
+
+
+metadata = MetaData()
+
+resume_texts = Table(
+    "resume_texts",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("content_hash", String(64), nullable=False, unique=True),
+    Column("content", Text, nullable=False),
+    Column("created_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+
+
+def upgrade(conn: Connection) -> None:
+    resume_texts.create(conn, checkfirst=True)
+
+    if not has_column(conn, "interview_sessions", "resume_text_id"):
+        conn.execute(
+            text("ALTER TABLE interview_sessions ADD COLUMN resume_text_id INTEGER REFERENCES resume_texts (id)")
+        )
+    if not has_index(conn, "interview_sessions", "ix_interview_sessions_resume_text_id"):
+        conn.execute(
+            text("CREATE INDEX ix_interview_sessions_resume_text_id ON interview_sessions (resume_text_id)")
+        )
+
+    if not has_column(conn, "interview_sessions", "resume_text"):
+        return
+
+    # Move each distinct text into resume_texts, then point sessions at it.
+    ids = dict(conn.execute(select(resume_texts.c.content_hash, resume_texts.c.id)).all())
+    distinct = conn.execute(
+        text("SELECT DISTINCT resume_text FROM interview_sessions WHERE resume_text_id IS NULL")
+    ).scalars().all()
+    for content in distinct:
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        if digest not in ids:
+            ids[digest] = conn.execute(
+                resume_texts.insert().values(content_hash=digest, content=content, created_at=datetime.utcnow())
+            ).inserted_primary_key[0]
+        conn.execute(
+            text(
+                "UPDATE interview_sessions SET resume_text_id = :id"
+                " WHERE resume_text_id IS NULL AND resume_text = :content"
+            ),
+            {"id": ids[digest], "content": content},
+        )
+
+    conn.execute(text("ALTER TABLE interview_sessions DROP COLUMN resume_text"))
+    if conn.dialect.name != "sqlite":
+        conn.execute(text("ALTER TABLE interview_sessions ALTER COLUMN resume_text_id SET NOT NULL"))
@@ -0,0 +1,44 @@
+"""
+Compressed archive of long-ended transcripts: `interview_transcript_archives`
+plus `interview_sessions.transcript_archived_at` and the index the archiver
+uses to find sessions that are due.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary, MetaData, String, Table, text
+from sqlalchemy.engine import Connection
+
+from app.db.migrations import has_column, has_index
+
+
+metadata = MetaData()
+
+Table("interview_sessions", metadata, Column("id", Integer, primary_key=True))
+
+Table(
+    "interview_transcript_archives",
+    metadata,
+    Column("session_id", Integer, ForeignKey("interview_sessions.id"), primary_key=True),
+    Column("codec", String(16), nullable=False),
+    Column("turn_count", Integer, nullable=False),
+    Column("raw_size", Integer, nullable=False),
+    Column("data", LargeBinary, nullable=False),
+    Column("archived_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+
+
+def upgrade(conn: Connection) -> None:
+    metadata.tables["interview_transcript_archives"].create(conn, checkfirst=True)
+
+    if not has_column(conn, "interview_sessions", "transcript_archived_at"):
+        conn.execute(text("ALTER TABLE interview_sessions ADD COLUMN transcript_archived_at TIMESTAMP"))
+    if not has_index(conn, "interview_sessions", "ix_interview_sessions_archive_due"):
+        conn.execute(
+            text(
+                "CREATE INDEX ix_interview_sessions_archive_due"
+                " ON interview_sessions (transcript_archived_at, ended_at)"
+            )
+        )
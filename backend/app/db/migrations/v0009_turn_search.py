@@ -0,0 +1,82 @@
+"""
+Full-text search over signed-in users' interview turns: the SQLite FTS5
+table `interview_turn_search`, filled by a trigger on `interview_turns` and
+backfilled from existing turns, hot and archived.
+
+The index keeps its own copy of the text, so archiving a transcript (which
+deletes its hot rows) leaves it searchable. Skipped on other databases and
+on SQLite builds without FTS5; search then falls back to LIKE over the hot
+table (see crud.interview.search_turns).
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+
+from app.core.transcript_codec import unpack_turns
+from app.db.migrations import has_table
+
+
+def upgrade(conn: Connection) -> None:
+    if conn.dialect.name != "sqlite" or has_table(conn, "interview_turn_search"):
+        return
+    try:
+        # `owner` holds one "u<user_id>" token so a user's rows are an index
+        # lookup intersected with the query terms.
+        conn.execute(
+            text(
+                "CREATE VIRTUAL TABLE interview_turn_search USING fts5("
+                " content, owner, session_id UNINDEXED, turn_index UNINDEXED, role UNINDEXED,"
+                " tokenize = 'porter unicode61 remove_diacritics 2')"
+            )
+        )
+    except OperationalError:
+        return  # no FTS5 in this SQLite build
+
+    conn.execute(
+        text(
+            "CREATE TRIGGER IF NOT EXISTS interview_turns_search_insert AFTER INSERT ON interview_turns"
+            " BEGIN"
+            " INSERT INTO interview_turn_search (content, owner, session_id, turn_index, role)"
+            " SELECT NEW.content, 'u' || s.user_id, NEW.session_id, NEW.turn_index, NEW.role"
+            " FROM interview_sessions s WHERE s.id = NEW.session_id AND s.user_id IS NOT NULL;"
+            " END"
+        )
+    )
+
+    conn.execute(
+        text(
+            "INSERT INTO interview_turn_search (content, owner, session_id, turn_index, role)"
+            " SELECT t.content, 'u' || s.user_id, t.session_id, t.turn_index, t.role"
+            " FROM interview_turns t JOIN interview_sessions s ON s.id = t.session_id"
+            " WHERE s.user_id IS NOT NULL"
+        )
+    )
+    archived = conn.execute(
+        text(
+            "SELECT a.session_id, s.user_id, a.codec, a.data"
+            " FROM interview_transcript_archives a JOIN interview_sessions s ON s.id = a.session_id"
+            " WHERE s.user_id IS NOT NULL"
+        )
+    )
+    for session_id, user_id, codec, data in archived:
+        rows = [
+            {
+                "content": t.content,
+                "owner": f"u{user_id}",
+                "session_id": session_id,
+                "turn_index": t.turn_index,
+                "role": t.role,
+            }
+            for t in unpack_turns(data, codec)
+        ]
+        if rows:
+            conn.execute(
+                text(
+                    "INSERT INTO interview_turn_search (content, owner, session_id, turn_index, role)"
+                    " VALUES (:content, :owner, :session_id, :turn_index, :role)"
+                ),
+                rows,
+            )
@@ -0,0 +1,20 @@
+"""
+Covering index for the cohort skill means: `list_cohort_skill_means` groups
+every stored score by (user_id, skill_name), and with this index SQLite
+reads the groups in order from the index alone instead of visiting each
+table row and sorting them in a temporary B-tree.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.db.migrations import has_index
+
+
+def upgrade(conn: Connection) -> None:
+    if not has_index(conn, "skill_scores", "ix_skill_scores_user_skill_score"):
+        conn.execute(
+            text("CREATE INDEX ix_skill_scores_user_skill_score ON skill_scores (user_id, skill_name, score)")
+        )
@@ -0,0 +1,17 @@
+"""
+`interview_sessions.live_summary`: the live interview's rolling summary of
+the turns before its prompt window, so a session reloaded into the
+active-session cache reads only the window instead of replaying older turns.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.db.migrations import has_column
+
+
+def upgrade(conn: Connection) -> None:
+    if not has_column(conn, "interview_sessions", "live_summary"):
+        conn.execute(text("ALTER TABLE interview_sessions ADD COLUMN live_summary TEXT NOT NULL DEFAULT ''"))
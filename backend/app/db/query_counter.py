@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.session import async_engine, async_read_engine, engine, read_engine
+
+
+@dataclass
+class QueryLog:
+    statements: list[str] = field(default_factory=list)
+    parameters: list[Any] = field(default_factory=list)  # driver parameters, per statement
+    checkouts: int = 0  # connections taken from the pools
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries(*engines: Engine | AsyncEngine) -> Iterator[QueryLog]:
+    """
+    Record every SQL statement executed on `engines` inside the block, and
+    every pool checkout; by default on the sync and async application
+    engines, read replica included.
+
+    Used by the query budget checks in `benchmarks/`; not meant for production
+    request paths.
+    """
+    log = QueryLog()
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        log.statements.append(statement)
+        log.parameters.append(parameters)
+
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        log.checkouts += 1
+
+    default = dict.fromkeys((engine, async_engine, read_engine, async_read_engine))
+    targets = [getattr(e, "sync_engine", e) for e in engines or default]
+    for target in targets:
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "checkout", _checkout)
+    try:
+        yield log
+    finally:
+        for target in targets:
+            event.remove(target, "before_cursor_execute", _before_cursor_execute)
+            event.remove(target, "checkout", _checkout)
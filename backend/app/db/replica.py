@@ -0,0 +1,191 @@
+"""
+Read-replica routing with read-your-writes.
+
+Sessions from `routing_session_class` send reads to a replica engine and
+flushes to the primary. Each read session carries consistency keys
+("user:<id>", "interview:<id>") for the request it serves; while any of them
+was written on the primary within the last `window` seconds, the session
+reads from the primary instead, and stays there for the rest of its life so
+a request never sees older data after newer data.
+
+Writes are recorded at commit time, per process, by `track_writes`: ORM
+changes by the objects' `user_id` / `session_id` (and a session's or user's
+own id), Core INSERT/UPDATE statements by the same keys in their
+parameters. With several worker processes, a user's next request may land
+on a worker that did not see the write; route users to a sticky worker or
+keep the replica lag below what they can notice.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Iterable, Optional, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+
+ConsistencyKeys = Union[Iterable[str], Callable[[], Iterable[str]]]
+
+# Session.info entries used by the routing and tracking hooks.
+_KEYS = "consistency_keys"
+_ON_PRIMARY = "reads_on_primary"
+_WRITTEN = "written_keys"
+
+# Tables whose rows identify themselves by `id`.
+_OWN_ID_KEYS = {"users": "user", "interview_sessions": "interview"}
+
+
+class RecentWrites:
+    """
+    Keys written on the primary in the last `window` seconds.
+
+    Expired keys are dropped when looked up, and all of them whenever the
+    table doubles in size, so it stays proportional to the recent writers.
+    """
+
+    _MIN_PRUNE_AT = 1024
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self._deadlines: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._prune_at = self._MIN_PRUNE_AT
+
+    def mark(self, keys: Iterable[str]) -> None:
+        now = time.monotonic()
+        deadline = now + self.window
+        with self._lock:
+            for key in keys:
+                self._deadlines[key] = deadline
+            if len(self._deadlines) > self._prune_at:
+                self._deadlines = {k: d for k, d in self._deadlines.items() if d > now}
+                self._prune_at = max(self._MIN_PRUNE_AT, 2 * len(self._deadlines))
+
+    def any_recent(self, keys: Iterable[str]) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                deadline = self._deadlines.get(key)
+                if deadline is None:
+                    continue
+                if deadline > now:
+                    return True
+                del self._deadlines[key]
+        return False
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+
+def consistency_keys(*, user_id: Optional[int] = None, interview_id: Optional[int] = None) -> list[str]:
+    keys = []
+    if user_id is not None:
+        keys.append(f"user:{user_id}")
+    if interview_id is not None:
+        keys.append(f"interview:{interview_id}")
+    return keys
+
+
+def set_consistency_keys(db, keys: ConsistencyKeys) -> None:
+    """
+    Keys whose recent writes must be visible to `db` (a sync or async
+    session). A callable is evaluated on each read until the session switches
+    to the primary, so it may depend on state resolved after the session was
+    created (e.g. the authenticated user).
+    """
+    getattr(db, "sync_session", db).info[_KEYS] = keys
+
+
+def routing_session_class(primary: Engine, replica: Engine, writes: RecentWrites) -> type[Session]:
+    """
+    A Session subclass that reads from `replica` unless the session's
+    consistency keys were written recently. Pass the sync engines; for
+    AsyncSession use it as `sync_session_class`.
+    """
+
+    class ReadRoutingSession(Session):
+        def get_bind(self, mapper=None, clause=None, **kw):
+            if self.info.get(_ON_PRIMARY):
+                return primary
+            if self._flushing or _wrote_recently(self, writes):
+                self.info[_ON_PRIMARY] = True
+                return primary
+            return replica
+
+    return ReadRoutingSession
+
+
+def _wrote_recently(db: Session, writes: RecentWrites) -> bool:
+    keys = db.info.get(_KEYS)
+    if callable(keys):
+        keys = keys()
+    return bool(keys) and writes.any_recent(keys)
+
+
+def _row_keys(table: Optional[str], values: dict) -> set[str]:
+    keys = set()
+    if values.get("user_id") is not None:
+        keys.add(f"user:{values['user_id']}")
+    if values.get("session_id") is not None:
+        keys.add(f"interview:{values['session_id']}")
+    if table in _OWN_ID_KEYS and values.get("id") is not None:
+        keys.add(f"{_OWN_ID_KEYS[table]}:{values['id']}")
+    return keys
+
+
+def _owner_keys(db: Session, keys: set[str]) -> set[str]:
+    # A turn or evaluation names its interview; the interview's owner sees it
+    # in their history, so record the owner too when the session is loaded.
+    interview_ids = {int(k.split(":", 1)[1]) for k in keys if k.startswith("interview:")}
+    if not interview_ids:
+        return set()
+    return {
+        f"user:{obj.user_id}"
+        for obj in db.identity_map.values()
+        if getattr(obj, "__tablename__", None) == "interview_sessions"
+        and obj.id in interview_ids
+        and obj.user_id is not None
+    }
+
+
+def _record(db: Session, keys: set[str]) -> None:
+    if keys:
+        db.info.setdefault(_WRITTEN, set()).update(keys | _owner_keys(db, keys))
+
+
+def track_writes(writes: RecentWrites) -> None:
+    """
+    Record the consistency keys of every committed write, in any Session.
+    """
+
+    @event.listens_for(Session, "after_flush")
+    def _after_flush(db: Session, flush_context) -> None:
+        keys: set[str] = set()
+        for obj in (*db.new, *db.dirty, *db.deleted):
+            table = getattr(obj, "__tablename__", None)
+            keys |= _row_keys(table, {k: getattr(obj, k, None) for k in ("id", "user_id", "session_id")})
+        _record(db, keys)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _on_execute(state: ORMExecuteState) -> None:
+        if not (state.is_insert or state.is_update or state.is_delete):
+            return
+        table = getattr(state.statement.table, "name", None)
+        rows = state.parameters or {}
+        keys: set[str] = set()
+        for row in rows if isinstance(rows, list) else [rows]:
+            keys |= _row_keys(table, row)
+        _record(state.session, keys)
+
+    @event.listens_for(Session, "after_commit")
+    def _after_commit(db: Session) -> None:
+        written = db.info.pop(_WRITTEN, None)
+        if written:
+            writes.mark(written)
+
+    @event.listens_for(Session, "after_rollback")
+    def _after_rollback(db: Session) -> None:
+        db.info.pop(_WRITTEN, None)
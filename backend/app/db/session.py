@@ -1,10 +1,128 @@
-from sqlalchemy import create_engine
+import time
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.core.metrics import registry
+from app.db.replica import RecentWrites, routing_session_class, track_writes
+
+
+# Async drivers for the sync URLs this app is configured with.
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def async_database_url(url: str) -> str:
+    """
+    The async-driver equivalent of a sync database URL.
+    """
+    parsed = make_url(url)
+    if parsed.drivername in _ASYNC_DRIVERS:
+        parsed = parsed.set(drivername=_ASYNC_DRIVERS[parsed.drivername])
+    return parsed.render_as_string(hide_password=False)
+
+
+def _is_sqlite_file(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def sqlite_pragmas() -> list[str]:
+    """
+    PRAGMA statements run on every new SQLite connection, from settings.
+    """
+    pragmas = [f"PRAGMA busy_timeout = {int(settings.SQLITE_BUSY_TIMEOUT_MS)}"]
+    if settings.SQLITE_WAL:
+        pragmas += ["PRAGMA journal_mode = WAL", "PRAGMA synchronous = NORMAL"]
+    if settings.SQLITE_MMAP_SIZE_BYTES > 0:
+        pragmas.append(f"PRAGMA mmap_size = {int(settings.SQLITE_MMAP_SIZE_BYTES)}")
+    return pragmas
+
+
+def _apply_pragmas(engine: Engine, pragmas: list[str]) -> None:
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+pool_checkouts = registry.counter("db_pool_checkouts_total", "Connections checked out of the database pools.")
+pool_checkout_seconds = registry.counter(
+    "db_pool_checkout_seconds_total", "Time connections spent checked out of the database pools."
+)
+pool_in_use = registry.gauge("db_pool_connections_in_use", "Connections currently checked out of the database pools.")
 
 
-engine = create_engine(settings.DATABASE_URL, future=True)
+def _track_checkouts(engine: Engine) -> None:
+    # Checkouts per request = delta of db_pool_checkouts_total over requests
+    # served; seconds per checkout shows connections held across slow work.
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        pool_checkouts.inc()
+        pool_in_use.inc()
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record) -> None:
+        started = connection_record.info.pop("checked_out_at", None)
+        if started is not None:
+            pool_in_use.dec()
+            pool_checkout_seconds.inc(time.perf_counter() - started)
+
+
+def _engine_options(url: URL) -> dict[str, Any]:
+    # In-memory SQLite uses a single shared connection; there is no pool to size.
+    if url.get_backend_name() == "sqlite" and not _is_sqlite_file(url):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+
+
+def make_engine(url: str) -> Engine:
+    """
+    A sync engine with the configured pool, checkout metrics and, for SQLite
+    files, pragmas.
+    """
+    parsed = make_url(url)
+    db_engine = create_engine(url, future=True, **_engine_options(parsed))
+    if _is_sqlite_file(parsed):
+        _apply_pragmas(db_engine, sqlite_pragmas())
+    _track_checkouts(db_engine)
+    return db_engine
+
+
+def make_async_engine(url: str) -> AsyncEngine:
+    """
+    `make_engine` for the async driver.
+    """
+    parsed = make_url(url)
+    db_engine = create_async_engine(url, **_engine_options(parsed))
+    if _is_sqlite_file(parsed):
+        # Connection events fire on the sync facade of the async engine.
+        _apply_pragmas(db_engine.sync_engine, sqlite_pragmas())
+    _track_checkouts(db_engine.sync_engine)
+    return db_engine
+
+
+# The sync engine backs schema creation, the CLI and background workers
+# (write-behind, scoring, report fan-out, exports); request handlers use the
+# async engine so DB I/O does not hold a threadpool slot.
+engine = make_engine(settings.DATABASE_URL)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -12,6 +130,44 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+async_engine = make_async_engine(settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL))
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Analytics, history and report reads go to the replica when one is
+# configured. Recent writes are tracked so a user who just wrote reads from
+# the primary (see app.db.replica); without a replica both names point at
+# the primary engines and nothing is tracked.
+recent_writes = RecentWrites(settings.READ_YOUR_WRITES_SECONDS)
+
+if settings.READ_DATABASE_URL:
+    read_engine = make_engine(settings.READ_DATABASE_URL)
+    async_read_engine = make_async_engine(
+        settings.ASYNC_READ_DATABASE_URL or async_database_url(settings.READ_DATABASE_URL)
+    )
+    track_writes(recent_writes)
+    ReadSessionLocal = sessionmaker(
+        class_=routing_session_class(engine, read_engine, recent_writes),
+        autocommit=False,
+        autoflush=False,
+    )
+    AsyncReadSessionLocal = async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=routing_session_class(
+            async_engine.sync_engine, async_read_engine.sync_engine, recent_writes
+        ),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+else:
+    read_engine, async_read_engine = engine, async_engine
+    ReadSessionLocal, AsyncReadSessionLocal = SessionLocal, AsyncSessionLocal
+
 
 def get_db():
     """
@@ -23,3 +179,27 @@ def get_db():
     finally:
         db.close()
 
+
+async def get_async_db():
+    """
+    Dependency that provides an async database session.
+
+    FastAPI caches it per request, so the auth dependencies and the handler
+    share one session. Creating the session does not touch the pool: a
+    connection is checked out at the first query (anonymous requests and
+    requests rejected before any query never check one out) and returned
+    when the session ends or `release_connection` is called.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def release_connection(db: AsyncSession) -> None:
+    """
+    End `db`'s read transaction so its connection goes back to the pool
+    before slow non-database work (a model call). Loaded objects stay usable
+    (expire_on_commit=False); the next query checks out a connection again.
+    """
+    if db.in_transaction():
+        await db.commit()
+
@@ -1,8 +1,10 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.api.deps import get_current_active_superuser
 from app.api.routes.auth import router as auth_router
 from app.api.routes.resumes import router as resumes_router
 from app.api.routes.ats import router as ats_router
@@ -11,13 +13,20 @@ from app.api.routes.interviews_live import router as interviews_live_router
 from app.api.routes.answers import router as answers_router
 from app.api.routes.reports import router as reports_router
 from app.api.routes.analytics import router as analytics_router
+from app.api.routes.admin import router as admin_router
 from app.core.config import settings
+from app.core.metrics import registry
+from app.core.session_cache import write_behind
+from app.core.session_reaper import session_reaper
+from app.core.transcript_archive import transcript_archiver
+from app.core.turn_scoring import wait_for_scoring
 from app.core.errors import (
     http_exception_handler,
     unhandled_exception_handler,
     validation_exception_handler,
 )
 from app.db.base import init_db
+from app.db.migrations import ensure_current
 
 
 def create_application() -> FastAPI:
@@ -58,6 +67,7 @@ def create_application() -> FastAPI:
     app.include_router(answers_router)
     app.include_router(reports_router)
     app.include_router(analytics_router)
+    app.include_router(admin_router)
 
     # Health endpoint
     @app.get("/health", tags=["health"])
@@ -67,10 +77,40 @@ def create_application() -> FastAPI:
         """
         return {"status": "ok"}
 
-    # Initialize database schema at startup (idempotent)
+    if settings.METRICS_ENABLED:
+
+        @app.get(
+            "/metrics",
+            tags=["health"],
+            response_class=PlainTextResponse,
+            dependencies=[Depends(get_current_active_superuser)],
+        )
+        def metrics() -> str:
+            """
+            Process metrics in the Prometheus text format. Superusers only:
+            scrape with a superuser's bearer token.
+            """
+            return registry.render()
+
+    # Schema changes run once per deploy (`python -m app.cli migrate`); workers
+    # only verify the schema is current. Local development migrates on start.
     @app.on_event("startup")
     def on_startup() -> None:
-        init_db()
+        if settings.ENVIRONMENT == "local":
+            init_db()
+        else:
+            ensure_current()
+        write_behind.start(settings.WRITE_BEHIND_FLUSH_INTERVAL_SECONDS)
+        session_reaper.start(settings.SESSION_REAPER_INTERVAL_SECONDS)
+        transcript_archiver.start(settings.TRANSCRIPT_ARCHIVE_INTERVAL_SECONDS)
+
+    # Persist in-flight evaluations and buffered turns before the worker exits
+    @app.on_event("shutdown")
+    def on_shutdown() -> None:
+        transcript_archiver.stop()
+        session_reaper.stop()
+        wait_for_scoring(timeout=settings.SHUTDOWN_SCORING_WAIT_SECONDS)
+        write_behind.stop()
 
     return app
 
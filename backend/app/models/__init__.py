@@ -2,3 +2,7 @@
 SQLAlchemy models for the application.
 """
 
+from app.models.interview import InterviewSession, InterviewTurn, TranscriptArchive, TurnEvaluation  # noqa: F401
+from app.models.report import SessionReport, SkillScoreRecord  # noqa: F401
+from app.models.resume import Resume, ResumeText  # noqa: F401
+from app.models.user import User  # noqa: F401
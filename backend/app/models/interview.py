@@ -2,7 +2,18 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -10,6 +21,8 @@ from app.db.base import Base
 
 class InterviewSession(Base):
     __tablename__ = "interview_sessions"
+    # Sessions whose transcript is due for archiving, oldest first.
+    __table_args__ = (Index("ix_interview_sessions_archive_due", "transcript_archived_at", "ended_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
@@ -18,15 +31,23 @@ class InterviewSession(Base):
     difficulty = Column(String(32), nullable=False)
     personality_mode = Column(String(32), nullable=False)
 
-    resume_text = Column(Text, nullable=False)
+    resume_text_id = Column(Integer, ForeignKey("resume_texts.id"), nullable=False, index=True)
 
     status = Column(String(32), default="active", nullable=False)  # active|ended
     question_index = Column(Integer, default=0, nullable=False)
+    turn_count = Column(Integer, default=0, nullable=False)  # next InterviewTurn.turn_index
+    # Rolling summary of the turns before the live prompt window.
+    live_summary = Column(Text, default="", nullable=False)
 
     started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     ended_at = Column(DateTime, nullable=True)
+    last_activity_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # Set when the turns moved to TranscriptArchive.
+    transcript_archived_at = Column(DateTime, nullable=True)
 
     user = relationship("User", backref="interview_sessions")
+    # Only prompt building needs the text; load it explicitly (crud.get_resume_text).
+    resume = relationship("ResumeText", lazy="raise")
     turns = relationship(
         "InterviewTurn",
         back_populates="session",
@@ -37,6 +58,9 @@ class InterviewSession(Base):
 
 class InterviewTurn(Base):
     __tablename__ = "interview_turns"
+    __table_args__ = (
+        UniqueConstraint("session_id", "turn_index", name="uq_interview_turns_session_turn"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(
@@ -51,3 +75,48 @@ class InterviewTurn(Base):
 
     session = relationship("InterviewSession", back_populates="turns")
 
+
+
+class TurnEvaluation(Base):
+    """
+    Scores for a single candidate answer, written as the interview runs so the
+    final report can aggregate them instead of re-reading the transcript.
+    """
+
+    __tablename__ = "turn_evaluations"
+    __table_args__ = (
+        UniqueConstraint("session_id", "turn_index", name="uq_turn_evaluations_session_turn"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(
+        Integer, ForeignKey("interview_sessions.id"), nullable=False, index=True
+    )
+    turn_index = Column(Integer, nullable=False)  # turn_index of the scored user turn
+
+    relevance = Column(Float, nullable=False)
+    depth = Column(Float, nullable=False)
+    clarity = Column(Float, nullable=False)
+    confidence = Column(Float, nullable=False)
+    overall_score = Column(Float, nullable=False)
+    feedback = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class TranscriptArchive(Base):
+    """
+    The turns of a long-ended session, packed into one compressed blob (see
+    app.core.transcript_codec). The session's `interview_turns` rows are
+    deleted in the same transaction; `crud.interview.list_turns` reads
+    either place.
+    """
+
+    __tablename__ = "interview_transcript_archives"
+
+    session_id = Column(Integer, ForeignKey("interview_sessions.id"), primary_key=True)
+    codec = Column(String(16), nullable=False)  # zlib|zstd
+    turn_count = Column(Integer, nullable=False)
+    raw_size = Column(Integer, nullable=False)  # bytes before compression
+    data = Column(LargeBinary, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
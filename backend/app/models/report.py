@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import relationship
+
+from app.db.base import Base
+
+
+class SessionReport(Base):
+    """
+    Persisted InterviewReport for an ended session, so it is generated once.
+    """
+
+    __tablename__ = "interview_reports"
+
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(
+        Integer, ForeignKey("interview_sessions.id"), nullable=False, unique=True, index=True
+    )
+
+    payload = Column(Text, nullable=False)  # InterviewReport as JSON
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    session = relationship("InterviewSession")
+
+
+class SkillScoreRecord(Base):
+    """
+    One skill score from a persisted report, stored long-format so score
+    history can be loaded straight into arrays without parsing report JSON.
+    """
+
+    __tablename__ = "skill_scores"
+    __table_args__ = (
+        Index("ix_skill_scores_user_recorded", "user_id", "recorded_at"),
+        # Covers the cohort-wide GROUP BY in list_cohort_skill_means.
+        Index("ix_skill_scores_user_skill_score", "user_id", "skill_name", "score"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(
+        Integer, ForeignKey("interview_sessions.id"), nullable=False, index=True
+    )
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+
+    skill_name = Column(String(128), nullable=False)
+    score = Column(Float, nullable=False)
+    recorded_at = Column(DateTime, nullable=False)  # session start time
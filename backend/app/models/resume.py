@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -24,3 +24,18 @@ class Resume(Base):
 
     user = relationship("User", backref="resumes")
 
+
+
+class ResumeText(Base):
+    """
+    Resume text stored once per distinct content; interview sessions
+    reference it by id.
+    """
+
+    __tablename__ = "resume_texts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), nullable=False, unique=True)  # sha256 hex of content
+    content = Column(Text, nullable=False)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -30,6 +30,18 @@ class PerformanceTrendPoint(BaseModel):
     average_skill_score: float = Field(..., ge=0, le=100)
 
 
+class SkillTrendItem(BaseModel):
+    skill_name: str
+    sessions: int
+    average_score: float
+    latest_score: float
+    rolling_mean: float
+    ewma: float
+    slope: float  # points per session, least-squares
+    volatility: float
+    cohort_percentile: float | None = None
+
+
 class InterviewHistoryResponse(BaseModel):
     items: List[InterviewHistoryItem]
 
@@ -41,3 +53,7 @@ class SkillProgressResponse(BaseModel):
 class PerformanceTrendsResponse(BaseModel):
     points: List[PerformanceTrendPoint]
 
+
+
+class SkillTrendsResponse(BaseModel):
+    items: List[SkillTrendItem]
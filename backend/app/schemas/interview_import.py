@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Annotated, List, Literal, Optional
+
+from pydantic import AfterValidator, BaseModel, Field
+
+from app.schemas.live_interview import Difficulty, PersonalityMode
+
+
+def _naive_utc(value: datetime) -> datetime:
+    # Stored timestamps are naive UTC; offsets in the file are converted.
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+UtcDatetime = Annotated[datetime, AfterValidator(_naive_utc)]
+
+
+class ImportedTurn(BaseModel):
+    role: Literal["assistant", "user"]
+    content: str = Field(..., min_length=1)
+    created_at: Optional[UtcDatetime] = None  # defaults to the session start
+
+
+class InterviewImportRecord(BaseModel):
+    """
+    One line of an interview import file: a session and its full transcript.
+    """
+
+    user_id: Optional[int] = None
+    target_role: str = Field(..., min_length=2)
+    difficulty: Difficulty = "medium"
+    personality_mode: PersonalityMode = "friendly"
+    resume_text: str = ""
+    status: Literal["active", "ended"] = "ended"
+    started_at: Optional[UtcDatetime] = None
+    ended_at: Optional[UtcDatetime] = None
+    turns: List[ImportedTurn] = Field(default_factory=list)
+
+
+class InterviewImportError(BaseModel):
+    line: int
+    detail: str
+
+
+class InterviewImportResult(BaseModel):
+    sessions: int = 0
+    turns: int = 0
+    failed_lines: int = 0
+    errors: List[InterviewImportError] = Field(default_factory=list)  # first few failures
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class TurnSearchHit(BaseModel):
+    interview_id: int
+    turn_index: int
+    role: str
+    snippet: str = Field(..., description="Matching passage, terms wrapped in [ ]")
+    score: float = Field(..., description="bm25 rank; lower is a better match")
+    target_role: str
+    started_at: datetime
+
+
+class TurnSearchResponse(BaseModel):
+    query: str
+    items: List[TurnSearchHit]
+    next_offset: Optional[int] = None
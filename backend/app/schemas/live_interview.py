@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Literal, Optional
+from datetime import datetime
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -40,3 +41,40 @@ class LiveInterviewEndResponse(BaseModel):
     total_turns: int
     ended_at: Optional[str] = None
 
+
+class LiveInterviewTurn(BaseModel):
+    turn_index: int
+    role: str
+    content: str
+
+
+class LiveInterviewSocketMessage(BaseModel):
+    """
+    Client-to-server frame on the live-interview WebSocket.
+    """
+
+    type: Literal["answer", "end", "ping"]
+    answer: Optional[str] = Field(default=None, min_length=1, max_length=20000)
+
+
+class TurnEvaluationOut(BaseModel):
+    """
+    Stored scores for one candidate answer.
+    """
+
+    turn_index: int
+    relevance: float
+    depth: float
+    clarity: float
+    confidence: float
+    overall_score: float
+    feedback: Optional[str] = None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class LiveInterviewEvaluationsResponse(BaseModel):
+    id: int
+    evaluations: List[TurnEvaluationOut]
+    pending: int = Field(0, description="Answers still being scored by this process")
@@ -0,0 +1,142 @@
+"""
+Compare request throughput of sync (threadpool) and async DB handlers.
+
+Both variants serve the same read (session row + stored report) while a batch
+of slow blocking requests, standing in for model calls, holds threadpool
+slots. Sync handlers queue behind them for a slot; async handlers do not.
+Runs in-process over httpx's ASGI transport against a throwaway SQLite
+database. Run from the backend directory:
+
+    python -m benchmarks.bench_async_db [--requests 2000] [--concurrency 12]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+_db_dir = tempfile.mkdtemp(prefix="bench-async-db-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/bench.db")
+
+import anyio.to_thread  # noqa: E402
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.crud import interview as sync_interview, report as sync_report  # noqa: E402
+from app.crud.aio import interview as aio_interview, report as aio_report  # noqa: E402
+from app.crud.interview import create_session  # noqa: E402
+from app.db.base import init_db  # noqa: E402
+from app.db.session import SessionLocal, get_async_db, get_db  # noqa: E402
+
+
+def _build_app(slow_seconds: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/sync/{id}")
+    def read_sync(id: int, db: Session = Depends(get_db)) -> dict:
+        session = sync_interview.get_session(db, session_id=id)
+        report = sync_report.get_report(db, session_id=id)
+        return {"id": session.id, "has_report": report is not None}
+
+    @app.get("/async/{id}")
+    async def read_async(id: int, db: AsyncSession = Depends(get_async_db)) -> dict:
+        session = await aio_interview.get_session(db, session_id=id)
+        report = await aio_report.get_report(db, session_id=id)
+        return {"id": session.id, "has_report": report is not None}
+
+    @app.get("/slow")
+    def slow() -> dict:
+        time.sleep(slow_seconds)
+        return {}
+
+    return app
+
+
+def _seed(n: int) -> list[int]:
+    db = SessionLocal()
+    try:
+        return [
+            create_session(
+                db,
+                user_id=None,
+                resume_text="Backend engineer",
+                target_role="Backend engineer",
+                difficulty="medium",
+                personality_mode="friendly",
+                first_question="Tell me about an API you built.",
+            ).id
+            for _ in range(n)
+        ]
+    finally:
+        db.close()
+
+
+async def _run(client: httpx.AsyncClient, path: str, ids: list[int], args) -> tuple[float, float]:
+    latencies: list[float] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(args.requests):
+        queue.put_nowait(ids[i % len(ids)])
+
+    async def worker() -> None:
+        while not queue.empty():
+            sid = queue.get_nowait()
+            start = time.perf_counter()
+            resp = await client.get(f"/{path}/{sid}")
+            resp.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    # Keep the threadpool saturated with blocking work for the whole run.
+    stop = asyncio.Event()
+
+    async def background_load() -> None:
+        while not stop.is_set():
+            await client.get("/slow")
+
+    load = [asyncio.create_task(background_load()) for _ in range(args.blocking)]
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await asyncio.gather(*load)
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    return args.requests / elapsed, p95
+
+
+async def main_async(args) -> None:
+    anyio.to_thread.current_default_thread_limiter().total_tokens = args.threads
+    app = _build_app(args.slow_ms / 1000)
+    ids = _seed(50)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(
+            f"{args.requests} reads, concurrency {args.concurrency}, "
+            f"{args.blocking} blocking requests of {args.slow_ms} ms on {args.threads} threads"
+        )
+        for path in ("sync", "async"):
+            rps, p95 = await _run(client, path, ids, args)
+            print(f"{path:<6} {rps:9.1f} req/s   p95 {p95 * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=12, help="keep below the DB pool size (5 + 10 overflow)")
+    parser.add_argument("--threads", type=int, default=40, help="threadpool size (anyio default: 40)")
+    parser.add_argument("--blocking", type=int, default=40, help="concurrent slow blocking requests")
+    parser.add_argument("--slow-ms", type=int, default=200)
+    args = parser.parse_args()
+
+    init_db()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
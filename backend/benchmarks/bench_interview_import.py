@@ -0,0 +1,98 @@
+"""
+Throughput of the bulk interview import against per-turn `add_turn` writes.
+
+Generates a synthetic JSONL file (default 5,000 sessions x 20 turns = 100k
+turns), imports it into a throwaway SQLite database with the batched
+importer, and times the old write path (`add_turn`, one commit per turn) on
+a small sample for comparison. Run from the backend directory:
+
+    python -m benchmarks.bench_interview_import [--sessions 5000] [--turns 20] [--batch-size 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+_db_dir = tempfile.mkdtemp(prefix="bench-import-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/bench.db")
+
+from app.core.interview_import import import_interviews  # noqa: E402
+from app.crud.interview import add_turn, create_session  # noqa: E402
+from app.db.base import init_db  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+
+
+def _write_jsonl(path: str, sessions: int, turns: int) -> None:
+    start = datetime(2024, 1, 1)
+    with open(path, "w", encoding="utf-8") as fh:
+        for n in range(sessions):
+            started_at = start + timedelta(minutes=n)
+            record = {
+                "target_role": "Backend engineer",
+                "resume_text": f"Candidate {n % 500}: Python, FastAPI, PostgreSQL.",
+                "started_at": started_at.isoformat(),
+                "turns": [
+                    {
+                        "role": "assistant" if i % 2 == 0 else "user",
+                        "content": f"Turn {i} of session {n}: " + "lorem ipsum dolor sit amet " * 6,
+                        "created_at": (started_at + timedelta(seconds=30 * i)).isoformat(),
+                    }
+                    for i in range(turns)
+                ],
+            }
+            fh.write(json.dumps(record) + "\n")
+
+
+def _per_turn(turns: int) -> float:
+    db = SessionLocal()
+    try:
+        session = create_session(
+            db,
+            user_id=None,
+            resume_text="Per-turn baseline",
+            target_role="Backend engineer",
+            difficulty="medium",
+            personality_mode="friendly",
+        )
+        start = time.perf_counter()
+        for i in range(turns):
+            add_turn(db, session, role="assistant" if i % 2 == 0 else "user", content=f"Turn {i}")
+        return time.perf_counter() - start
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=5_000)
+    parser.add_argument("--turns", type=int, default=20, help="turns per session")
+    parser.add_argument("--batch-size", type=int, default=1_000, help="sessions per transaction")
+    parser.add_argument("--baseline-turns", type=int, default=2_000, help="turns written with add_turn")
+    args = parser.parse_args()
+
+    init_db()
+    path = os.path.join(_db_dir, "import.jsonl")
+    _write_jsonl(path, args.sessions, args.turns)
+    size_mb = os.path.getsize(path) / 1e6
+
+    start = time.perf_counter()
+    with open(path, "rb") as fh:
+        result = import_interviews(fh, batch_size=args.batch_size)
+    elapsed = time.perf_counter() - start
+    assert result.failed_lines == 0, result.errors[:3]
+
+    print(f"{args.sessions} sessions x {args.turns} turns ({size_mb:.1f} MB JSONL), batches of {args.batch_size}")
+    print(f"bulk import   {result.turns:>8} turns in {elapsed:6.2f} s   {result.turns / elapsed * 60:>12,.0f} turns/min")
+
+    baseline = _per_turn(args.baseline_turns)
+    rate = args.baseline_turns / baseline * 60
+    print(f"add_turn      {args.baseline_turns:>8} turns in {baseline:6.2f} s   {rate:>12,.0f} turns/min")
+
+
+if __name__ == "__main__":
+    main()
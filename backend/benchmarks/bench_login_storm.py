@@ -0,0 +1,147 @@
+"""
+Live-interview latency during a login storm.
+
+Runs the API in-process (httpx ASGI transport, throwaway SQLite database,
+heuristic question backend). A few candidates loop through start + submit
+calls for `--seconds`, first on a quiet server and then while `--rate`
+logins per second arrive at POST /api/auth/login with valid credentials
+(every call is a bcrypt verification). Reports live-request p50/p95/max for
+both phases and how the logins were answered (200, or 503 once the hashing
+pool is full).
+
+`--unbounded` approximates the old behaviour, hashing on as many threads as
+the default executor with no queue limit, for comparison:
+
+    python -m benchmarks.bench_login_storm
+    python -m benchmarks.bench_login_storm --unbounded
+
+Run from the backend directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+_db_dir = tempfile.mkdtemp(prefix="bench-login-storm-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/storm.db")
+os.environ.pop("GEMINI_API_KEY", None)  # heuristic question backend
+os.environ.setdefault("SESSION_REAPER_INTERVAL_SECONDS", "0")
+os.environ.setdefault("TRANSCRIPT_ARCHIVE_INTERVAL_SECONDS", "0")
+if "--unbounded" in sys.argv:
+    os.environ["PASSWORD_HASH_WORKERS"] = str(min(32, (os.cpu_count() or 1) + 4))
+    os.environ["PASSWORD_HASH_QUEUE_SIZE"] = "1000000"
+    os.environ["PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS"] = "3600"
+
+import httpx  # noqa: E402
+
+
+RESUME = "Backend engineer with five years of Python, FastAPI and PostgreSQL experience."
+ANSWER = "I designed the payments API with idempotency keys because clients retry on timeouts."
+EMAIL = "storm@example.com"
+PASSWORD = "password123"
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    # Nearest-rank percentile.
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+async def _candidate(client: httpx.AsyncClient, n: int, until: float, latencies: list[float]) -> None:
+    while time.monotonic() < until:
+        t0 = time.perf_counter()
+        resp = await client.post(
+            "/api/interviews/live/start",
+            json={"resume_text": f"{RESUME} Candidate #{n}.", "target_role": "Backend engineer"},
+        )
+        latencies.append(time.perf_counter() - t0)
+        resp.raise_for_status()
+        interview_id = resp.json()["id"]
+        for _ in range(4):
+            if time.monotonic() >= until:
+                break
+            t0 = time.perf_counter()
+            resp = await client.post(f"/api/interviews/live/{interview_id}/submit", json={"answer": ANSWER})
+            latencies.append(time.perf_counter() - t0)
+            resp.raise_for_status()
+
+
+async def _login(client: httpx.AsyncClient, outcomes: Counter) -> None:
+    resp = await client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    outcomes[resp.status_code] += 1
+
+
+async def _storm(client: httpx.AsyncClient, rate: float, until: float, outcomes: Counter) -> None:
+    """
+    Open-loop logins: `rate` per second whatever the server answers, like a
+    credential-stuffing run or a cohort's 9am sign-in. Logins still waiting
+    when the phase ends are abandoned and counted as such.
+    """
+    tasks = []
+    while time.monotonic() < until:
+        tasks.append(asyncio.create_task(_login(client, outcomes)))
+        await asyncio.sleep(1 / rate)
+    pending = [t for t in tasks if not t.done()]
+    outcomes["abandoned"] += len(pending)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _phase(client: httpx.AsyncClient, args, rate: float) -> tuple[list[float], Counter]:
+    until = time.monotonic() + args.seconds
+    latencies: list[float] = []
+    outcomes: Counter = Counter()
+    storm = [_storm(client, rate, until, outcomes)] if rate else []
+    await asyncio.gather(*(_candidate(client, n, until, latencies) for n in range(args.candidates)), *storm)
+    return sorted(latencies), outcomes
+
+
+async def _run(args) -> None:
+    from app.core.config import settings
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://storm", timeout=120.0) as client:
+            resp = await client.post("/api/auth/signup", json={"email": EMAIL, "password": PASSWORD})
+            resp.raise_for_status()
+            quiet, _ = await _phase(client, args, rate=0)
+            stormy, outcomes = await _phase(client, args, rate=args.rate)
+
+    mode = "unbounded" if args.unbounded else "bounded"
+    print(
+        f"hashing pool ({mode}): {settings.PASSWORD_HASH_WORKERS} workers, "
+        f"queue {settings.PASSWORD_HASH_QUEUE_SIZE}, timeout {settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS:g} s"
+    )
+    print(f"{'live requests':<28} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for name, samples in (("quiet", quiet), (f"during {args.rate:g} logins/s", stormy)):
+        print(
+            f"{name:<28} {len(samples):>6} {_percentile(samples, 50) * 1e3:>8.1f} "
+            f"{_percentile(samples, 95) * 1e3:>8.1f} {(samples[-1] if samples else 0) * 1e3:>8.1f}"
+        )
+    answered = ", ".join(f"{count} x {code}" for code, count in sorted(outcomes.items(), key=str))
+    print(f"logins during the storm: {answered or 'none'}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=10.0, help="length of each phase")
+    parser.add_argument("--candidates", type=int, default=4, help="concurrent live interviews")
+    parser.add_argument("--rate", type=float, default=50.0, help="login attempts per second during the storm")
+    parser.add_argument("--unbounded", action="store_true", help="emulate hashing without admission control")
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Benchmark the vectorised skill trend engine on 10k sessions x 20 skills.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_skill_trends [--sessions 10000] [--skills 20] [--users 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections import defaultdict
+from statistics import mean
+
+import numpy as np
+
+from app.core.skill_trends import (
+    build_score_matrix,
+    cohort_percentiles,
+    skill_trend_stats,
+)
+
+
+def _timed(label: str, fn, repeat: int = 5):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} {best * 1000:9.2f} ms")
+    return result
+
+
+def _python_trends(rows):
+    # The per-skill loop used by build_skill_progress (first vs latest, +/-3).
+    by_skill = defaultdict(list)
+    for _, _, name, score in rows:
+        by_skill[name].append(score)
+    out = {}
+    for name, scores in by_skill.items():
+        latest = scores[-1]
+        trend = "flat"
+        if len(scores) >= 2:
+            if latest > scores[0] + 3:
+                trend = "up"
+            elif latest < scores[0] - 3:
+                trend = "down"
+        out[name] = (mean(scores), latest, trend)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--skills", type=int, default=20)
+    parser.add_argument("--users", type=int, default=2_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    skills = [f"Skill {i:02d}" for i in range(args.skills)]
+    users = rng.integers(1, args.users + 1, size=args.sessions)
+    scores = np.clip(rng.normal(70, 12, size=(args.sessions, args.skills)), 0, 100)
+    # ~10% of skills not scored in a given session
+    scores[rng.random(scores.shape) < 0.1] = np.nan
+
+    rows = [
+        (session_id + 1, int(users[session_id]), skills[j], float(scores[session_id, j]))
+        for session_id in range(args.sessions)
+        for j in range(args.skills)
+        if not np.isnan(scores[session_id, j])
+    ]
+    print(f"{len(rows)} score rows, {args.sessions} sessions x {args.skills} skills, {args.users} users\n")
+
+    _timed("pure-Python first/latest trend", lambda: _python_trends(rows))
+    matrix = _timed("pivot rows -> matrix", lambda: build_score_matrix(rows))
+    stats = _timed("trend stats (mean/roll/ewma/slope/vol)", lambda: skill_trend_stats(matrix, window=5))
+
+    # Cohort: per-user means, then percentile of every user's means against it.
+    _, user_idx = np.unique(matrix.user_ids, return_inverse=True)
+    n_users = user_idx.max() + 1
+
+    def per_user_means():
+        valid = ~np.isnan(matrix.scores)
+        sums = np.zeros((n_users, matrix.scores.shape[1]))
+        counts = np.zeros_like(sums)
+        np.add.at(sums, user_idx, np.nan_to_num(matrix.scores))
+        np.add.at(counts, user_idx, valid)
+        with np.errstate(invalid="ignore"):
+            return sums / counts
+
+    cohort = _timed("per-user means (cohort)", per_user_means)
+    _timed("percentile of one user vs cohort", lambda: cohort_percentiles(stats.average, cohort))
+
+
+if __name__ == "__main__":
+    main()
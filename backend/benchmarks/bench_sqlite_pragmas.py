@@ -0,0 +1,142 @@
+"""
+Concurrent read/write benchmark: default SQLite engine vs the configured one.
+
+Writer threads run submit-shaped transactions (a counter UPDATE plus a
+two-row INSERT, then COMMIT) while reader threads fetch a session's latest
+rows. Each variant gets its own fresh database file, because journal_mode=WAL
+persists in the file. "default" is `create_engine(url)` as the app used to
+build it (rollback journal, synchronous=FULL); "configured" is
+`app.db.session.make_engine` with the pool and SQLite settings. Run from the
+backend directory:
+
+    python -m benchmarks.bench_sqlite_pragmas [--seconds 5] [--writers 4] [--readers 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+from app.db.session import make_engine, sqlite_pragmas
+
+
+SESSIONS = 200
+
+SCHEMA = (
+    "CREATE TABLE sessions (id INTEGER PRIMARY KEY, turn_count INTEGER NOT NULL)",
+    "CREATE TABLE turns (id INTEGER PRIMARY KEY, session_id INTEGER NOT NULL, "
+    "turn_index INTEGER NOT NULL, content TEXT NOT NULL)",
+    "CREATE INDEX ix_turns_session ON turns (session_id, turn_index)",
+)
+
+
+def _prepare(db_engine: Engine) -> None:
+    with db_engine.begin() as conn:
+        for stmt in SCHEMA:
+            conn.execute(text(stmt))
+        conn.execute(
+            text("INSERT INTO sessions (id, turn_count) VALUES (:id, 0)"),
+            [{"id": i} for i in range(1, SESSIONS + 1)],
+        )
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.writes = 0
+        self.reads = 0
+        self.errors = 0
+        self.read_latencies: list[float] = []
+
+
+def _writer(db_engine: Engine, stats: _Stats, stop: threading.Event) -> None:
+    payload = "x" * 400
+    while not stop.is_set():
+        sid = random.randint(1, SESSIONS)
+        try:
+            with db_engine.begin() as conn:
+                base = conn.execute(
+                    text("UPDATE sessions SET turn_count = turn_count + 2 WHERE id = :id RETURNING turn_count - 2"),
+                    {"id": sid},
+                ).scalar_one()
+                conn.execute(
+                    text("INSERT INTO turns (session_id, turn_index, content) VALUES (:sid, :idx, :content)"),
+                    [
+                        {"sid": sid, "idx": base, "content": payload},
+                        {"sid": sid, "idx": base + 1, "content": payload},
+                    ],
+                )
+        except OperationalError:
+            with stats.lock:
+                stats.errors += 1
+            continue
+        with stats.lock:
+            stats.writes += 1
+
+
+def _reader(db_engine: Engine, stats: _Stats, stop: threading.Event) -> None:
+    while not stop.is_set():
+        sid = random.randint(1, SESSIONS)
+        start = time.perf_counter()
+        try:
+            with db_engine.connect() as conn:
+                conn.execute(
+                    text("SELECT content FROM turns WHERE session_id = :sid ORDER BY turn_index DESC LIMIT 12"),
+                    {"sid": sid},
+                ).all()
+        except OperationalError:
+            with stats.lock:
+                stats.errors += 1
+            continue
+        elapsed = time.perf_counter() - start
+        with stats.lock:
+            stats.reads += 1
+            stats.read_latencies.append(elapsed)
+
+
+def _run(label: str, db_engine: Engine, args) -> None:
+    _prepare(db_engine)
+    stats = _Stats()
+    stop = threading.Event()
+    threads = [threading.Thread(target=_writer, args=(db_engine, stats, stop)) for _ in range(args.writers)]
+    threads += [threading.Thread(target=_reader, args=(db_engine, stats, stop)) for _ in range(args.readers)]
+    for t in threads:
+        t.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    db_engine.dispose()
+
+    latencies = sorted(stats.read_latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000 if latencies else 0.0
+    print(
+        f"{label:<12} {stats.writes / args.seconds:9.1f} writes/s {stats.reads / args.seconds:10.1f} reads/s"
+        f"   read p95 {p95:7.2f} ms   lock errors {stats.errors}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-sqlite-")
+    print(f"{args.writers} writers, {args.readers} readers, {args.seconds:g} s each")
+    print("configured pragmas: " + "; ".join(p.removeprefix("PRAGMA ") for p in sqlite_pragmas()))
+    _run("default", create_engine(f"sqlite:///{os.path.join(workdir, 'default.db')}", future=True), args)
+    _run("configured", make_engine(f"sqlite:///{os.path.join(workdir, 'configured.db')}"), args)
+
+
+if __name__ == "__main__":
+    main()
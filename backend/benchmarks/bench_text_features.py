@@ -0,0 +1,154 @@
+"""
+Micro-benchmark the heuristic scorers (ATS, answer evaluation, follow-up
+detection) on 20k-character inputs.
+
+Compares each scorer's previous string scans with the feature record it now
+reads, and checks both produce the same scores, on these inputs and on short
+answers. Run from the backend directory:
+
+    python -m benchmarks.bench_text_features [--chars 20000] [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from app.core.answer_evaluation import _heuristic_evaluate
+from app.core.ats import _mock_ats_score
+from app.core.live_interview import _needs_follow_up
+from app.core.text_features import extract_features
+
+
+WORDS = (
+    "api design latency because impact result python service team maybe definitely "
+    "experience education skills projects summary certain confident database cache "
+    "so that i think not sure queue retries idempotency deployment incident uh idk"
+).split()
+
+
+def _text(chars: int, seed: int) -> str:
+    rng = random.Random(seed)
+    parts: list[str] = []
+    size = 0
+    while size < chars:
+        line = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14)))
+        line = ("- " if rng.random() < 0.2 else "") + line.capitalize() + rng.choice(".!?.")
+        parts.append(line)
+        size += len(line) + 1
+    return "\n".join(parts)[:chars]
+
+
+# Previous implementations, kept here as the baseline.
+def _old_ats(resume_text: str, job_role: str) -> tuple[float, float]:
+    text_lower = resume_text.lower()
+    role_lower = job_role.lower()
+    role_keywords = [w for w in role_lower.replace("/", " ").replace("-", " ").split() if len(w) > 2]
+    if not role_keywords:
+        keyword_score = 50.0
+    else:
+        hits = sum(1 for kw in role_keywords if kw in text_lower)
+        keyword_score = min(100.0, (hits / len(role_keywords)) * 100.0)
+    sections = ["experience", "education", "skills", "projects", "summary"]
+    section_hits = sum(1 for s in sections if s in text_lower)
+    bullets = text_lower.count("•") + text_lower.count("- ")
+    formatting_score = min(100.0, section_hits * 15.0 + min(bullets, 10) * 3.0)
+    return round(keyword_score, 2), round(formatting_score, 2)
+
+
+def _old_evaluate(question: str, answer: str) -> tuple[float, float, float, float]:
+    a = (answer or "").strip()
+    q = (question or "").strip().lower()
+    sentences = max(1, a.count(".") + a.count("!") + a.count("?"))
+    relevance = 80.0
+    if len(q) > 0 and any(w in q for w in ["why", "how", "design", "explain"]):
+        if "because" not in a.lower() and "so that" not in a.lower():
+            relevance -= 15.0
+    depth = min(100.0, (len(a) / 400.0) * 100.0)
+    if "impact" in a.lower() or "result" in a.lower():
+        depth = min(100.0, depth + 10.0)
+    clarity = 70.0 + min(20.0, sentences * 2.0)
+    if any(x in a for x in ["uh", "idk", "don't know"]):
+        clarity -= 10.0
+    confidence = 70.0
+    if any(x in a.lower() for x in ["i think", "maybe", "not sure"]):
+        confidence -= 15.0
+    if any(x in a.lower() for x in ["definitely", "confident", "certain"]):
+        confidence += 5.0
+    return tuple(round(max(0.0, min(100.0, v)), 2) for v in (relevance, depth, clarity, confidence))
+
+
+def _old_follow_up(answer: str) -> bool:
+    a = (answer or "").strip().lower()
+    if len(a) < 60:
+        return True
+    if any(x in a for x in ["i don't know", "not sure", "no idea", "can't remember"]):
+        return True
+    return False
+
+
+def _timed(label: str, fn, repeat: int) -> None:
+    best = float("inf")
+    for _ in range(5):
+        elapsed = 0.0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            elapsed += time.perf_counter() - start
+        best = min(best, elapsed / repeat)
+    print(f"{label:<45} {best * 1e6:9.1f} us/call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chars", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    question = "How would you design an idempotent payments API, and why?"
+    role = "Senior Backend / API Engineer"
+    samples = [_text(args.chars, seed) for seed in range(5)]
+    # Short answers too, where a capitalised filler ("Uh") opening a line is
+    # often the only one: fillers are matched case-sensitively.
+    short = [_text(300, seed) for seed in range(200)]
+
+    # Same scores before and after.
+    for text in samples + short:
+        new_ats = _mock_ats_score(text, role)
+        assert _old_ats(text, role) == (new_ats.keyword_match_score, new_ats.formatting_score)
+        assert _old_follow_up(text) == _needs_follow_up(text)
+        new_eval = _heuristic_evaluate(question, text)
+        assert _old_evaluate(question, text) == (
+            new_eval.relevance,
+            new_eval.depth,
+            new_eval.clarity,
+            new_eval.confidence,
+        )
+
+    text = samples[0]
+    print(f"{args.chars} characters")
+    _timed("extract_features", lambda: extract_features(text), args.repeat)
+    _timed("ats: previous scans", lambda: _old_ats(text, role), args.repeat)
+    _timed("ats: feature record", lambda: _mock_ats_score(text, role), args.repeat)
+    _timed("evaluate: previous scans", lambda: _old_evaluate(question, text), args.repeat)
+    _timed("evaluate: feature record", lambda: _heuristic_evaluate(question, text), args.repeat)
+    _timed("follow-up: previous scans", lambda: _old_follow_up(text), args.repeat)
+    _timed("follow-up: feature record", lambda: _needs_follow_up(text), args.repeat)
+
+    def old_all() -> None:
+        _old_ats(text, role)
+        _old_evaluate(question, text)
+        _old_follow_up(text)
+
+    def new_all() -> None:
+        _mock_ats_score(text, role)
+        _heuristic_evaluate(question, text)
+        _needs_follow_up(text)
+
+    _timed("all three: previous scans", old_all, args.repeat)
+    _timed("all three: feature records", new_all, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Hot-table size and transcript read cost before and after archiving.
+
+Imports synthetic ended interviews (default 2,000 sessions x 20 turns, ended
+in 2024) into a throwaway SQLite database, then archives all of them and
+reports:
+
+- the size of `interview_turns` and its indexes, and of the archive table,
+  before and after (from the `dbstat` virtual table when SQLite has it,
+  otherwise the whole file after VACUUM);
+- the compression ratio;
+- `list_turns` latency for a hot and for an archived session.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_transcript_archive [--sessions 2000] [--turns 20] [--codec zlib]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+_db_dir = tempfile.mkdtemp(prefix="bench-archive-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/bench.db")
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core.interview_import import import_interviews  # noqa: E402
+from app.core.transcript_archive import archive_ended_transcripts  # noqa: E402
+from app.crud.interview import list_turns  # noqa: E402
+from app.db.base import init_db  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+
+
+ANSWERS = (
+    "I designed the payments API with idempotency keys because clients retry on timeouts, so duplicate "
+    "charges were impossible; the result was zero double-charges over two quarters.",
+    "We split the monolith by bounded context, measured p95 latency before and after, and the impact was "
+    "a 40% drop in tail latency for checkout.",
+    "Not sure, I think we used a queue for that, maybe Kafka, but another team owned it.",
+)
+QUESTIONS = (
+    "Tell me about a system you designed end to end. What trade-offs did you make?",
+    "How did you measure whether the change worked?",
+    "Describe a production incident you handled and what you changed afterwards.",
+)
+
+
+def _records(sessions: int, turns: int):
+    start = datetime(2024, 1, 1)
+    for n in range(sessions):
+        started_at = start + timedelta(minutes=n)
+        yield {
+            "target_role": "Backend engineer",
+            "resume_text": f"Candidate {n % 200}: Python, FastAPI, PostgreSQL.",
+            "status": "ended",
+            "started_at": started_at.isoformat(),
+            "ended_at": (started_at + timedelta(minutes=30)).isoformat(),
+            "turns": [
+                {
+                    "role": "assistant" if i % 2 == 0 else "user",
+                    "content": (QUESTIONS if i % 2 == 0 else ANSWERS)[(n + i) % 3],
+                    "created_at": (started_at + timedelta(seconds=60 * i)).isoformat(),
+                }
+                for i in range(turns)
+            ],
+        }
+
+
+def _sizes() -> dict[str, int]:
+    """
+    Bytes used by the turn table, its indexes and the archive table.
+    """
+    with engine.connect() as conn:
+        try:
+            rows = conn.execute(text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")).all()
+        except Exception:
+            rows = None
+    if rows is None:
+        with engine.connect() as conn:
+            conn.exec_driver_sql("VACUUM")
+        return {"database file": os.path.getsize(engine.url.database)}
+    sizes = dict(rows)
+    turn_indexes = sum(v for k, v in sizes.items() if k.startswith(("ix_interview_turns", "uq_interview_turns")))
+    turn_indexes += sum(v for k, v in sizes.items() if k.startswith("sqlite_autoindex_interview_turns"))
+    return {
+        "interview_turns": sizes.get("interview_turns", 0),
+        "interview_turns indexes": turn_indexes,
+        "interview_transcript_archives": sizes.get("interview_transcript_archives", 0),
+    }
+
+
+def _time_list_turns(session_id: int, repeat: int = 200) -> float:
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            list_turns(db, session_id)
+            db.expunge_all()
+        return (time.perf_counter() - start) / repeat
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=2_000)
+    parser.add_argument("--turns", type=int, default=20, help="turns per session")
+    parser.add_argument("--codec", choices=["zlib", "zstd"], default="zlib")
+    parser.add_argument("--batch-size", type=int, default=100, help="sessions per transaction")
+    args = parser.parse_args()
+
+    init_db()
+    result = import_interviews((json.dumps(r) for r in _records(args.sessions, args.turns)), batch_size=1_000)
+    print(f"imported {result.sessions} sessions, {result.turns} turns")
+    with engine.connect() as conn:
+        conn.exec_driver_sql("VACUUM")
+    before = _sizes()
+    hot = _time_list_turns(1)
+
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        archived = archive_ended_transcripts(
+            db, older_than=timedelta(days=30), batch_size=args.batch_size, codec=args.codec
+        )
+        elapsed = time.perf_counter() - start
+        raw, stored = db.execute(
+            text("SELECT SUM(raw_size), SUM(LENGTH(data)) FROM interview_transcript_archives")
+        ).one()
+    finally:
+        db.close()
+    with engine.connect() as conn:
+        conn.exec_driver_sql("VACUUM")
+    after = _sizes()
+    cold = _time_list_turns(1)
+
+    print(f"archived {archived} sessions in {elapsed:.2f} s ({archived / elapsed:,.0f} sessions/s, {args.codec})")
+    print(f"transcripts: {raw / 1e6:.2f} MB raw -> {stored / 1e6:.2f} MB stored ({raw / stored:.1f}x)")
+    print(f"{'':<32} {'before':>10} {'after':>10}")
+    for name in before:
+        print(f"{name:<32} {before[name] / 1e6:>8.2f}MB {after.get(name, 0) / 1e6:>8.2f}MB")
+    print(f"list_turns: hot {hot * 1e3:.3f} ms, archived {cold * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
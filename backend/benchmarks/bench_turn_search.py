@@ -0,0 +1,172 @@
+"""
+Full-text search latency over a large turn table.
+
+Imports synthetic interviews (default 1,000 users x 50 sessions x 20 turns =
+1M turns) into a throwaway SQLite database through the bulk importer, so the
+FTS5 index is filled by its insert trigger as in production, then runs
+`search_turns` for random users and queries and reports p50 / p95 / max
+latency against a 50 ms target. Exits non-zero when p95 is over target.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_turn_search [--users 1000] [--sessions 50] [--turns 20] [--queries 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+_db_dir = tempfile.mkdtemp(prefix="bench-search-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/bench.db")
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.interview_import import import_interviews  # noqa: E402
+from app.crud.interview import has_turn_search_index, search_turns  # noqa: E402
+from app.db.base import init_db  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+
+TARGET_MS = 50.0
+
+PHRASES = (
+    "I designed the payments API with idempotency keys because clients retry on timeouts",
+    "we split the monolith by bounded context and measured p95 latency before and after",
+    "the queue was Kafka with one partition per tenant so ordering held per customer",
+    "I added a circuit breaker around the inventory service and cached the last good response",
+    "we moved sessions to Redis and the login error rate dropped to almost zero",
+    "the migration ran in batches behind a feature flag so we could roll back per region",
+    "I owned the on-call rotation and wrote runbooks for every alert we kept",
+    "we sharded the orders table by customer id once a single primary could not keep up",
+)
+FILLER = (
+    "team product users traffic release design review incident metric dashboard deploy service database "
+    "index cache query schema backlog estimate sprint stakeholder trade-off rollout latency throughput "
+    "budget outage postmortem mentor refactor contract test coverage pipeline container cluster region"
+).split()
+QUERIES = (
+    "idempotency",
+    "idempotent keys",
+    "kafka partition",
+    "circuit breaker",
+    "redis login",
+    "feature flag region",
+    "p95 latency",
+    "sharded orders",
+    "postmortem outage",
+    "runbooks alert",
+)
+
+
+def _answer(rng: random.Random) -> str:
+    filler = " ".join(rng.choices(FILLER, k=rng.randint(15, 60)))
+    return f"{rng.choice(PHRASES)}; {filler}."
+
+
+def _records(users: int, sessions: int, turns: int, first_user_id: int, seed: int):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    for n in range(users * sessions):
+        started_at = start + timedelta(minutes=n)
+        yield {
+            "user_id": first_user_id + n % users,
+            "target_role": "Backend engineer",
+            "resume_text": f"Candidate {n % users}: Python, FastAPI, PostgreSQL.",
+            "status": "ended",
+            "started_at": started_at.isoformat(),
+            "ended_at": (started_at + timedelta(minutes=30)).isoformat(),
+            "turns": [
+                {
+                    "role": "assistant" if i % 2 == 0 else "user",
+                    "content": f"Question {i // 2 + 1}: tell me about your work." if i % 2 == 0 else _answer(rng),
+                    "created_at": (started_at + timedelta(seconds=60 * i)).isoformat(),
+                }
+                for i in range(turns)
+            ],
+        }
+
+
+def _create_users(count: int) -> int:
+    """
+    Insert `count` users and return the first id.
+    """
+    db = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        db.execute(
+            insert(User),
+            [
+                {"email": f"bench{n}@example.com", "hashed_password": "-", "created_at": now, "updated_at": now}
+                for n in range(count)
+            ],
+        )
+        db.commit()
+        return db.query(User.id).order_by(User.id).limit(1).scalar()
+    finally:
+        db.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--sessions", type=int, default=50, help="sessions per user")
+    parser.add_argument("--turns", type=int, default=20, help="turns per session")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=20, help="hits per page")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    init_db()
+    with engine.connect() as conn:
+        if not has_turn_search_index(conn):
+            print("no FTS5 index (not SQLite, or SQLite built without FTS5); nothing to measure")
+            return 1
+
+    first_user_id = _create_users(args.users)
+    start = time.perf_counter()
+    records = _records(args.users, args.sessions, args.turns, first_user_id, args.seed)
+    result = import_interviews((json.dumps(r) for r in records), batch_size=1_000)
+    elapsed = time.perf_counter() - start
+    print(f"imported {result.turns:,} turns ({result.sessions:,} sessions) in {elapsed:.1f} s, index included")
+    with engine.connect() as conn:
+        conn.exec_driver_sql("INSERT INTO interview_turn_search (interview_turn_search) VALUES ('optimize')")
+        conn.commit()
+
+    rng = random.Random(args.seed)
+    timings: dict[str, list[float]] = {q: [] for q in QUERIES}
+    hits = 0
+    db = SessionLocal()
+    try:
+        for _ in range(args.queries):
+            query = rng.choice(QUERIES)
+            user_id = first_user_id + rng.randrange(args.users)
+            t0 = time.perf_counter()
+            rows = search_turns(db, user_id=user_id, query=query, limit=args.limit + 1)
+            timings[query].append((time.perf_counter() - t0) * 1e3)
+            hits += len(rows)
+    finally:
+        db.close()
+
+    every = sorted(t for ts in timings.values() for t in ts)
+    p50 = statistics.median(every)
+    p95 = every[int(len(every) * 0.95) - 1]
+    print(f"{'query':<24} {'runs':>5} {'p50 ms':>8} {'max ms':>8}")
+    for query, ts in timings.items():
+        if ts:
+            print(f"{query:<24} {len(ts):>5} {statistics.median(ts):>8.2f} {max(ts):>8.2f}")
+    print(f"all: p50 {p50:.2f} ms, p95 {p95:.2f} ms, max {every[-1]:.2f} ms; {hits / len(every):.1f} hits/query")
+    print(f"p95 {'within' if p95 <= TARGET_MS else 'OVER'} the {TARGET_MS:.0f} ms target")
+    return 0 if p95 <= TARGET_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
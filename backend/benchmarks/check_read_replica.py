@@ -0,0 +1,146 @@
+"""
+Read-replica routing check with two SQLite files.
+
+Runs the API in-process against a primary database and a replica that is a
+snapshot copy of it (SQLite backup API), so the replica lags by whatever was
+written since the last snapshot. Checks that:
+
+- analytics and report reads go to the replica;
+- a user who just wrote reads from the primary and sees their write;
+- an anonymous interview's report is readable right after it ends;
+- once READ_YOUR_WRITES_SECONDS have passed, reads return to the replica.
+
+Exits non-zero on the first failed check. Needs httpx (for FastAPI's
+TestClient). Run from the backend directory:
+
+    python -m benchmarks.check_read_replica
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+_db_dir = tempfile.mkdtemp(prefix="read-replica-")
+PRIMARY = os.path.join(_db_dir, "primary.db")
+REPLICA = os.path.join(_db_dir, "replica.db")
+WINDOW = 1.0
+os.environ["DATABASE_URL"] = f"sqlite:///{PRIMARY}"
+os.environ["READ_DATABASE_URL"] = f"sqlite:///{REPLICA}"
+os.environ["READ_YOUR_WRITES_SECONDS"] = str(WINDOW)
+os.environ.pop("GEMINI_API_KEY", None)  # heuristic question/report paths
+os.environ.setdefault("WRITE_BEHIND_FLUSH_INTERVAL_SECONDS", "3600")
+os.environ.setdefault("SESSION_REAPER_INTERVAL_SECONDS", "0")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.api.routes.analytics import router as analytics_router  # noqa: E402
+from app.api.routes.auth import router as auth_router  # noqa: E402
+from app.api.routes.interviews_live import router as interviews_live_router  # noqa: E402
+from app.api.routes.reports import router as reports_router  # noqa: E402
+from app.db.base import init_db  # noqa: E402
+from app.db.query_counter import count_queries  # noqa: E402
+from app.db.session import async_read_engine  # noqa: E402
+
+
+RESUME = "Backend engineer with five years of Python, FastAPI and PostgreSQL experience."
+ANSWER = "I designed the payments API with idempotency keys because clients retry on timeouts."
+PASSWORD = "password123"
+
+
+def _snapshot() -> None:
+    """
+    Copy the primary into the replica file, as a replica catching up would.
+    """
+    src, dst = sqlite3.connect(PRIMARY), sqlite3.connect(REPLICA)
+    try:
+        src.backup(dst)
+    finally:
+        src.close()
+        dst.close()
+
+
+def _login(client: TestClient, email: str) -> dict[str, str]:
+    client.post("/api/auth/signup", json={"email": email, "password": PASSWORD}).raise_for_status()
+    resp = client.post("/api/auth/login", json={"email": email, "password": PASSWORD})
+    resp.raise_for_status()
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def _interview(client: TestClient, headers: dict[str, str]) -> int:
+    resp = client.post(
+        "/api/interviews/live/start",
+        json={"resume_text": RESUME, "target_role": "Backend engineer"},
+        headers=headers,
+    )
+    resp.raise_for_status()
+    interview_id = resp.json()["id"]
+    client.post(
+        f"/api/interviews/live/{interview_id}/submit", json={"answer": ANSWER}, headers=headers
+    ).raise_for_status()
+    client.post(f"/api/interviews/live/{interview_id}/end", headers=headers).raise_for_status()
+    return interview_id
+
+
+def _get(client: TestClient, path: str, headers: dict[str, str]) -> tuple[dict, int]:
+    """
+    Response body and the number of statements that ran on the replica.
+    """
+    with count_queries(async_read_engine) as log:
+        resp = client.get(path, headers=headers)
+    resp.raise_for_status()
+    return resp.json(), log.count
+
+
+def _check(name: str, ok: bool) -> bool:
+    print(f"{name:<60} {'ok' if ok else 'FAILED'}")
+    return ok
+
+
+def main() -> int:
+    init_db()
+    app = FastAPI()
+    for router in (auth_router, interviews_live_router, reports_router, analytics_router):
+        app.include_router(router)
+    client = TestClient(app)
+
+    alice = _login(client, "alice@example.com")
+    bob = _login(client, "bob@example.com")
+    _interview(client, alice)
+    time.sleep(WINDOW * 1.2)
+    _snapshot()
+
+    history = "/api/analytics/interviews/history"
+    body, on_replica = _get(client, history, alice)
+    if not _check("quiet user reads history from the replica", on_replica > 0 and len(body["items"]) == 1):
+        return 1
+
+    bob_interview = _interview(client, bob)
+    body, on_replica = _get(client, history, bob)
+    if not _check("user who just wrote reads from the primary", on_replica == 0 and len(body["items"]) == 1):
+        return 1
+
+    anonymous = _interview(client, {})
+    body, on_replica = _get(client, f"/api/reports/{anonymous}", {})
+    fresh = on_replica == 0 and body["interview_id"] == anonymous
+    if not _check("fresh anonymous interview's report is readable", fresh):
+        return 1
+
+    time.sleep(WINDOW * 1.2)
+    body, on_replica = _get(client, history, bob)
+    if not _check("after the window, reads return to the (stale) replica", on_replica > 0 and not body["items"]):
+        return 1
+
+    _snapshot()
+    body, on_replica = _get(client, f"/api/reports/{bob_interview}", bob)
+    if not _check("caught-up replica serves the report", on_replica > 0 and body["interview_id"] == bob_interview):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
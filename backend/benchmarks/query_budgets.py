@@ -0,0 +1,415 @@
+"""
+Query-count and query-plan regression checks.
+
+Runs the API in-process against a throwaway SQLite database, records every
+SQL statement and pool checkout each request causes (background and
+scoring-pool work included) and exits non-zero if:
+
+- an endpoint issues more statements than its budget;
+- an endpoint checks out more connections than its budget (requests
+  rejected before any query must not check one out at all);
+- an endpoint reads from a table it must not touch;
+- an analytics endpoint issues more statements for a user with more
+  interviews (an N+1);
+- a hot query's `EXPLAIN QUERY PLAN` contains a table or full-index scan.
+
+Needs httpx (for FastAPI's TestClient). Run from the backend directory:
+
+    python -m benchmarks.query_budgets
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from typing import Callable
+
+_db_dir = tempfile.mkdtemp(prefix="query-budgets-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/budgets.db")
+os.environ.pop("GEMINI_API_KEY", None)  # heuristic question/report paths
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.api.routes.analytics import router as analytics_router  # noqa: E402
+from app.api.routes.auth import router as auth_router  # noqa: E402
+from app.api.routes.interviews import router as interviews_router  # noqa: E402
+from app.api.routes.interviews_live import router as interviews_live_router  # noqa: E402
+from app.api.routes.reports import router as reports_router  # noqa: E402
+from app.core.turn_scoring import wait_for_scoring  # noqa: E402
+from app.crud import interview as crud_interview, report as crud_report, resume as crud_resume  # noqa: E402
+from app.crud.user import get_user_by_email  # noqa: E402
+from app.db.base import init_db  # noqa: E402
+from app.db.query_counter import QueryLog, count_queries  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+
+
+# Statements per request, background and scoring-pool work included. The
+# authenticated user comes from the principal cache (primed by a first /me
+# call) and costs no statement.
+BUDGETS = {
+    # resume lookup + resume insert (first use), session insert + first turn
+    "POST /api/interviews/live/start": 4,
+    # same resume again: the stored copy is reused
+    "POST /api/interviews/live/start (known resume)": 3,
+    # served from the active-session cache: the turn-index claim (one
+    # counter UPDATE) and the evaluation insert (on the scoring pool)
+    "POST /api/interviews/live/{id}/submit": 2,
+    # write-behind flush (question index update, one multi-row turn insert),
+    # session load, end update
+    "POST /api/interviews/live/{id}/end": 4,
+    # owner check and evaluations in one joined query
+    "GET /api/interviews/live/{id}/evaluations": 1,
+    # user lookup
+    "POST /api/auth/login": 1,
+    # the full user row (by primary key)
+    "GET /api/auth/me": 1,
+    # session, stored report
+    "GET /api/reports/{id}": 2,
+    # sessions (turn counts live on the session row)
+    "GET /api/analytics/interviews/history": 1,
+    # sessions, stored reports in one IN query
+    "GET /api/analytics/skills/progress": 2,
+    "GET /api/analytics/performance/trends": 2,
+    # the user's skill score rows, cohort means
+    "GET /api/analytics/skills/trends": 2,
+    # one FTS query joined to the sessions (the index's presence is looked up
+    # once per engine)
+    "GET /api/interviews/search": 1,
+    # outside the cache: the turn-index claim, question index update, one
+    # two-row turn insert
+    "crud.interview.append_exchange": 3,
+}
+
+# Pool checkouts per request. The auth lookup and the handler share one
+# session (and connection) unless the handler releases it before a model call.
+CHECKOUT_BUDGETS = {
+    # auth-less: the session's own connection only
+    "POST /api/interviews/live/start": 1,
+    # the turn-index claim and the scoring pool's evaluation insert
+    "POST /api/interviews/live/{id}/submit": 2,
+    # write-behind flush (sync engine) + the request's session
+    "POST /api/interviews/live/{id}/end": 2,
+    "GET /api/interviews/live/{id}/evaluations": 1,
+    "GET /api/auth/me": 1,
+    "GET /api/reports/{id}": 1,
+    "GET /api/analytics/interviews/history": 1,
+    "GET /api/analytics/skills/progress": 1,
+    "GET /api/analytics/performance/trends": 1,
+    "GET /api/analytics/skills/trends": 1,
+    "GET /api/interviews/search": 1,
+    # rejected before any query
+    "GET /api/analytics/interviews/history (no token)": 0,
+    "POST /api/interviews/live/{id}/submit (invalid body)": 0,
+}
+
+# Tables an endpoint must not read from.
+NO_READS = {
+    "POST /api/interviews/live/{id}/submit": ("interview_turns", "interview_sessions"),
+    "GET /api/analytics/interviews/history": ("interview_turns", "users"),
+    "GET /api/interviews/search": ("interview_turns", "users"),
+}
+
+# Endpoints whose statement count must not grow with the user's interviews.
+CONSTANT_IN_SESSIONS = (
+    "GET /api/analytics/interviews/history",
+    "GET /api/analytics/skills/progress",
+    "GET /api/analytics/performance/trends",
+    "GET /api/analytics/skills/trends",
+)
+
+RESUME = "Backend engineer with five years of Python, FastAPI and PostgreSQL experience."
+ANSWER = (
+    "I designed the payments API with idempotency keys because clients retry on timeouts, "
+    "so that duplicate charges were impossible; the result was zero double-charges."
+)
+EMAIL = "budget@example.com"
+PASSWORD = "password123"
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    for router in (auth_router, interviews_router, interviews_live_router, reports_router, analytics_router):
+        app.include_router(router)
+    return app
+
+
+def _interview(client: TestClient, headers: dict[str, str], answers: int = 2) -> int:
+    resp = client.post(
+        "/api/interviews/live/start",
+        json={"resume_text": RESUME, "target_role": "Backend engineer"},
+        headers=headers,
+    )
+    resp.raise_for_status()
+    interview_id = resp.json()["id"]
+    for _ in range(answers):
+        client.post(
+            f"/api/interviews/live/{interview_id}/submit", json={"answer": ANSWER}, headers=headers
+        ).raise_for_status()
+    client.post(f"/api/interviews/live/{interview_id}/end", headers=headers).raise_for_status()
+    # Persist the report (and its skill scores) so analytics reads stored rows.
+    client.get(f"/api/reports/{interview_id}", headers=headers).raise_for_status()
+    return interview_id
+
+
+def _measure_live(client: TestClient, logs: dict[str, QueryLog]) -> int:
+    with count_queries() as log:
+        resp = client.post(
+            "/api/interviews/live/start",
+            json={"resume_text": RESUME, "target_role": "Backend engineer"},
+        )
+    resp.raise_for_status()
+    logs["POST /api/interviews/live/start"] = log
+    interview_id = resp.json()["id"]
+
+    with count_queries() as log:
+        client.post(
+            "/api/interviews/live/start",
+            json={"resume_text": RESUME, "target_role": "Backend engineer"},
+        ).raise_for_status()
+    logs["POST /api/interviews/live/start (known resume)"] = log
+
+    # Measure a later submit so the transcript is non-trivial.
+    for _ in range(3):
+        client.post(f"/api/interviews/live/{interview_id}/submit", json={"answer": ANSWER}).raise_for_status()
+    wait_for_scoring(interview_id)
+    with count_queries() as log:
+        resp = client.post(f"/api/interviews/live/{interview_id}/submit", json={"answer": ANSWER})
+        wait_for_scoring(interview_id)
+    resp.raise_for_status()
+    logs["POST /api/interviews/live/{id}/submit"] = log
+
+    with count_queries() as log:
+        resp = client.post(f"/api/interviews/live/{interview_id}/submit", json={})
+    if resp.status_code != 422:
+        print(f"expected 422 for a submit without an answer, got {resp.status_code}")
+        return 1
+    logs["POST /api/interviews/live/{id}/submit (invalid body)"] = log
+
+    with count_queries() as log:
+        resp = client.post(f"/api/interviews/live/{interview_id}/end")
+    resp.raise_for_status()
+    logs["POST /api/interviews/live/{id}/end"] = log
+
+    with count_queries() as log:
+        resp = client.get(f"/api/interviews/live/{interview_id}/evaluations")
+    resp.raise_for_status()
+    logs["GET /api/interviews/live/{id}/evaluations"] = log
+    if len(resp.json()["evaluations"]) != 4:
+        print(f"expected 4 stored evaluations, got {resp.json()}")
+        return 1
+    return 0
+
+
+def _measure_user(
+    client: TestClient,
+    logs: dict[str, QueryLog],
+    growth: dict[str, tuple[int, int]],
+) -> int:
+    client.post("/api/auth/signup", json={"email": EMAIL, "password": PASSWORD}).raise_for_status()
+    with count_queries() as log:
+        resp = client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    resp.raise_for_status()
+    logs["POST /api/auth/login"] = log
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+    client.get("/api/auth/me", headers=headers).raise_for_status()
+    with count_queries() as log:
+        client.get("/api/auth/me", headers=headers).raise_for_status()
+    logs["GET /api/auth/me"] = log
+
+    with count_queries() as log:
+        resp = client.get("/api/analytics/interviews/history")
+    if resp.status_code != 401:
+        print(f"expected 401 for history without a token, got {resp.status_code}")
+        return 1
+    logs["GET /api/analytics/interviews/history (no token)"] = log
+
+    interview_id = _interview(client, headers)
+    with count_queries() as log:
+        client.get(f"/api/reports/{interview_id}", headers=headers).raise_for_status()
+    logs["GET /api/reports/{id}"] = log
+
+    def analytics() -> dict[str, QueryLog]:
+        found = {}
+        for endpoint in CONSTANT_IN_SESSIONS:
+            path = endpoint.split(" ", 1)[1]
+            with count_queries() as log:
+                client.get(path, headers=headers).raise_for_status()
+            found[endpoint] = log
+        return found
+
+    few = analytics()
+    for _ in range(3):
+        _interview(client, headers)
+    many = analytics()
+    for endpoint in CONSTANT_IN_SESSIONS:
+        logs[endpoint] = many[endpoint]
+        growth[endpoint] = (few[endpoint].count, many[endpoint].count)
+
+    client.get("/api/interviews/search", params={"q": "idempotency"}, headers=headers).raise_for_status()
+    with count_queries() as log:
+        resp = client.get("/api/interviews/search", params={"q": "idempotent keys"}, headers=headers)
+    resp.raise_for_status()
+    if engine.dialect.name == "sqlite" and not resp.json()["items"]:
+        print(f"expected search hits for the stored answers, got {resp.json()}")
+        return 1
+    logs["GET /api/interviews/search"] = log
+    return 0
+
+
+# -- Query plans ---------------------------------------------------------------
+
+# Hot queries that must be answered from an index, never a scan.
+PLAN_CHECKS: dict[str, Callable[[Session, dict[str, int]], object]] = {
+    "crud.interview.list_turns": lambda db, ids: crud_interview.list_turns(db, ids["session"]),
+    "crud.interview.list_recent_turns": lambda db, ids: crud_interview.list_recent_turns(db, ids["session"], 12),
+    "crud.interview.list_turns_after": lambda db, ids: crud_interview.list_turns_after(db, ids["session"], 1),
+    "crud.interview.list_sessions_for_user": (
+        lambda db, ids: crud_interview.list_sessions_for_user(db, ids["user"])
+    ),
+    "crud.interview.list_turn_evaluations": (
+        lambda db, ids: crud_interview.list_turn_evaluations(db, ids["session"])
+    ),
+    "crud.interview.list_idle_sessions": lambda db, ids: crud_interview.list_idle_sessions(
+        db, idle_since=datetime.utcnow() - timedelta(minutes=30), limit=100, after=(datetime(2000, 1, 1), 1)
+    ),
+    "crud.interview.list_archivable_session_ids": lambda db, ids: crud_interview.list_archivable_session_ids(
+        db, ended_before=datetime.utcnow() - timedelta(days=30), limit=100
+    ),
+    "crud.user.get_user_by_email": lambda db, ids: get_user_by_email(db, EMAIL),
+    "crud.report.get_reports_for_sessions": (
+        lambda db, ids: crud_report.get_reports_for_sessions(db, [ids["session"]])
+    ),
+    "crud.report.list_skill_score_rows": (
+        lambda db, ids: crud_report.list_skill_score_rows(db, user_id=ids["user"])
+    ),
+    "crud.report.list_cohort_skill_means": lambda db, ids: crud_report.list_cohort_skill_means(db),
+    "crud.resume.get_or_create_resume_text": lambda db, ids: crud_resume.get_or_create_resume_text(db, RESUME),
+    "crud.interview.search_turns": lambda db, ids: crud_interview.search_turns(
+        db, user_id=ids["user"], query="idempotent keys", limit=20
+    ),
+}
+
+
+def _scans(statement: str, parameters) -> list[str]:
+    """
+    The scan steps of a statement's query plan, and GROUP BYs that sort.
+    """
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    # Rows are (id, parent, notused, detail); "SCAN t" / "SCAN t USING
+    # [COVERING] INDEX" read the whole table or index. An FTS5 table shows
+    # as "SCAN t VIRTUAL TABLE INDEX n:<plan>" even when answered from its
+    # inverted index, and the schema catalog is always scanned. "USE TEMP
+    # B-TREE FOR GROUP BY" means every matching row was visited and sorted
+    # rather than read in group order from an index.
+    return [
+        row[-1]
+        for row in plan
+        if (row[-1].startswith("SCAN ") and "VIRTUAL TABLE INDEX" not in row[-1] and row[-1] != "SCAN sqlite_master")
+        or row[-1] == "USE TEMP B-TREE FOR GROUP BY"
+    ]
+
+
+def _check_plans() -> bool:
+    if engine.dialect.name != "sqlite":
+        print("query plans: skipped (SQLite only)")
+        return True
+
+    db = SessionLocal()
+    try:
+        user = get_user_by_email(db, EMAIL)
+        session = crud_interview.list_sessions_for_user(db, user.id)[-1]
+        ids = {"user": user.id, "session": session.id}
+        ok = True
+        for name, run in PLAN_CHECKS.items():
+            with count_queries(engine) as log:
+                run(db, ids)
+            db.rollback()
+            scans = [
+                scan
+                for stmt, params in zip(log.statements, log.parameters)
+                if stmt.lstrip().upper().startswith("SELECT")
+                for scan in _scans(stmt, params)
+            ]
+            ok = ok and not scans
+            print(f"{name:<50} {'SCAN: ' + '; '.join(scans) if scans else 'ok'}")
+        return ok
+    finally:
+        db.close()
+
+
+def _measure_crud(logs: dict[str, QueryLog]) -> int:
+    db = SessionLocal()
+    try:
+        session = crud_interview.create_session(
+            db,
+            user_id=None,
+            resume_text=RESUME,
+            target_role="Backend engineer",
+            difficulty="medium",
+            personality_mode="friendly",
+            first_question="Tell me about a system you built.",
+        )
+        with count_queries() as log:
+            first = crud_interview.append_exchange(
+                db, session, answer=ANSWER, question="What would you change?", question_index=1
+            )
+        logs["crud.interview.append_exchange"] = log
+        turns = [(turn.turn_index, turn.role) for turn in crud_interview.list_turns(db, session.id)]
+        expected = [(0, "assistant"), (1, "user"), (2, "assistant")]
+        if first != 1 or turns != expected or session.turn_count != 3:
+            print(f"append_exchange wrote {turns} (first index {first}, counter {session.turn_count})")
+            return 1
+        return 0
+    finally:
+        db.close()
+
+
+def main() -> int:
+    init_db()
+    client = TestClient(_build_app())
+
+    logs: dict[str, QueryLog] = {}
+    growth: dict[str, tuple[int, int]] = {}
+
+    if _measure_live(client, logs) or _measure_user(client, logs, growth) or _measure_crud(logs):
+        return 1
+
+    failed = False
+    for endpoint, budget in BUDGETS.items():
+        count = logs[endpoint].count
+        status = "ok" if count <= budget else "OVER BUDGET"
+        failed = failed or count > budget
+        print(f"{endpoint:<50} {count:3d} / {budget:3d}  {status}")
+
+    print()
+    for endpoint, budget in CHECKOUT_BUDGETS.items():
+        checkouts = logs[endpoint].checkouts
+        status = "ok" if checkouts <= budget else "OVER BUDGET"
+        failed = failed or checkouts > budget
+        print(f"{endpoint:<54} {checkouts:2d} / {budget:2d} checkouts  {status}")
+
+    for endpoint, tables in NO_READS.items():
+        for stmt in logs[endpoint].statements:
+            normalized = " ".join(stmt.split())
+            for table in tables:
+                if normalized.startswith("SELECT") and f"FROM {table}" in normalized:
+                    failed = True
+                    print(f"{endpoint}: unexpected read from {table}: {normalized[:80]}...")
+
+    for endpoint, (few, many) in growth.items():
+        if many > few:
+            failed = True
+            print(f"{endpoint}: {few} statements for 1 interview, {many} for 4 (N+1)")
+
+    print()
+    failed = not _check_plans() or failed
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())